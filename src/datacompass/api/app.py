@@ -26,6 +26,9 @@ def create_app() -> FastAPI:
     Returns:
         Configured FastAPI application instance.
     """
+    # Keep the default response class: routes that declare a response_model
+    # are then serialized straight to JSON bytes by pydantic-core. A custom
+    # class such as ORJSONResponse would force a model -> dict -> JSON detour.
     app = FastAPI(
         title="Data Compass API",
         description="Metadata catalog with data quality monitoring and lineage visualization",
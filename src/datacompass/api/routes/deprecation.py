@@ -3,6 +3,7 @@
 from datetime import date
 
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 
 from datacompass.api.dependencies import DeprecationServiceDep
 from datacompass.core.models.deprecation import (
@@ -203,6 +204,28 @@ async def get_campaign_impact(
     return deprecation_service.check_impact(campaign_id, depth=depth)
 
 
+@router.get("/campaigns/{campaign_id}/impact/stream")
+async def stream_campaign_impact(
+    campaign_id: int,
+    deprecation_service: DeprecationServiceDep,
+    depth: int = Query(3, ge=1, le=10, description="Maximum traversal depth"),
+) -> StreamingResponse:
+    """Stream impact analysis for a campaign as NDJSON.
+
+    Emits one DeprecationImpact object per line as each deprecated
+    object's lineage is traversed, instead of building the full
+    CampaignImpactSummary in memory. Intended for large campaigns.
+
+    Raises:
+        404: If campaign not found.
+    """
+    impacts = deprecation_service.iter_impacts(campaign_id, depth=depth)
+    return StreamingResponse(
+        (impact.model_dump_json() + "\n" for impact in impacts),
+        media_type="application/x-ndjson",
+    )
+
+
 # =============================================================================
 # Hub
 # =============================================================================
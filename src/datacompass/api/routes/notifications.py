@@ -108,9 +108,10 @@ class ChannelTestResult(BaseModel):
 def test_channel(
     service: NotificationServiceDep,
     channel_id: int,
+    deep: bool = Query(True, description="Log in or send a test message, not just connect"),
 ) -> ChannelTestResult:
     """Test a notification channel connection."""
-    result = service.test_channel(channel_id)
+    result = service.test_channel(channel_id, deep=deep)
     return ChannelTestResult(
         success=result.success,
         error_message=result.error_message,
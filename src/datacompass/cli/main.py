@@ -1232,6 +1232,35 @@ def dq_history(
     err_console.print("[yellow]History view coming soon - use 'dq breaches list' to see breaches.[/yellow]")
 
 
+@dq_app.command("prune")
+def dq_prune(
+    days: Annotated[
+        int, typer.Option("--days", "-d", help="Days of results to keep.")
+    ] = 365,
+    format: Annotated[
+        OutputFormat, typer.Option("--format", "-f", help="Output format.")
+    ] = OutputFormat.json,
+) -> None:
+    """Delete DQ results older than the retention window.
+
+    Results attached to a breach are always kept.
+
+    Examples:
+        datacompass dq prune
+        datacompass dq prune --days 180
+    """
+    try:
+        with get_session() as session:
+            service = DQService(session)
+            deleted = service.prune_results(retain_days=days)
+            session.commit()
+            output_result({"deleted": deleted, "retain_days": days}, format)
+
+    except Exception as e:
+        code = handle_error(e)
+        raise typer.Exit(code) from None
+
+
 @dq_breaches_app.command("list")
 def dq_breaches_list(
     status: Annotated[
@@ -1411,9 +1440,9 @@ def dq_breaches_show(
                 if breach.lifecycle_events:
                     console.print("\n[bold]Lifecycle Events:[/bold]")
                     for event in breach.lifecycle_events:
-                        console.print(f"  - {event.get('at', '?')}: {event.get('status', '?')} by {event.get('by', '?')}")
-                        if event.get("notes"):
-                            console.print(f"    Notes: {event['notes']}")
+                        console.print(f"  - {event.at}: {event.status} by {event.by}")
+                        if event.notes:
+                            console.print(f"    Notes: {event.notes}")
             else:
                 output_result(breach.model_dump(), format)
 
@@ -2264,6 +2293,64 @@ def schedule_run(
         raise typer.Exit(code) from None
 
 
+@schedule_app.command("run-due")
+def schedule_run_due(
+    job_type: Annotated[
+        str | None, typer.Option("--job-type", "-t", help="Only run this job type.")
+    ] = None,
+    format: Annotated[
+        OutputFormat, typer.Option("--format", "-f", help="Output format.")
+    ] = OutputFormat.json,
+) -> None:
+    """Run every enabled schedule whose next run time has passed.
+
+    Use this from cron or a systemd timer when the scheduler daemon is not
+    running, or to catch up on runs missed while it was down.
+
+    Examples:
+        datacompass schedule run-due
+        datacompass schedule run-due --job-type scan
+    """
+    try:
+        from datacompass.core.scheduler.jobs import run_due_jobs
+
+        schedule_ids = run_due_jobs(job_type=job_type)
+        output_result({"executed": len(schedule_ids), "schedule_ids": schedule_ids}, format)
+
+    except Exception as e:
+        code = handle_error(e)
+        raise typer.Exit(code) from None
+
+
+@schedule_app.command("prune")
+def schedule_prune(
+    days: Annotated[
+        int, typer.Option("--days", "-d", help="Days of run history to keep.")
+    ] = 90,
+    format: Annotated[
+        OutputFormat, typer.Option("--format", "-f", help="Output format.")
+    ] = OutputFormat.json,
+) -> None:
+    """Delete schedule runs older than the retention window.
+
+    Each schedule's last run time and status are kept.
+
+    Examples:
+        datacompass schedule prune
+        datacompass schedule prune --days 30
+    """
+    try:
+        with get_session() as session:
+            service = SchedulingService(session)
+            deleted = service.prune_runs(retain_days=days)
+            session.commit()
+            output_result({"deleted": deleted, "retain_days": days}, format)
+
+    except Exception as e:
+        code = handle_error(e)
+        raise typer.Exit(code) from None
+
+
 @schedule_app.command("apply")
 def schedule_apply(
     config_file: Annotated[
@@ -2490,6 +2577,9 @@ def notify_channel_create(
 @notify_channel_app.command("test")
 def notify_channel_test(
     channel_id: Annotated[int, typer.Argument(help="Channel ID.")],
+    quick: Annotated[
+        bool, typer.Option("--quick", help="Only check that the host is reachable.")
+    ] = False,
     format: Annotated[
         OutputFormat, typer.Option("--format", "-f", help="Output format.")
     ] = OutputFormat.json,
@@ -2498,11 +2588,12 @@ def notify_channel_test(
 
     Examples:
         datacompass notify channel test 1
+        datacompass notify channel test 1 --quick
     """
     try:
         with get_session() as session:
             service = NotificationService(session)
-            result = service.test_channel(channel_id)
+            result = service.test_channel(channel_id, deep=not quick)
 
             output = {
                 "channel_id": channel_id,
@@ -2782,6 +2873,33 @@ def notify_log(
         raise typer.Exit(code) from None
 
 
+@notify_app.command("prune")
+def notify_prune(
+    days: Annotated[
+        int, typer.Option("--days", "-d", help="Days of log entries to keep.")
+    ] = 90,
+    format: Annotated[
+        OutputFormat, typer.Option("--format", "-f", help="Output format.")
+    ] = OutputFormat.json,
+) -> None:
+    """Delete notification log entries older than the retention window.
+
+    Examples:
+        datacompass notify prune
+        datacompass notify prune --days 30
+    """
+    try:
+        with get_session() as session:
+            service = NotificationService(session)
+            deleted = service.prune_log(retain_days=days)
+            session.commit()
+            output_result({"deleted": deleted, "retain_days": days}, format)
+
+    except Exception as e:
+        code = handle_error(e)
+        raise typer.Exit(code) from None
+
+
 @notify_app.command("apply")
 def notify_apply(
     config_file: Annotated[
@@ -3262,6 +3380,38 @@ def auth_apikey_revoke(
         raise typer.Exit(code) from None
 
 
+@auth_app.command("purge")
+def auth_purge(
+    format: Annotated[
+        OutputFormat, typer.Option("--format", "-f", help="Output format.")
+    ] = OutputFormat.json,
+) -> None:
+    """Delete expired sessions and credentials of disabled users.
+
+    Run periodically, e.g. from cron. Expired sessions are found by a scan
+    of the sessions table, which this keeps small, and disabled users'
+    sessions and refresh tokens are left behind by
+    'auth user disable --defer-purge'.
+
+    Examples:
+        datacompass auth purge
+    """
+    try:
+        with get_session() as session:
+            auth_service = AuthService(session)
+            expired = auth_service.purge_expired_sessions()
+            credentials = auth_service.purge_inactive_user_credentials()
+            session.commit()
+            output_result(
+                {"expired_sessions": expired, "inactive_user_credentials": credentials},
+                format,
+            )
+
+    except Exception as e:
+        code = handle_error(e)
+        raise typer.Exit(code) from None
+
+
 # =============================================================================
 # Auth User commands (admin)
 # =============================================================================
@@ -3432,24 +3582,42 @@ def auth_user_show(
 @auth_user_app.command("disable")
 def auth_user_disable(
     email: Annotated[str, typer.Argument(help="User email address.")],
+    defer_purge: Annotated[
+        bool,
+        typer.Option(
+            "--defer-purge",
+            help="Leave sessions and tokens for 'auth purge' to delete later.",
+        ),
+    ] = False,
     format: Annotated[
         OutputFormat, typer.Option("--format", "-f", help="Output format.")
     ] = OutputFormat.json,
 ) -> None:
     """Disable a user account.
 
+    The user's sessions and refresh tokens stop working either way. With
+    --defer-purge they are deleted by the next 'auth purge' instead of
+    immediately, which keeps mass deactivations cheap.
+
     Examples:
         datacompass auth user disable user@example.com
+        datacompass auth user disable user@example.com --defer-purge
     """
     try:
         with get_session() as session:
             auth_service = AuthService(session)
-            user = auth_service.disable_user(email)
+            if defer_purge:
+                user = auth_service.deactivate_and_schedule_purge(email)
+            else:
+                user = auth_service.disable_user(email)
             session.commit()
 
             if format == OutputFormat.table:
                 console.print(f"[green]User disabled:[/green] {email}")
-                console.print("[dim]All sessions and tokens have been invalidated.[/dim]")
+                if defer_purge:
+                    console.print("[dim]Sessions and tokens will be deleted by 'auth purge'.[/dim]")
+                else:
+                    console.print("[dim]All sessions and tokens have been invalidated.[/dim]")
             else:
                 output_result({"success": True, "email": email, "message": "User disabled"}, format)
 
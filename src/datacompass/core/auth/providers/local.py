@@ -1,5 +1,6 @@
 """Local password authentication provider."""
 
+import secrets
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -241,6 +242,8 @@ class LocalAuthProvider(AuthProvider):
             "type": "refresh",
             "exp": expire,
             "iat": datetime.utcnow(),
+            # Unique per token so two issued in the same second never share a hash
+            "jti": secrets.token_urlsafe(16),
         }
 
         token = jwt.encode(
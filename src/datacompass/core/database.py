@@ -1,14 +1,38 @@
 """Database engine and session management."""
 
+import json
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import partial
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from datacompass.config import get_settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# JSON columns (breach lifecycle events, threshold snapshots, ...) are
+# written without the default ", " / ": " padding to keep payloads small.
+# orjson, when installed (the "speedups" extra), produces the same compact
+# text and decodes notification logs and run summaries faster than json.
+if orjson is not None:
+
+    def _json_serializer(value: object) -> str:
+        # NON_STR_KEYS matches json.dumps, which stringifies int keys
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_deserializer = orjson.loads
+else:
+    _json_serializer = partial(json.dumps, separators=(",", ":"))
+    _json_deserializer = json.loads
+
 
 def get_database_url() -> str:
     """Get the database URL, creating data directory if needed."""
@@ -35,16 +59,42 @@ def create_database_engine(database_url: str | None = None, echo: bool = False)
             url,
             echo=echo,
             connect_args={"check_same_thread": False},
+            json_serializer=_json_serializer,
+            json_deserializer=_json_deserializer,
         )
         # Enable foreign keys for SQLite
         @event.listens_for(engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
             cursor = dbapi_connection.cursor()
             cursor.execute("PRAGMA foreign_keys=ON")
+            # Some builds default to zero-filling deleted content, which makes
+            # FTS segment merges rewrite every freed page
+            cursor.execute("PRAGMA secure_delete=OFF")
+            cursor.close()
+
+        # Refresh planner statistics for tables that changed significantly
+        @event.listens_for(engine, "close")
+        def optimize_sqlite(
+            dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry
+        ) -> None:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA optimize")
             cursor.close()
     else:
         # PostgreSQL or other databases
-        engine = create_engine(url, echo=echo, pool_pre_ping=True)
+        connect_args: dict[str, str] = {}
+        if url.startswith("postgresql"):
+            # The application writes naive UTC datetimes; pin the session zone
+            # so TIMESTAMPTZ columns read them as UTC whatever the server default.
+            connect_args["options"] = "-c timezone=utc"
+        engine = create_engine(
+            url,
+            echo=echo,
+            pool_pre_ping=True,
+            connect_args=connect_args,
+            json_serializer=_json_serializer,
+            json_deserializer=_json_deserializer,
+        )
 
     return engine
 
@@ -140,6 +190,73 @@ def init_database(engine: Engine | None = None) -> None:
         conn.commit()
 
 
+def find_redundant_indexes(engine: Engine | None = None) -> list[tuple[str, str, str]]:
+    """Find non-unique indexes whose columns are a prefix of another key.
+
+    UNIQUE constraints are backed by an index (``sqlite_autoindex_*`` on
+    SQLite), and the planner can use any leading prefix of an index for
+    lookups, so a separate index on that prefix only adds write cost.
+    Partial indexes are ignored on both sides: they hold a subset of rows,
+    so they neither duplicate nor substitute for a full index. Expression
+    columns are reported with a ``None`` name; an index containing one is
+    never flagged itself, and only its leading plain columns count as a
+    covering key. Of two identical non-unique indexes only the one whose
+    name sorts later is reported, so dropping every reported index never
+    removes both.
+
+    Args:
+        engine: SQLAlchemy engine. Uses the default engine if not provided.
+
+    Returns:
+        List of (table, redundant index, covering key) tuples.
+    """
+    if engine is None:
+        engine = get_engine()
+    inspector = inspect(engine)
+
+    redundant: list[tuple[str, str, str]] = []
+    for table_name in inspector.get_table_names():
+        keys: list[tuple[str, list[str]]] = []
+        # Non-unique indexes on plain columns only; these are the candidates
+        candidates: list[tuple[str, list[str]]] = []
+        for index in inspector.get_indexes(table_name):
+            if index["name"] is None or any(
+                option.endswith("_where") and value is not None
+                for option, value in index.get("dialect_options", {}).items()
+            ):
+                continue
+            columns: list[str] = []
+            for column in index["column_names"]:
+                if column is None:
+                    break
+                columns.append(column)
+            keys.append((index["name"], columns))
+            if not index["unique"] and len(columns) == len(index["column_names"]):
+                candidates.append((index["name"], columns))
+        for constraint in inspector.get_unique_constraints(table_name):
+            columns = list(constraint["column_names"])
+            keys.append((constraint["name"] or f"UNIQUE({', '.join(columns)})", columns))
+        primary_key = inspector.get_pk_constraint(table_name)["constrained_columns"]
+        if primary_key:
+            keys.append(("PRIMARY KEY", list(primary_key)))
+
+        candidate_names = {name for name, _ in candidates}
+        # Prefer longer keys, then constraints over plain indexes, as the cover
+        keys.sort(key=lambda key: (-len(key[1]), key[0] in candidate_names))
+        for name, columns in candidates:
+            for key_name, key_columns in keys:
+                if key_name == name or len(key_columns) < len(columns):
+                    continue
+                if key_columns == columns and key_name in candidate_names and key_name > name:
+                    # An identical twin; the later name is the one reported
+                    continue
+                if key_columns[: len(columns)] == columns:
+                    redundant.append((table_name, name, key_name))
+                    break
+
+    return redundant
+
+
 def reset_engine() -> None:
     """Reset the global engine and session factory.
 
@@ -269,8 +269,9 @@ class ScheduleRunCompletedEvent(Event):
 # Event Bus
 # =============================================================================
 
-# Type alias for event handlers
+# Type aliases for event handlers
 EventHandler = Callable[[Event], None]
+BatchEventHandler = Callable[[list[Event]], None]
 
 
 class EventBus:
@@ -279,6 +280,10 @@ class EventBus:
     Supports subscribing handlers to event types and emitting events.
     Handlers are called synchronously in the order they were registered.
 
+    Producers that raise several events at once, such as a DQ run with
+    many breaches, pass them to emit_many() so batch handlers can act on
+    them together.
+
     Usage:
         bus = EventBus()
         bus.subscribe("dq_breach", my_handler)
@@ -289,6 +294,7 @@ class EventBus:
         """Initialize the event bus."""
         self._handlers: dict[str, list[EventHandler]] = defaultdict(list)
         self._global_handlers: list[EventHandler] = []
+        self._batch_handlers: list[BatchEventHandler] = []
 
     def subscribe(self, event_type: str, handler: EventHandler) -> None:
         """Subscribe a handler to an event type.
@@ -309,6 +315,18 @@ class EventBus:
         self._global_handlers.append(handler)
         logger.debug("Handler subscribed to all events")
 
+    def subscribe_batches(self, handler: BatchEventHandler) -> None:
+        """Subscribe a handler to all events, delivered as lists.
+
+        Events passed to emit_many() arrive in a single call. Events passed
+        to emit() arrive as one-item lists.
+
+        Args:
+            handler: Callable that takes a list of Events.
+        """
+        self._batch_handlers.append(handler)
+        logger.debug("Batch handler subscribed to all events")
+
     def unsubscribe(self, event_type: str, handler: EventHandler) -> bool:
         """Unsubscribe a handler from an event type.
 
@@ -339,6 +357,20 @@ class EventBus:
             return True
         return False
 
+    def unsubscribe_batches(self, handler: BatchEventHandler) -> bool:
+        """Unsubscribe a batch handler.
+
+        Args:
+            handler: Handler to remove.
+
+        Returns:
+            True if handler was found and removed.
+        """
+        if handler in self._batch_handlers:
+            self._batch_handlers.remove(handler)
+            return True
+        return False
+
     def emit(self, event: Event) -> None:
         """Emit an event to all subscribed handlers.
 
@@ -348,6 +380,31 @@ class EventBus:
         Args:
             event: Event to emit.
         """
+        self.emit_many([event])
+
+    def emit_many(self, events: list[Event]) -> None:
+        """Emit events that were produced together.
+
+        Type-specific and global handlers are called once per event, in
+        order. Batch handlers are called once with the whole list.
+
+        Args:
+            events: Events to emit.
+        """
+        if not events:
+            return
+
+        for event in events:
+            self._dispatch(event)
+
+        for batch_handler in self._batch_handlers:
+            try:
+                batch_handler(events)
+            except Exception as e:
+                logger.exception(f"Error in batch event handler: {e}")
+
+    def _dispatch(self, event: Event) -> None:
+        """Call the per-event handlers for one event."""
         logger.debug(f"Emitting event: {event.event_type}")
 
         # Call type-specific handlers
@@ -368,6 +425,7 @@ class EventBus:
         """Remove all handlers."""
         self._handlers.clear()
         self._global_handlers.clear()
+        self._batch_handlers.clear()
 
 
 # =============================================================================
@@ -0,0 +1,37 @@
+"""Helpers shared by migration scripts."""
+
+import os
+from collections.abc import Sequence
+from typing import Any
+
+from alembic import op
+
+# (index name, table name, columns, extra op.create_index keyword arguments)
+IndexSpec = tuple[str, str, list[str], dict[str, Any]]
+
+
+def create_indexes(indexes: Sequence[IndexSpec]) -> None:
+    """Create indexes, using CREATE INDEX CONCURRENTLY when requested.
+
+    Concurrent builds only apply on PostgreSQL with
+    DATACOMPASS_MIGRATION_CONCURRENT=1; everywhere else the indexes are
+    created in the migration transaction as usual. CREATE INDEX
+    CONCURRENTLY cannot run inside a transaction block, so the migration
+    transaction is committed before the builds start. Call this last in
+    upgrade() so everything before it is committed together.
+
+    Args:
+        indexes: Indexes to create, in order.
+    """
+    concurrent = (
+        op.get_bind().dialect.name == "postgresql"
+        and os.environ.get("DATACOMPASS_MIGRATION_CONCURRENT") == "1"
+    )
+    if not concurrent:
+        for name, table, columns, kwargs in indexes:
+            op.create_index(name, table, columns, **kwargs)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, kwargs in indexes:
+            op.create_index(name, table, columns, postgresql_concurrently=True, **kwargs)
@@ -10,12 +10,38 @@ from collections.abc import Sequence
 import sqlalchemy as sa
 from alembic import op
 
+from datacompass.core.migrations.helpers import IndexSpec, create_indexes
+
 # Revision identifiers, used by Alembic.
 revision: str = "007"
 down_revision: str | None = "006"
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
+# Indexes are created after all four tables so that, with
+# DATACOMPASS_MIGRATION_CONCURRENT=1, they can be built concurrently once the
+# tables are committed. See "Concurrent Index Builds" in docs/architecture.md.
+INDEXES: list[IndexSpec] = [
+    ("ix_users_email", "users", ["email"], {"unique": True}),
+    # Uniqueness only applies when external_provider is set
+    (
+        "ix_users_external_provider_id",
+        "users",
+        ["external_provider", "external_id"],
+        {
+            "unique": True,
+            "postgresql_where": sa.text("external_provider IS NOT NULL"),
+            "sqlite_where": sa.text("external_provider IS NOT NULL"),
+        },
+    ),
+    ("ix_api_keys_user_id", "api_keys", ["user_id"], {}),
+    ("ix_api_keys_key_prefix", "api_keys", ["key_prefix"], {}),
+    ("ix_sessions_user_id", "sessions", ["user_id"], {}),
+    ("ix_sessions_expires_at", "sessions", ["expires_at"], {}),
+    ("ix_refresh_tokens_user_id", "refresh_tokens", ["user_id"], {}),
+    ("ix_refresh_tokens_token_hash", "refresh_tokens", ["token_hash"], {}),
+]
+
 
 def upgrade() -> None:
     # Create users table
@@ -46,24 +72,6 @@ def upgrade() -> None:
         ),
     )
 
-    op.create_index(
-        "ix_users_email",
-        "users",
-        ["email"],
-        unique=True,
-    )
-
-    # Partial unique index for external provider + external ID
-    # This ensures uniqueness only when external_provider is not null
-    op.create_index(
-        "ix_users_external_provider_id",
-        "users",
-        ["external_provider", "external_id"],
-        unique=True,
-        postgresql_where=sa.text("external_provider IS NOT NULL"),
-        sqlite_where=sa.text("external_provider IS NOT NULL"),
-    )
-
     # Create api_keys table
     op.create_table(
         "api_keys",
@@ -89,18 +97,6 @@ def upgrade() -> None:
         ),
     )
 
-    op.create_index(
-        "ix_api_keys_user_id",
-        "api_keys",
-        ["user_id"],
-    )
-
-    op.create_index(
-        "ix_api_keys_key_prefix",
-        "api_keys",
-        ["key_prefix"],
-    )
-
     # Create sessions table
     op.create_table(
         "sessions",
@@ -122,18 +118,6 @@ def upgrade() -> None:
         ),
     )
 
-    op.create_index(
-        "ix_sessions_user_id",
-        "sessions",
-        ["user_id"],
-    )
-
-    op.create_index(
-        "ix_sessions_expires_at",
-        "sessions",
-        ["expires_at"],
-    )
-
     # Create refresh_tokens table
     op.create_table(
         "refresh_tokens",
@@ -160,17 +144,7 @@ def upgrade() -> None:
         ),
     )
 
-    op.create_index(
-        "ix_refresh_tokens_user_id",
-        "refresh_tokens",
-        ["user_id"],
-    )
-
-    op.create_index(
-        "ix_refresh_tokens_token_hash",
-        "refresh_tokens",
-        ["token_hash"],
-    )
+    create_indexes(INDEXES)
 
 
 def downgrade() -> None:
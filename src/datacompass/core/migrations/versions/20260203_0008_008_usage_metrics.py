@@ -10,12 +10,26 @@ from collections.abc import Sequence
 import sqlalchemy as sa
 from alembic import op
 
+from datacompass.core.migrations.helpers import IndexSpec, create_indexes
+
 # Revision identifiers, used by Alembic.
 revision: str = "008"
 down_revision: str | None = "007"
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
+# Created after the table so they can be built concurrently; see 007.
+INDEXES: list[IndexSpec] = [
+    ("ix_usage_metrics_object_id", "usage_metrics", ["object_id"], {}),
+    ("ix_usage_metrics_collected_at", "usage_metrics", ["collected_at"], {}),
+    (
+        "ix_usage_metrics_object_collected",
+        "usage_metrics",
+        ["object_id", "collected_at"],
+        {},
+    ),
+]
+
 
 def upgrade() -> None:
     # Create usage_metrics table
@@ -63,24 +77,7 @@ def upgrade() -> None:
         ),
     )
 
-    # Indexes for efficient querying
-    op.create_index(
-        "ix_usage_metrics_object_id",
-        "usage_metrics",
-        ["object_id"],
-    )
-
-    op.create_index(
-        "ix_usage_metrics_collected_at",
-        "usage_metrics",
-        ["collected_at"],
-    )
-
-    op.create_index(
-        "ix_usage_metrics_object_collected",
-        "usage_metrics",
-        ["object_id", "collected_at"],
-    )
+    create_indexes(INDEXES)
 
 
 def downgrade() -> None:
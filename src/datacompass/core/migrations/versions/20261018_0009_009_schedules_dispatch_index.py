@@ -0,0 +1,44 @@
+"""Replace single-column schedule indexes with a dispatch index.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The dispatcher filters on is_enabled and job_type and ranges over
+    # next_run_at, so a single composite index replaces both lookups
+    op.drop_index("ix_schedules_is_enabled", table_name="schedules")
+    op.drop_index("ix_schedules_job_type", table_name="schedules")
+
+    op.create_index(
+        "ix_schedules_dispatch",
+        "schedules",
+        ["is_enabled", "job_type", "next_run_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedules_dispatch", table_name="schedules")
+
+    op.create_index(
+        "ix_schedules_job_type",
+        "schedules",
+        ["job_type"],
+    )
+    op.create_index(
+        "ix_schedules_is_enabled",
+        "schedules",
+        ["is_enabled"],
+    )
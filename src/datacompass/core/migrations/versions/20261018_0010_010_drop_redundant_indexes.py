@@ -0,0 +1,63 @@
+"""Drop indexes made redundant by unique constraints.
+
+Each index below is a leading-column prefix of a unique constraint on the
+same table. Both SQLite (via its sqlite_autoindex_* B-tree) and PostgreSQL
+can serve equality lookups on that prefix from the unique index, so the
+extra index only adds write cost. See the prefix-matching rules in
+https://www.sqlite.org/queryplanner.html and
+https://www.sqlite.org/optoverview.html#the_where_clause.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+
+def upgrade() -> None:
+    # Covered by uq_catalog_object_natural_key(source_id, schema_name, ...)
+    op.drop_index("ix_catalog_objects_source_schema", table_name="catalog_objects")
+
+    # Covered by uq_dependency_natural_key(object_id, target_id, parsing_source)
+    op.drop_index("ix_dependencies_object_id", table_name="dependencies")
+
+    # Covered by the UNIQUE on dq_configs.object_id
+    op.drop_index("ix_dq_configs_object_id", table_name="dq_configs")
+
+    # Covered by uq_dq_results_expectation_date / uq_dq_breaches_expectation_date
+    op.drop_index("ix_dq_results_expectation_id", table_name="dq_results")
+    op.drop_index("ix_dq_breaches_expectation_id", table_name="dq_breaches")
+
+    # Covered by uq_deprecation_campaigns_source_name(source_id, name)
+    op.drop_index("ix_deprecation_campaigns_source_id", table_name="deprecation_campaigns")
+
+    # Covered by uq_deprecations_campaign_object(campaign_id, object_id)
+    op.drop_index("ix_deprecations_campaign_id", table_name="deprecations")
+
+
+def downgrade() -> None:
+    op.create_index("ix_deprecations_campaign_id", "deprecations", ["campaign_id"])
+    op.create_index(
+        "ix_deprecation_campaigns_source_id",
+        "deprecation_campaigns",
+        ["source_id"],
+    )
+    op.create_index("ix_dq_breaches_expectation_id", "dq_breaches", ["expectation_id"])
+    op.create_index("ix_dq_results_expectation_id", "dq_results", ["expectation_id"])
+    op.create_index("ix_dq_configs_object_id", "dq_configs", ["object_id"])
+    op.create_index("ix_dependencies_object_id", "dependencies", ["object_id"])
+    op.create_index(
+        "ix_catalog_objects_source_schema",
+        "catalog_objects",
+        ["source_id", "schema_name"],
+    )
@@ -0,0 +1,62 @@
+"""Collect planner statistics and seed them for empty lineage tables.
+
+Without sqlite_stat1 rows the SQLite planner falls back to heuristics,
+which can pick a full scan of ``dependencies`` for lineage traversals on a
+freshly migrated database. ANALYZE records real statistics for populated
+tables; for an empty ``dependencies`` table we seed values describing the
+expected production scale so the first lineage queries use the indexes.
+PRAGMA optimize (run on connection close, see core/database.py) replaces
+the seeded values once the table has real data.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: str | None = "010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Expected production scale: ~100k edges, ~10 edges per object, a handful of
+# parsing sources per (object, target) pair, ~5 data sources.
+DEPENDENCIES_STATS = [
+    ("dependencies", None, "100000"),
+    ("dependencies", "sqlite_autoindex_dependencies_1", "100000 10 2 1"),
+    ("dependencies", "ix_dependencies_source_id", "100000 20000"),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+
+    op.execute("ANALYZE")
+
+    has_stats = bind.execute(
+        sa.text("SELECT 1 FROM sqlite_stat1 WHERE tbl = 'dependencies'")
+    ).first()
+    if has_stats is None:
+        for tbl, idx, stat in DEPENDENCIES_STATS:
+            bind.execute(
+                sa.text("INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES (:tbl, :idx, :stat)"),
+                {"tbl": tbl, "idx": idx, "stat": stat},
+            )
+
+    # Make the seeded statistics visible to the planner immediately
+    op.execute("ANALYZE sqlite_master")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+
+    op.execute("DELETE FROM sqlite_stat1")
@@ -0,0 +1,111 @@
+"""Partition usage_metrics by month on PostgreSQL.
+
+usage_metrics gains one row per object per collection and is only ever
+queried by collected_at range, so on PostgreSQL it becomes a
+``PARTITION BY RANGE (collected_at)`` table with one partition per month.
+Range scans touch only the matching partitions, indexes are local to each
+partition, and retention is a ``DROP TABLE`` of an old partition.
+
+Partitions are pre-created through PARTITION_HORIZON_MONTHS months after
+the migration runs; a DEFAULT partition catches anything outside that
+range. Create further months ahead of time (pg_partman, or a scheduled
+``CREATE TABLE usage_metrics_YYYY_MM PARTITION OF usage_metrics ...``)
+before rows for them arrive in the DEFAULT partition.
+
+SQLite keeps the single table.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: str | None = "011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# First month with usage data (migration 008)
+PARTITION_START = date(2026, 2, 1)
+PARTITION_HORIZON_MONTHS = 12
+
+USAGE_INDEXES = {
+    "ix_usage_metrics_object_id": "(object_id)",
+    "ix_usage_metrics_collected_at": "(collected_at)",
+    "ix_usage_metrics_object_collected": "(object_id, collected_at)",
+}
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.month - 1 + months
+    return date(value.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE usage_metrics RENAME TO usage_metrics_unpartitioned")
+    op.execute("ALTER SEQUENCE usage_metrics_id_seq OWNED BY NONE")
+    for index_name in USAGE_INDEXES:
+        op.execute(f"DROP INDEX {index_name}")
+
+    op.execute(
+        """
+        CREATE TABLE usage_metrics (
+            LIKE usage_metrics_unpartitioned INCLUDING DEFAULTS,
+            PRIMARY KEY (id, collected_at),
+            FOREIGN KEY (object_id) REFERENCES catalog_objects (id) ON DELETE CASCADE
+        ) PARTITION BY RANGE (collected_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE usage_metrics_id_seq OWNED BY usage_metrics.id")
+
+    start = PARTITION_START
+    end = _add_months(date.today().replace(day=1), PARTITION_HORIZON_MONTHS)
+    while start < end:
+        next_start = _add_months(start, 1)
+        op.execute(
+            f"CREATE TABLE usage_metrics_{start:%Y_%m} PARTITION OF usage_metrics "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{next_start.isoformat()}')"
+        )
+        start = next_start
+    op.execute("CREATE TABLE usage_metrics_default PARTITION OF usage_metrics DEFAULT")
+
+    # Indexes on the parent are created locally on every partition
+    for index_name, columns in USAGE_INDEXES.items():
+        op.execute(f"CREATE INDEX {index_name} ON usage_metrics {columns}")
+
+    op.execute("INSERT INTO usage_metrics SELECT * FROM usage_metrics_unpartitioned")
+    op.execute("DROP TABLE usage_metrics_unpartitioned")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE usage_metrics RENAME TO usage_metrics_partitioned")
+    op.execute("ALTER SEQUENCE usage_metrics_id_seq OWNED BY NONE")
+    for index_name in USAGE_INDEXES:
+        op.execute(f"DROP INDEX {index_name}")
+
+    op.execute(
+        """
+        CREATE TABLE usage_metrics (
+            LIKE usage_metrics_partitioned INCLUDING DEFAULTS,
+            PRIMARY KEY (id),
+            FOREIGN KEY (object_id) REFERENCES catalog_objects (id) ON DELETE CASCADE
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE usage_metrics_id_seq OWNED BY usage_metrics.id")
+    for index_name, columns in USAGE_INDEXES.items():
+        op.execute(f"CREATE INDEX {index_name} ON usage_metrics {columns}")
+
+    op.execute("INSERT INTO usage_metrics SELECT * FROM usage_metrics_partitioned")
+    op.execute("DROP TABLE usage_metrics_partitioned")
@@ -0,0 +1,33 @@
+"""Drop ix_usage_metrics_object_id.
+
+ix_usage_metrics_object_collected on (object_id, collected_at) serves both
+``WHERE object_id = ?`` and ``WHERE object_id = ? AND collected_at BETWEEN
+...`` through leftmost-prefix matching, so the single-column index only
+adds write cost to every metrics insert.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: str | None = "012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_usage_metrics_object_id", table_name="usage_metrics")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_usage_metrics_object_id",
+        "usage_metrics",
+        ["object_id"],
+    )
@@ -0,0 +1,58 @@
+"""Widen usage_metrics counters to BIGINT.
+
+size_bytes passes 2 GiB for ordinary tables and read/query counters on busy
+objects pass 2^31, which overflows a 32-bit INTEGER on PostgreSQL. SQLite
+INTEGER is already 64-bit, so the table is left alone there.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: str | None = "013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COUNTER_COLUMNS = [
+    "row_count",
+    "size_bytes",
+    "read_count",
+    "write_count",
+    "distinct_users",
+    "query_count",
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    for column_name in COUNTER_COLUMNS:
+        op.alter_column(
+            "usage_metrics",
+            column_name,
+            type_=sa.BigInteger(),
+            existing_type=sa.Integer(),
+            existing_nullable=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    for column_name in COUNTER_COLUMNS:
+        op.alter_column(
+            "usage_metrics",
+            column_name,
+            type_=sa.Integer(),
+            existing_type=sa.BigInteger(),
+            existing_nullable=True,
+        )
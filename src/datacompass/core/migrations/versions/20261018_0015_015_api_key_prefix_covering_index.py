@@ -0,0 +1,47 @@
+"""Make ix_api_keys_key_prefix a covering index on PostgreSQL.
+
+API key authentication looks up by key_prefix and then reads key_hash,
+user_id, is_active and expires_at. Including those columns lets PostgreSQL
+serve the lookup as ``Index Only Scan using ix_api_keys_key_prefix``
+(visible in ``EXPLAIN (ANALYZE, BUFFERS)``) instead of an index probe plus
+a heap fetch. SQLite has no INCLUDE clause and keeps the plain index.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: str | None = "014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_api_keys_key_prefix", table_name="api_keys")
+    op.create_index(
+        "ix_api_keys_key_prefix",
+        "api_keys",
+        ["key_prefix"],
+        postgresql_include=["key_hash", "user_id", "is_active", "expires_at"],
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_api_keys_key_prefix", table_name="api_keys")
+    op.create_index(
+        "ix_api_keys_key_prefix",
+        "api_keys",
+        ["key_prefix"],
+    )
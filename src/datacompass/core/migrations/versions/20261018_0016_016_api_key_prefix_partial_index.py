@@ -0,0 +1,44 @@
+"""Restrict ix_api_keys_key_prefix to active keys.
+
+Revoked keys accumulate but are never used to authenticate. Indexing only
+``is_active`` rows keeps the index small and hot. Expiry is not part of
+the predicate because now() is not immutable; expired keys are filtered
+by the lookup query instead.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "016"
+down_revision: str | None = "015"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_api_keys_key_prefix", table_name="api_keys")
+    op.create_index(
+        "ix_api_keys_key_prefix",
+        "api_keys",
+        ["key_prefix"],
+        postgresql_include=["key_hash", "user_id", "is_active", "expires_at"],
+        postgresql_where=sa.text("is_active"),
+        sqlite_where=sa.text("is_active = 1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_keys_key_prefix", table_name="api_keys")
+    op.create_index(
+        "ix_api_keys_key_prefix",
+        "api_keys",
+        ["key_prefix"],
+        postgresql_include=["key_hash", "user_id", "is_active", "expires_at"],
+    )
@@ -0,0 +1,35 @@
+"""Drop ix_sessions_expires_at.
+
+Session lookups go through the primary key and per-user listings through
+ix_sessions_user_id; expires_at is only a residual filter on those. The
+remaining consumer is the expired-session purge (``datacompass auth
+purge``), which scans a table kept small by that same purge, so the index costs a write per login without
+serving a read. A partial ``WHERE expires_at > now()`` index is not
+possible because the predicate must be immutable.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "017"
+down_revision: str | None = "016"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_sessions_expires_at", table_name="sessions")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_sessions_expires_at",
+        "sessions",
+        ["expires_at"],
+    )
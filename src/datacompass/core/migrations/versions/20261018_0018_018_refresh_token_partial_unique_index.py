@@ -0,0 +1,66 @@
+"""Make ix_refresh_tokens_token_hash a partial unique index.
+
+Only tokens with ``replaced_by IS NULL`` can be exchanged, and after
+rotation those are a small fraction of the table. Restricting the index to
+them keeps the refresh lookup on a compact B-tree and enforces that no two
+live tokens share a hash (same pattern as ix_users_external_provider_id).
+
+Refresh tokens issued before the jti claim was added could collide when
+created in the same second; older live duplicates are marked as replaced
+by the newest copy before the unique index is built.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "018"
+down_revision: str | None = "017"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE refresh_tokens
+        SET replaced_by = (
+            SELECT MAX(newer.id)
+            FROM refresh_tokens AS newer
+            WHERE newer.token_hash = refresh_tokens.token_hash
+              AND newer.replaced_by IS NULL
+        )
+        WHERE replaced_by IS NULL
+          AND id < (
+            SELECT MAX(newer.id)
+            FROM refresh_tokens AS newer
+            WHERE newer.token_hash = refresh_tokens.token_hash
+              AND newer.replaced_by IS NULL
+          )
+        """
+    )
+
+    op.drop_index("ix_refresh_tokens_token_hash", table_name="refresh_tokens")
+    op.create_index(
+        "ix_refresh_tokens_token_hash",
+        "refresh_tokens",
+        ["token_hash"],
+        unique=True,
+        postgresql_where=sa.text("replaced_by IS NULL"),
+        sqlite_where=sa.text("replaced_by IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_token_hash", table_name="refresh_tokens")
+    op.create_index(
+        "ix_refresh_tokens_token_hash",
+        "refresh_tokens",
+        ["token_hash"],
+    )
@@ -0,0 +1,58 @@
+"""Store sessions.id as 16 raw bytes.
+
+Session identifiers are 128-bit random values. Keeping them as raw bytes
+instead of a hex varchar halves the primary key width and makes the
+session lookup a fixed-width comparison.
+
+Existing sessions are deleted rather than converted: they are short-lived
+and their identifiers were issued in the old text format, so affected
+users simply sign in again. SQLite stores BLOB values as-is regardless of
+the declared column type, so only the session purge runs there.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "019"
+down_revision: str | None = "018"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM sessions")
+
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    op.alter_column(
+        "sessions",
+        "id",
+        type_=sa.LargeBinary(16),
+        existing_type=sa.String(64),
+        existing_nullable=False,
+        postgresql_using="decode(id, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM sessions")
+
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    op.alter_column(
+        "sessions",
+        "id",
+        type_=sa.String(64),
+        existing_type=sa.LargeBinary(16),
+        existing_nullable=False,
+        postgresql_using="encode(id, 'hex')",
+    )
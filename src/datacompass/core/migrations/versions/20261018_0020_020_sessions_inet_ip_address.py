@@ -0,0 +1,50 @@
+"""Use INET for sessions.ip_address on PostgreSQL.
+
+INET holds an IPv6 address in at most 19 bytes, validates input, and
+supports containment operators for subnet lookups. SQLite keeps the
+VARCHAR(45) column.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers, used by Alembic.
+revision: str = "020"
+down_revision: str | None = "019"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "sessions",
+        "ip_address",
+        type_=postgresql.INET(),
+        existing_type=sa.String(45),
+        existing_nullable=True,
+        postgresql_using="ip_address::inet",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "sessions",
+        "ip_address",
+        type_=sa.String(45),
+        existing_type=postgresql.INET(),
+        existing_nullable=True,
+        postgresql_using="host(ip_address)",
+    )
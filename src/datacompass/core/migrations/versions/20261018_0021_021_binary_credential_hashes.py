@@ -0,0 +1,77 @@
+"""Store API key and refresh token hashes as raw SHA-256 digests.
+
+``api_keys.key_hash`` and ``refresh_tokens.token_hash`` held 64-character
+hex strings in VARCHAR(255) columns. They become 32-byte binary columns,
+which halves the indexed key and turns the lookup into a fixed-width
+comparison. ``users.password_hash`` is bcrypt text and is left unchanged.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "021"
+down_revision: str | None = "020"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+HASH_COLUMNS = [
+    ("api_keys", "key_hash"),
+    ("refresh_tokens", "token_hash"),
+]
+
+
+def _convert_sqlite_rows(table: str, column: str, to_binary: bool) -> None:
+    # SQLite before 3.41 has no unhex(), so rewrite the values from Python.
+    # Column types are not enforced there, so no table rebuild is needed.
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(f"SELECT id, {column} FROM {table}")).all()
+    for row_id, value in rows:
+        if to_binary:
+            new_value = bytes.fromhex(value) if isinstance(value, str) else value
+        else:
+            new_value = value.hex() if isinstance(value, bytes) else value
+        conn.execute(
+            sa.text(f"UPDATE {table} SET {column} = :value WHERE id = :id"),
+            {"value": new_value, "id": row_id},
+        )
+
+
+def upgrade() -> None:
+    is_sqlite = op.get_bind().dialect.name == "sqlite"
+
+    for table, column in HASH_COLUMNS:
+        if is_sqlite:
+            _convert_sqlite_rows(table, column, to_binary=True)
+            continue
+        op.alter_column(
+            table,
+            column,
+            type_=sa.LargeBinary(32),
+            existing_type=sa.String(255),
+            existing_nullable=False,
+            postgresql_using=f"decode({column}, 'hex')",
+        )
+
+
+def downgrade() -> None:
+    is_sqlite = op.get_bind().dialect.name == "sqlite"
+
+    for table, column in HASH_COLUMNS:
+        if is_sqlite:
+            _convert_sqlite_rows(table, column, to_binary=False)
+            continue
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(255),
+            existing_type=sa.LargeBinary(32),
+            existing_nullable=False,
+            postgresql_using=f"encode({column}, 'hex')",
+        )
@@ -0,0 +1,37 @@
+"""Replace ix_dependencies_target_id with a (target_id, dependency_type) index.
+
+Reverse-lineage lookups filter on target_id and frequently on
+dependency_type as well. The composite index still serves target-only
+lookups through its leading column. On PostgreSQL it also carries
+object_id and confidence so the dependents of a node can be read without
+visiting the heap.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "022"
+down_revision: str | None = "021"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_dependencies_target_dtype",
+        "dependencies",
+        ["target_id", "dependency_type"],
+        postgresql_include=["object_id", "confidence"],
+    )
+    op.drop_index("ix_dependencies_target_id", table_name="dependencies")
+
+
+def downgrade() -> None:
+    op.create_index("ix_dependencies_target_id", "dependencies", ["target_id"])
+    op.drop_index("ix_dependencies_target_dtype", table_name="dependencies")
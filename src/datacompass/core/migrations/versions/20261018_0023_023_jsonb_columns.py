@@ -0,0 +1,71 @@
+"""Convert JSON columns to JSONB on PostgreSQL.
+
+JSON is stored as text and re-parsed on every read and path lookup; JSONB
+is stored decomposed and can be indexed. SQLite keeps its JSON columns.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers, used by Alembic.
+revision: str = "023"
+down_revision: str | None = "022"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, nullable)
+JSON_COLUMNS = [
+    ("data_sources", "connection_info", False),
+    ("data_sources", "sync_config", True),
+    ("catalog_objects", "source_metadata", True),
+    ("catalog_objects", "user_metadata", True),
+    ("columns", "source_metadata", True),
+    ("columns", "user_metadata", True),
+    ("dependencies", "target_external", True),
+    ("dq_expectations", "threshold_config", False),
+    ("dq_breaches", "threshold_snapshot", False),
+    ("dq_breaches", "lifecycle_events", False),
+    ("schedule_runs", "result_summary", True),
+    ("notification_channels", "config", False),
+    ("notification_rules", "conditions", True),
+    ("notification_log", "event_payload", False),
+    ("api_keys", "scopes", True),
+    ("usage_metrics", "source_metrics", True),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::json",
+        )
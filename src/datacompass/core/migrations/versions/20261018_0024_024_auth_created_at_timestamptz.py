@@ -0,0 +1,57 @@
+"""Use TIMESTAMPTZ for auth created_at columns on PostgreSQL.
+
+api_keys, sessions and refresh_tokens get created_at from the server-side
+now() default instead of a Python-side timestamp. On PostgreSQL the
+columns become TIMESTAMPTZ, and existing values are read as UTC, which is
+what datetime.utcnow() wrote. SQLite has no time zone type and is left
+unchanged.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "024"
+down_revision: str | None = "023"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ["api_keys", "sessions", "refresh_tokens"]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            existing_server_default=sa.func.now(),
+            postgresql_using="created_at AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            existing_server_default=sa.func.now(),
+            postgresql_using="created_at AT TIME ZONE 'UTC'",
+        )
@@ -0,0 +1,46 @@
+"""Replace user_id indexes on api_keys and sessions with listing indexes.
+
+Both tables are listed per user, newest first. Keys are also filtered on
+is_active. Indexes that end in created_at DESC return rows already in
+that order, so the sort step goes away. Their leading user_id column
+still serves the ON DELETE CASCADE from users.
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "025"
+down_revision: str | None = "024"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_api_keys_user_id_active_created",
+        "api_keys",
+        ["user_id", "is_active", sa.text("created_at DESC")],
+    )
+    op.drop_index("ix_api_keys_user_id", table_name="api_keys")
+
+    op.create_index(
+        "ix_sessions_user_id_created",
+        "sessions",
+        ["user_id", sa.text("created_at DESC")],
+    )
+    op.drop_index("ix_sessions_user_id", table_name="sessions")
+
+
+def downgrade() -> None:
+    op.create_index("ix_sessions_user_id", "sessions", ["user_id"])
+    op.drop_index("ix_sessions_user_id_created", table_name="sessions")
+
+    op.create_index("ix_api_keys_user_id", "api_keys", ["user_id"])
+    op.drop_index("ix_api_keys_user_id_active_created", table_name="api_keys")
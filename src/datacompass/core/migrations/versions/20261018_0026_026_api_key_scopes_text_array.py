@@ -0,0 +1,61 @@
+"""Store api_keys.scopes as TEXT[] on PostgreSQL.
+
+Scopes are a flat list of strings. A native array is smaller than JSONB
+for that shape and supports containment checks such as
+``scopes @> ARRAY['catalog:read']``, which a GIN index can serve once
+scope enforcement exists. SQLite keeps the JSON column.
+
+PostgreSQL does not allow subqueries in ALTER COLUMN ... USING, so the
+values are copied through a temporary column instead. Keys created
+without scopes hold JSON ``null`` rather than SQL NULL (the JSON type
+stores None as ``'null'``), so only array values are copied; everything
+else becomes NULL.
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers, used by Alembic.
+revision: str = "026"
+down_revision: str | None = "025"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.add_column(
+        "api_keys",
+        sa.Column("scopes_array", postgresql.ARRAY(sa.Text()), nullable=True),
+    )
+    op.execute(
+        "UPDATE api_keys "
+        "SET scopes_array = ARRAY(SELECT jsonb_array_elements_text(scopes)) "
+        "WHERE jsonb_typeof(scopes) = 'array'"
+    )
+    op.drop_column("api_keys", "scopes")
+    op.alter_column("api_keys", "scopes_array", new_column_name="scopes")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.add_column(
+        "api_keys",
+        sa.Column("scopes_json", postgresql.JSONB(), nullable=True),
+    )
+    op.execute(
+        "UPDATE api_keys SET scopes_json = to_jsonb(scopes) WHERE scopes IS NOT NULL"
+    )
+    op.drop_column("api_keys", "scopes")
+    op.alter_column("api_keys", "scopes_json", new_column_name="scopes")
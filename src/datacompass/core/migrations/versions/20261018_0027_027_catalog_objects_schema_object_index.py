@@ -0,0 +1,32 @@
+"""Index catalog_objects on (schema_name, object_name).
+
+"schema.object" identifiers without a source name are resolved across
+all sources. The natural-key constraint leads with source_id and cannot
+serve that lookup, so it scanned the table.
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "027"
+down_revision: str | None = "026"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_catalog_objects_schema_object",
+        "catalog_objects",
+        ["schema_name", "object_name"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_catalog_objects_schema_object", table_name="catalog_objects")
@@ -0,0 +1,39 @@
+"""Drop the duplicate UNIQUE constraint on users.email.
+
+Migration 007 declared email both as ``unique=True`` on the column and
+through the unique index ix_users_email, so PostgreSQL kept two identical
+unique B-trees on the column. Every user insert and email change updated
+both. The constraint is dropped and ix_users_email is kept as the only
+uniqueness guarantee.
+
+SQLite is skipped: its inline constraint is unnamed and removing it would
+need a full table rebuild, which the small duplicate does not justify.
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "028"
+down_revision: str | None = "027"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_constraint("users_email_key", "users", type_="unique")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.create_unique_constraint("users_email_key", "users", ["email"])
@@ -0,0 +1,38 @@
+"""Replace ix_dq_breaches_status with a (status, detected_at DESC) index.
+
+The hub's recent-breach list filters on status and orders by detected_at,
+which the composite index returns without a sort; status-only filters and
+the per-status counts still use its leading column. On PostgreSQL it also
+carries expectation_id so the open-breaches-by-priority aggregate can
+reach dq_expectations without reading breach rows.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "029"
+down_revision: str | None = "028"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_dq_breaches_status_detected",
+        "dq_breaches",
+        ["status", sa.text("detected_at DESC")],
+        postgresql_include=["expectation_id"],
+    )
+    op.drop_index("ix_dq_breaches_status", table_name="dq_breaches")
+
+
+def downgrade() -> None:
+    op.create_index("ix_dq_breaches_status", "dq_breaches", ["status"])
+    op.drop_index("ix_dq_breaches_status_detected", table_name="dq_breaches")
@@ -0,0 +1,57 @@
+"""Use TIMESTAMPTZ for DQ result and breach timestamps on PostgreSQL.
+
+dq_results.created_at and dq_breaches.detected_at are now filled by the
+now() server default from migration 004 rather than by the application.
+On PostgreSQL the columns become TIMESTAMPTZ so that default is stored
+unambiguously; existing rows were written with datetime.utcnow() and are
+read as UTC. SQLite is left unchanged.
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "030"
+down_revision: str | None = "029"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = [("dq_results", "created_at"), ("dq_breaches", "detected_at")]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            existing_server_default=sa.func.now(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            existing_server_default=sa.func.now(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
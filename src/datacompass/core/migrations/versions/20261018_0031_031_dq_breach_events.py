@@ -0,0 +1,50 @@
+"""Add dq_breach_events for lifecycle events archived from breaches.
+
+dq_breaches.lifecycle_events is append-only and was unbounded. The
+application now keeps the most recent events inline and moves older ones
+to this table, so breach rows stay small however often they change
+status.
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "031"
+down_revision: str | None = "030"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dq_breach_events",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "breach_id",
+            sa.Integer(),
+            sa.ForeignKey("dq_breaches.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("changed_by", sa.String(100), nullable=True),
+        sa.Column("changed_at", sa.DateTime(), nullable=False),
+        sa.Column("notes", sa.Text(), nullable=True),
+    )
+
+    op.create_index(
+        "ix_dq_breach_events_breach_id",
+        "dq_breach_events",
+        ["breach_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_dq_breach_events_breach_id", table_name="dq_breach_events")
+    op.drop_table("dq_breach_events")
@@ -0,0 +1,37 @@
+"""Add a partial index on open breaches by expectation.
+
+Open breaches are a small, hot slice of dq_breaches. Counting them per
+expectation (the DQ config list) through the unique index means reading
+every historical breach row to test its status. The partial index only
+holds open rows, so those counts come from a small index on both
+dialects.
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "032"
+down_revision: str | None = "031"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_dq_breaches_open_expectation",
+        "dq_breaches",
+        ["expectation_id"],
+        postgresql_where=sa.text("status = 'open'"),
+        sqlite_where=sa.text("status = 'open'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_dq_breaches_open_expectation", table_name="dq_breaches")
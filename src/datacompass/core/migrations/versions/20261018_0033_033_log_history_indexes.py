@@ -0,0 +1,53 @@
+"""Index schedule run and notification log history by time.
+
+Both tables are append-only and are read newest-first: the hub summary
+lists recent runs and logs, schedule detail lists one schedule's recent
+runs, and retention pruning deletes by age. The composite
+(schedule_id, started_at) index supersedes ix_schedule_runs_schedule_id.
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "033"
+down_revision: str | None = "032"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_schedule_runs_schedule_id", table_name="schedule_runs")
+
+    op.create_index(
+        "ix_schedule_runs_schedule_started",
+        "schedule_runs",
+        ["schedule_id", "started_at"],
+    )
+    op.create_index(
+        "ix_schedule_runs_started_at",
+        "schedule_runs",
+        ["started_at"],
+    )
+    op.create_index(
+        "ix_notification_log_sent_at",
+        "notification_log",
+        ["sent_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_log_sent_at", table_name="notification_log")
+    op.drop_index("ix_schedule_runs_started_at", table_name="schedule_runs")
+    op.drop_index("ix_schedule_runs_schedule_started", table_name="schedule_runs")
+
+    op.create_index(
+        "ix_schedule_runs_schedule_id",
+        "schedule_runs",
+        ["schedule_id"],
+    )
@@ -0,0 +1,56 @@
+"""Narrow the schedule and notification rule dispatch indexes.
+
+ix_schedules_dispatch becomes a partial index over enabled schedules only,
+since the dispatcher never looks at disabled ones. Notification rules are
+matched by event type and enabled flag on every event, so
+ix_notification_rules_event_type gains is_enabled as a second column.
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "034"
+down_revision: str | None = "033"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_schedules_dispatch", table_name="schedules")
+    op.create_index(
+        "ix_schedules_dispatch",
+        "schedules",
+        ["job_type", "next_run_at"],
+        postgresql_where=sa.text("is_enabled"),
+        sqlite_where=sa.text("is_enabled = 1"),
+    )
+
+    op.drop_index("ix_notification_rules_event_type", table_name="notification_rules")
+    op.create_index(
+        "ix_notification_rules_event_enabled",
+        "notification_rules",
+        ["event_type", "is_enabled"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_rules_event_enabled", table_name="notification_rules")
+    op.create_index(
+        "ix_notification_rules_event_type",
+        "notification_rules",
+        ["event_type"],
+    )
+
+    op.drop_index("ix_schedules_dispatch", table_name="schedules")
+    op.create_index(
+        "ix_schedules_dispatch",
+        "schedules",
+        ["is_enabled", "job_type", "next_run_at"],
+    )
@@ -0,0 +1,57 @@
+"""Use TIMESTAMPTZ for schedule run and notification log timestamps on PostgreSQL.
+
+schedule_runs.created_at and notification_log.sent_at are now filled by the
+now() server default from migration 006 rather than by the application.
+As with the DQ timestamps in migration 030, the PostgreSQL columns become
+TIMESTAMPTZ and existing rows, written with datetime.utcnow(), are read as
+UTC. SQLite is left unchanged.
+
+Revision ID: 035
+Revises: 034
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "035"
+down_revision: str | None = "034"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = [("schedule_runs", "created_at"), ("notification_log", "sent_at")]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            existing_server_default=sa.func.now(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            existing_server_default=sa.func.now(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
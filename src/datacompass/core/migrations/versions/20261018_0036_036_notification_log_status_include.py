@@ -0,0 +1,40 @@
+"""Cover notification status counts with ix_notification_log_sent_at.
+
+The scheduler hub counts the last week of notification_log rows by status.
+Including status in the sent_at index lets PostgreSQL answer that from the
+index alone instead of visiting every log row in the window. SQLite has no
+INCLUDE clause, so the index is recreated unchanged there.
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "036"
+down_revision: str | None = "035"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_notification_log_sent_at", table_name="notification_log")
+    op.create_index(
+        "ix_notification_log_sent_at",
+        "notification_log",
+        ["sent_at"],
+        postgresql_include=["status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_log_sent_at", table_name="notification_log")
+    op.create_index(
+        "ix_notification_log_sent_at",
+        "notification_log",
+        ["sent_at"],
+    )
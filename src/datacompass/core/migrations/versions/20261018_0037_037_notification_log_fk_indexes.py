@@ -0,0 +1,39 @@
+"""Index the notification_log foreign keys.
+
+rule_id and channel_id reference notification_rules and
+notification_channels with ON DELETE SET NULL. Without an index on the
+referencing column, each rule or channel delete scans the whole log.
+The channel_id index also serves log listings filtered by channel.
+
+Revision ID: 037
+Revises: 036
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "037"
+down_revision: str | None = "036"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notification_log_rule_id",
+        "notification_log",
+        ["rule_id"],
+    )
+    op.create_index(
+        "ix_notification_log_channel_id",
+        "notification_log",
+        ["channel_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_log_channel_id", table_name="notification_log")
+    op.drop_index("ix_notification_log_rule_id", table_name="notification_log")
@@ -0,0 +1,64 @@
+"""Use TIMESTAMPTZ for schedule, run and usage timestamps on PostgreSQL.
+
+Completes migration 035 for the scheduling tables and covers the usage
+timestamps reported by adapters. The application connects with the session
+time zone pinned to UTC, so naive UTC values it writes are stored correctly
+and existing rows are read as UTC. usage_metrics.collected_at stays a
+TIMESTAMP because it is the partition key from migration 012. SQLite is
+left unchanged.
+
+Revision ID: 038
+Revises: 037
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "038"
+down_revision: str | None = "037"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, nullable)
+COLUMNS = [
+    ("schedules", "next_run_at", True),
+    ("schedules", "last_run_at", True),
+    ("schedule_runs", "started_at", False),
+    ("schedule_runs", "completed_at", True),
+    ("usage_metrics", "last_read_at", True),
+    ("usage_metrics", "last_written_at", True),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, nullable in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, nullable in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -1,6 +1,6 @@
 """Domain models for Data Compass."""
 
-from datacompass.core.models.base import Base, SoftDeleteMixin, TimestampMixin
+from datacompass.core.models.base import Base, ORMResponse, SoftDeleteMixin, TimestampMixin
 from datacompass.core.models.catalog_object import CatalogObject
 from datacompass.core.models.column import Column
 from datacompass.core.models.data_source import DataSource
@@ -33,6 +33,7 @@ from datacompass.core.models.dq import (
     BreachResponse,
     BreachStatusUpdate,
     DQBreach,
+    DQBreachEvent,
     DQConfig,
     DQConfigCreate,
     DQConfigDetailResponse,
@@ -124,6 +125,7 @@ __all__ = [
     "Column",
     "Dependency",
     # Pydantic schemas
+    "ORMResponse",
     "DataSourceCreate",
     "DataSourceResponse",
     "DataSourceDetail",
@@ -152,6 +154,7 @@ __all__ = [
     "DQExpectation",
     "DQResult",
     "DQBreach",
+    "DQBreachEvent",
     "ThresholdConfig",
     "DQConfigCreate",
     "DQConfigUpdate",
@@ -3,11 +3,23 @@
 from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
-from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, INET
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from datacompass.core.models.base import Base, TimestampMixin
+from datacompass.core.models.base import Base, ORMResponse, TimestampMixin
 
 # =============================================================================
 # SQLAlchemy Models
@@ -23,7 +35,7 @@ class User(Base, TimestampMixin):
     __tablename__ = "users"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     username: Mapped[str | None] = mapped_column(String(100), nullable=True)
     display_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     password_hash: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -50,6 +62,11 @@ class User(Base, TimestampMixin):
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        # The only uniqueness guarantee on email; no separate UNIQUE constraint
+        Index("ix_users_email", "email", unique=True),
+    )
+
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email!r})>"
 
@@ -71,20 +88,43 @@ class APIKey(Base):
     )
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     key_prefix: Mapped[str] = mapped_column(String(12), nullable=False)
-    key_hash: Mapped[str] = mapped_column(String(255), nullable=False)
-    scopes: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+    key_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
+    # Native TEXT[] on PostgreSQL so scope checks can use the @> operator
+    scopes: Mapped[list[str] | None] = mapped_column(
+        JSON().with_variant(ARRAY(Text()), "postgresql"),
+        nullable=True,
+    )
     expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_used_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
     )
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="api_keys")
 
+    __table_args__ = (
+        # Only active keys can authenticate, so only they are indexed. The
+        # INCLUDE columns let PostgreSQL answer the lookup index-only.
+        Index(
+            "ix_api_keys_key_prefix",
+            "key_prefix",
+            postgresql_include=["key_hash", "user_id", "is_active", "expires_at"],
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        # Matches list_by_user(): filter on user and active flag, newest first
+        Index(
+            "ix_api_keys_user_id_active_created",
+            "user_id",
+            "is_active",
+            text("created_at DESC"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<APIKey(id={self.id}, name={self.name!r}, prefix={self.key_prefix!r})>"
 
@@ -97,26 +137,35 @@ class Session(Base):
 
     __tablename__ = "sessions"
 
-    id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # 128-bit random identifier stored as raw bytes rather than hex text.
+    id: Mapped[bytes] = mapped_column(LargeBinary(16), primary_key=True)
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
     )
     user_agent: Mapped[str | None] = mapped_column(String(500), nullable=True)
-    ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
+    ip_address: Mapped[str | None] = mapped_column(
+        String(45).with_variant(INET(), "postgresql"),
+        nullable=True,
+    )
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
     )
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="sessions")
 
+    __table_args__ = (
+        # Serves the per-user listing, which sorts by created_at
+        Index("ix_sessions_user_id_created", "user_id", text("created_at DESC")),
+    )
+
     def __repr__(self) -> str:
-        return f"<Session(id={self.id[:8]}..., user_id={self.user_id})>"
+        return f"<Session(id={self.id.hex()[:8]}..., user_id={self.user_id})>"
 
 
 class RefreshToken(Base):
@@ -133,7 +182,7 @@ class RefreshToken(Base):
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
     )
-    token_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     replaced_by: Mapped[int | None] = mapped_column(
         Integer,
@@ -141,14 +190,25 @@ class RefreshToken(Base):
         nullable=True,
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
     )
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="refresh_tokens")
 
+    __table_args__ = (
+        # Only unreplaced tokens can be exchanged; rotated ones stay unindexed
+        Index(
+            "ix_refresh_tokens_token_hash",
+            "token_hash",
+            unique=True,
+            postgresql_where=text("replaced_by IS NULL"),
+            sqlite_where=text("replaced_by IS NULL"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<RefreshToken(id={self.id}, user_id={self.user_id})>"
 
@@ -157,21 +217,25 @@ class RefreshToken(Base):
 # Pydantic Schemas
 # =============================================================================
 
+# Loose sanity check for email fields. Every schema uses this one string so the
+# pattern is written once and all fields validate addresses the same way.
+EMAIL_PATTERN = r".+@.+"
+
 
 class UserCreate(BaseModel):
     """Schema for creating a new user."""
 
-    email: str = Field(..., min_length=3, pattern=r".+@.+")
+    email: str = Field(..., min_length=3, pattern=EMAIL_PATTERN)
     password: str | None = None
     username: str | None = None
     display_name: str | None = None
     is_superuser: bool = False
 
 
-class UserResponse(BaseModel):
+class UserResponse(ORMResponse):
     """Schema for user response (excludes sensitive data)."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
     id: int
     email: str
@@ -193,10 +257,10 @@ class APIKeyCreate(BaseModel):
     expires_days: int | None = Field(default=None, ge=1, le=365)
 
 
-class APIKeyResponse(BaseModel):
+class APIKeyResponse(ORMResponse):
     """Schema for API key response (excludes hash)."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
     id: int
     user_id: int
@@ -209,10 +273,10 @@ class APIKeyResponse(BaseModel):
     created_at: datetime
 
 
-class APIKeyCreated(BaseModel):
+class APIKeyCreated(ORMResponse):
     """Schema for newly created API key (includes full key, shown only once)."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
     id: int
     user_id: int
@@ -227,13 +291,15 @@ class APIKeyCreated(BaseModel):
 class LoginRequest(BaseModel):
     """Schema for login request."""
 
-    email: str = Field(..., min_length=3, pattern=r".+@.+")
+    email: str = Field(..., min_length=3, pattern=EMAIL_PATTERN)
     password: str
 
 
 class TokenResponse(BaseModel):
     """Schema for token response after successful authentication."""
 
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
@@ -249,6 +315,8 @@ class RefreshTokenRequest(BaseModel):
 class AuthStatusResponse(BaseModel):
     """Schema for authentication status response."""
 
+    model_config = ConfigDict(frozen=True)
+
     auth_mode: str
     is_authenticated: bool = False
     user: UserResponse | None = None
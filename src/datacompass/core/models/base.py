@@ -1,15 +1,55 @@
 """SQLAlchemy base model and common mixins."""
 
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import DateTime, func
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import JSON, DateTime, func, inspect
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# JSON column type: plain JSON on SQLite, binary JSONB on PostgreSQL so
+# values are stored pre-parsed instead of being re-read from text.
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+class ORMResponse(BaseModel):
+    """Base class for response schemas read from ORM instances.
+
+    The core schema is built on first use rather than at import time, so
+    CLI commands only pay for the response models they actually touch.
+    """
+
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
+
+class _Unloaded:
+    """Placeholder shown by __repr__ for attributes that are not loaded."""
+
+    def __repr__(self) -> str:
+        return "<unloaded>"
+
+
+_UNLOADED = _Unloaded()
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
-    pass
+    def _repr_value(self, key: str) -> Any:
+        """Get an attribute's loaded value for use in __repr__.
+
+        Reads the instance state directly, so an expired or detached
+        instance is described as-is rather than refreshed with a SELECT
+        (or raising DetachedInstanceError) while being logged.
+
+        Args:
+            key: Attribute name.
+
+        Returns:
+            The loaded value, or a placeholder that renders as <unloaded>.
+        """
+        return inspect(self).dict.get(key, _UNLOADED)
 
 
 class TimestampMixin:
@@ -3,10 +3,9 @@
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint
-from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from datacompass.core.models.base import Base, SoftDeleteMixin, TimestampMixin
+from datacompass.core.models.base import Base, JSONVariant, SoftDeleteMixin, TimestampMixin
 
 if TYPE_CHECKING:
     from datacompass.core.models.column import Column
@@ -33,10 +32,10 @@ class CatalogObject(Base, TimestampMixin, SoftDeleteMixin):
     object_type: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # Metadata from the source system (populated by adapters)
-    source_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    source_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant, nullable=True)
 
     # User-provided metadata (descriptions, tags, ownership, etc.)
-    user_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    user_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant, nullable=True)
 
     # Relationships
     source: Mapped["DataSource"] = relationship("DataSource", back_populates="objects")
@@ -79,8 +78,9 @@ class CatalogObject(Base, TimestampMixin, SoftDeleteMixin):
             "object_type",
             name="uq_catalog_object_natural_key",
         ),
-        Index("ix_catalog_objects_source_schema", "source_id", "schema_name"),
         Index("ix_catalog_objects_object_type", "object_type"),
+        # "schema.object" lookups that don't know the source
+        Index("ix_catalog_objects_schema_object", "schema_name", "object_name"),
     )
 
     @property
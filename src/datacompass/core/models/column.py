@@ -3,10 +3,9 @@
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
-from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from datacompass.core.models.base import Base
+from datacompass.core.models.base import Base, JSONVariant
 
 if TYPE_CHECKING:
     from datacompass.core.models.catalog_object import CatalogObject
@@ -27,10 +26,10 @@ class Column(Base):
     position: Mapped[int] = mapped_column(Integer, nullable=False)
 
     # Metadata from the source system (data_type, nullable, default, etc.)
-    source_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    source_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant, nullable=True)
 
     # User-provided metadata (descriptions, classifications, etc.)
-    user_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    user_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant, nullable=True)
 
     # Relationship
     object: Mapped["CatalogObject"] = relationship("CatalogObject", back_populates="columns")
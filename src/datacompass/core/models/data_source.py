@@ -4,10 +4,9 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import Boolean, DateTime, Integer, String, Text
-from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from datacompass.core.models.base import Base, TimestampMixin
+from datacompass.core.models.base import Base, JSONVariant, TimestampMixin
 
 if TYPE_CHECKING:
     from datacompass.core.models.catalog_object import CatalogObject
@@ -23,8 +22,8 @@ class DataSource(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     display_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     source_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    connection_info: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
-    sync_config: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    connection_info: Mapped[dict[str, Any]] = mapped_column(JSONVariant, nullable=False)
+    sync_config: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     last_scan_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_scan_status: Mapped[str | None] = mapped_column(String(50), nullable=True)
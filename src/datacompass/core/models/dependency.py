@@ -1,13 +1,13 @@
 """Dependency model for lineage tracking."""
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint
-from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from datacompass.core.models.base import Base, TimestampMixin
+from datacompass.core.models.base import Base, JSONVariant, ORMResponse, TimestampMixin
 
 if TYPE_CHECKING:
     from datacompass.core.models.catalog_object import CatalogObject
@@ -58,7 +58,7 @@ class Dependency(Base, TimestampMixin):
         ForeignKey("catalog_objects.id", ondelete="CASCADE"),
         nullable=True,
     )
-    target_external: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    target_external: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant, nullable=True)
     dependency_type: Mapped[str] = mapped_column(String(50), nullable=False)
     parsing_source: Mapped[str] = mapped_column(String(50), nullable=False)
     confidence: Mapped[str] = mapped_column(String(50), nullable=False, default="HIGH")
@@ -82,8 +82,14 @@ class Dependency(Base, TimestampMixin):
             "parsing_source",
             name="uq_dependency_natural_key",
         ),
-        Index("ix_dependencies_object_id", "object_id"),
-        Index("ix_dependencies_target_id", "target_id"),
+        # Reverse lineage filters on target (and often type); on PostgreSQL the
+        # INCLUDE columns let the walk read dependents without heap fetches.
+        Index(
+            "ix_dependencies_target_dtype",
+            "target_id",
+            "dependency_type",
+            postgresql_include=["object_id", "confidence"],
+        ),
         Index("ix_dependencies_source_id", "source_id"),
     )
 
@@ -97,11 +103,9 @@ class Dependency(Base, TimestampMixin):
 # =============================================================================
 
 
-class DependencyResponse(BaseModel):
+class DependencyResponse(ORMResponse):
     """Schema for dependency responses."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     source_id: int
     object_id: int
@@ -115,6 +119,8 @@ class DependencyResponse(BaseModel):
 class LineageNode(BaseModel):
     """Represents a node in the lineage graph."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int = Field(..., description="Catalog object ID")
     source_name: str = Field(..., description="Data source name")
     schema_name: str = Field(..., description="Schema name")
@@ -122,7 +128,7 @@ class LineageNode(BaseModel):
     object_type: str = Field(..., description="Object type (TABLE, VIEW, etc.)")
     distance: int = Field(..., description="Hops from root object (0 = root)")
 
-    @property
+    @cached_property
     def full_name(self) -> str:
         """Return the fully-qualified object name."""
         return f"{self.source_name}.{self.schema_name}.{self.object_name}"
@@ -131,6 +137,8 @@ class LineageNode(BaseModel):
 class ExternalNode(BaseModel):
     """Represents an external reference not in the catalog."""
 
+    model_config = ConfigDict(frozen=True)
+
     schema_name: str | None = Field(None, description="Schema name if known")
     object_name: str = Field(..., description="Object name")
     object_type: str | None = Field(None, description="Object type if known")
@@ -140,6 +148,8 @@ class ExternalNode(BaseModel):
 class LineageEdge(BaseModel):
     """Represents an edge in the lineage graph."""
 
+    model_config = ConfigDict(frozen=True)
+
     from_id: int = Field(..., description="Source object ID")
     to_id: int | None = Field(None, description="Target object ID (null for external)")
     to_external: dict[str, Any] | None = Field(
@@ -150,7 +160,12 @@ class LineageEdge(BaseModel):
 
 
 class LineageGraph(BaseModel):
-    """Complete lineage graph for an object."""
+    """Complete lineage graph for an object.
+
+    Frozen because graphs are cached and shared between callers.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     root: LineageNode = Field(..., description="The root object being analyzed")
     nodes: list[LineageNode] = Field(
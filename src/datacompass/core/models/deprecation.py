@@ -1,9 +1,9 @@
 """Deprecation campaign models for managing object retirement."""
 
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from sqlalchemy import (
     Date,
     DateTime,
@@ -16,7 +16,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from datacompass.core.models.base import Base, TimestampMixin
+from datacompass.core.models.base import Base, ORMResponse, TimestampMixin
 
 if TYPE_CHECKING:
     from datacompass.core.models.catalog_object import CatalogObject
@@ -61,11 +61,11 @@ class DeprecationCampaign(Base, TimestampMixin):
         "Deprecation",
         back_populates="campaign",
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
 
     __table_args__ = (
         UniqueConstraint("source_id", "name", name="uq_deprecation_campaigns_source_name"),
-        Index("ix_deprecation_campaigns_source_id", "source_id"),
         Index("ix_deprecation_campaigns_status", "status"),
     )
 
@@ -105,19 +105,21 @@ class Deprecation(Base, TimestampMixin):
         "DeprecationCampaign",
         back_populates="deprecations",
     )
+    # Both are read for every DeprecationResponse, so join them in up front
     object: Mapped["CatalogObject"] = relationship(
         "CatalogObject",
         foreign_keys=[object_id],
         back_populates="deprecations",
+        lazy="joined",
     )
     replacement: Mapped["CatalogObject | None"] = relationship(
         "CatalogObject",
         foreign_keys=[replacement_id],
+        lazy="joined",
     )
 
     __table_args__ = (
         UniqueConstraint("campaign_id", "object_id", name="uq_deprecations_campaign_object"),
-        Index("ix_deprecations_campaign_id", "campaign_id"),
         Index("ix_deprecations_object_id", "object_id"),
     )
 
@@ -168,11 +170,9 @@ class DeprecationUpdate(BaseModel):
 # =============================================================================
 
 
-class DeprecationResponse(BaseModel):
+class DeprecationResponse(ORMResponse):
     """Response for a deprecation entry."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     campaign_id: int
     object_id: int
@@ -196,22 +196,14 @@ class CampaignListItem(BaseModel):
     status: str
     target_date: date
     object_count: int
-
-    @computed_field
-    @property
-    def days_remaining(self) -> int | None:
-        """Days until target date (None if completed)."""
-        if self.status == "completed":
-            return None
-        delta = self.target_date - date.today()
-        return delta.days
+    days_remaining: int | None = Field(
+        default=None, description="Days until target date (None if completed)"
+    )
 
 
-class CampaignDetailResponse(BaseModel):
+class CampaignDetailResponse(ORMResponse):
     """Detailed campaign response with deprecations."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     source_id: int
     source_name: str
@@ -222,15 +214,9 @@ class CampaignDetailResponse(BaseModel):
     deprecations: list[DeprecationResponse]
     created_at: datetime
     updated_at: datetime
-
-    @computed_field
-    @property
-    def days_remaining(self) -> int | None:
-        """Days until target date (None if completed)."""
-        if self.status == "completed":
-            return None
-        delta = self.target_date - date.today()
-        return delta.days
+    days_remaining: int | None = Field(
+        default=None, description="Days until target date (None if completed)"
+    )
 
 
 # =============================================================================
@@ -241,18 +227,24 @@ class CampaignDetailResponse(BaseModel):
 class ImpactedObject(BaseModel):
     """Object impacted by a deprecation."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     source_name: str
     schema_name: str
     object_name: str
     object_type: str
     distance: int = Field(..., description="Hops from deprecated object")
-
-    @computed_field
-    @property
-    def full_name(self) -> str:
-        """Full qualified name."""
-        return f"{self.source_name}.{self.schema_name}.{self.object_name}"
+    full_name: str = Field(default="", description="Full qualified name")
+
+    @model_validator(mode="before")
+    @classmethod
+    def set_full_name(cls, data: Any) -> Any:
+        """Build the qualified name once so serialization needn't recompute it."""
+        parts = ("source_name", "schema_name", "object_name")
+        if isinstance(data, dict) and all(part in data for part in parts):
+            data = {**data, "full_name": ".".join(str(data[part]) for part in parts)}
+        return data
 
 
 class DeprecationImpact(BaseModel):
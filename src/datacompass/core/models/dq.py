@@ -13,12 +13,14 @@ from sqlalchemy import (
     Index,
     Integer,
     String,
+    Text,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from datacompass.core.models.base import Base, TimestampMixin
+from datacompass.core.models.base import Base, JSONVariant, ORMResponse, TimestampMixin
 
 if TYPE_CHECKING:
     from datacompass.core.models.catalog_object import CatalogObject
@@ -31,10 +33,16 @@ if TYPE_CHECKING:
 ExpectationType = Literal["row_count", "null_count", "distinct_count", "min", "max", "mean", "sum"]
 ThresholdType = Literal["absolute", "simple_average", "dow_adjusted"]
 BreachDirection = Literal["high", "low"]
+# Status and priority stay plain strings rather than str Enums: they are read
+# straight from String columns and filtered in SQL, so an Enum would only add a
+# conversion per row without speeding up any comparison that matters.
 BreachStatus = Literal["open", "acknowledged", "dismissed", "resolved"]
 Priority = Literal["critical", "high", "medium", "low"]
 Grain = Literal["daily", "hourly"]
 
+# Lifecycle events kept inline on a breach; older ones move to dq_breach_events
+MAX_LIFECYCLE_EVENTS = 50
+
 
 # =============================================================================
 # SQLAlchemy Models
@@ -68,10 +76,7 @@ class DQConfig(Base, TimestampMixin):
         "DQExpectation",
         back_populates="config",
         cascade="all, delete-orphan",
-    )
-
-    __table_args__ = (
-        Index("ix_dq_configs_object_id", "object_id"),
+        lazy="selectin",
     )
 
     def __repr__(self) -> str:
@@ -95,12 +100,16 @@ class DQExpectation(Base, TimestampMixin):
     )
     expectation_type: Mapped[str] = mapped_column(String(50), nullable=False)
     column_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
-    threshold_config: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    threshold_config: Mapped[dict[str, Any]] = mapped_column(JSONVariant, nullable=False)
     priority: Mapped[str] = mapped_column(String(20), nullable=False, default="medium")
     is_enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
 
     # Relationships
-    config: Mapped["DQConfig"] = relationship("DQConfig", back_populates="expectations")
+    config: Mapped["DQConfig"] = relationship(
+        "DQConfig",
+        back_populates="expectations",
+        lazy="joined",
+    )
     results: Mapped[list["DQResult"]] = relationship(
         "DQResult",
         back_populates="expectation",
@@ -142,9 +151,9 @@ class DQResult(Base):
     computed_threshold_high: Mapped[float | None] = mapped_column(Float, nullable=True)
     execution_time_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
     )
 
     # Relationships
@@ -157,7 +166,6 @@ class DQResult(Base):
 
     __table_args__ = (
         UniqueConstraint("expectation_id", "snapshot_date", name="uq_dq_results_expectation_date"),
-        Index("ix_dq_results_expectation_id", "expectation_id"),
         Index("ix_dq_results_snapshot_date", "snapshot_date"),
     )
 
@@ -191,27 +199,43 @@ class DQBreach(Base, TimestampMixin):
     threshold_value: Mapped[float] = mapped_column(Float, nullable=False)
     deviation_value: Mapped[float] = mapped_column(Float, nullable=False)
     deviation_percent: Mapped[float] = mapped_column(Float, nullable=False)
-    threshold_snapshot: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    threshold_snapshot: Mapped[dict[str, Any]] = mapped_column(JSONVariant, nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="open")
     lifecycle_events: Mapped[list[dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONVariant,
         nullable=False,
         default=list,
     )
     detected_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
     )
 
     # Relationships
     expectation: Mapped["DQExpectation"] = relationship("DQExpectation", back_populates="breaches")
     result: Mapped["DQResult"] = relationship("DQResult", back_populates="breach")
+    archived_events: Mapped[list["DQBreachEvent"]] = relationship(
+        "DQBreachEvent",
+        back_populates="breach",
+        cascade="all, delete-orphan",
+        order_by="DQBreachEvent.id",
+    )
 
     __table_args__ = (
         UniqueConstraint("expectation_id", "snapshot_date", name="uq_dq_breaches_expectation_date"),
-        Index("ix_dq_breaches_expectation_id", "expectation_id"),
-        Index("ix_dq_breaches_status", "status"),
+        Index(
+            "ix_dq_breaches_status_detected",
+            "status",
+            text("detected_at DESC"),
+            postgresql_include=["expectation_id"],
+        ),
+        Index(
+            "ix_dq_breaches_open_expectation",
+            "expectation_id",
+            postgresql_where=text("status = 'open'"),
+            sqlite_where=text("status = 'open'"),
+        ),
         Index("ix_dq_breaches_snapshot_date", "snapshot_date"),
     )
 
@@ -219,6 +243,37 @@ class DQBreach(Base, TimestampMixin):
         return f"<DQBreach(id={self.id}, status={self.status!r}, direction={self.breach_direction!r})>"
 
 
+class DQBreachEvent(Base):
+    """Lifecycle event archived from a breach's inline event list.
+
+    Breaches keep their most recent MAX_LIFECYCLE_EVENTS events in
+    lifecycle_events; older events are moved here, oldest first.
+    """
+
+    __tablename__ = "dq_breach_events"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    breach_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("dq_breaches.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    changed_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    changed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Relationships
+    breach: Mapped["DQBreach"] = relationship("DQBreach", back_populates="archived_events")
+
+    __table_args__ = (
+        Index("ix_dq_breach_events_breach_id", "breach_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<DQBreachEvent(id={self.id}, breach_id={self.breach_id}, status={self.status!r})>"
+
+
 # =============================================================================
 # Pydantic Schemas
 # =============================================================================
@@ -276,7 +331,9 @@ class BreachStatusUpdate(BaseModel):
     status: Literal["acknowledged", "dismissed", "resolved"] = Field(
         ..., description="New status"
     )
-    notes: str | None = Field(None, description="Optional notes for lifecycle event")
+    notes: str | None = Field(
+        None, max_length=2000, description="Optional notes for lifecycle event"
+    )
 
 
 class LifecycleEvent(BaseModel):
@@ -293,11 +350,9 @@ class LifecycleEvent(BaseModel):
 # =============================================================================
 
 
-class DQConfigResponse(BaseModel):
+class DQConfigResponse(ORMResponse):
     """Response for a DQ config."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     object_id: int
     date_column: str | None
@@ -322,11 +377,9 @@ class DQConfigListItem(BaseModel):
     open_breach_count: int
 
 
-class DQExpectationResponse(BaseModel):
+class DQExpectationResponse(ORMResponse):
     """Response for a DQ expectation."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     config_id: int
     expectation_type: str
@@ -338,11 +391,9 @@ class DQExpectationResponse(BaseModel):
     updated_at: datetime
 
 
-class DQConfigDetailResponse(BaseModel):
+class DQConfigDetailResponse(ORMResponse):
     """Detailed DQ config response with expectations."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     object_id: int
     object_name: str
@@ -356,11 +407,9 @@ class DQConfigDetailResponse(BaseModel):
     updated_at: datetime
 
 
-class DQResultResponse(BaseModel):
+class DQResultResponse(ORMResponse):
     """Response for a DQ result."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     expectation_id: int
     snapshot_date: date
@@ -372,11 +421,9 @@ class DQResultResponse(BaseModel):
     created_at: datetime
 
 
-class BreachResponse(BaseModel):
+class BreachResponse(ORMResponse):
     """Response for a DQ breach."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     expectation_id: int
     result_id: int
@@ -403,12 +450,14 @@ class BreachDetailResponse(BreachResponse):
     column_name: str | None
     priority: str
     threshold_snapshot: dict[str, Any]
-    lifecycle_events: list[dict[str, Any]]
+    lifecycle_events: list[LifecycleEvent]
 
 
 class DQRunResultItem(BaseModel):
     """Single expectation result from a DQ run."""
 
+    model_config = ConfigDict(frozen=True)
+
     expectation_id: int
     expectation_type: str
     column_name: str | None
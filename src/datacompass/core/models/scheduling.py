@@ -3,12 +3,11 @@
 from datetime import datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.sqlite import JSON
+from pydantic import BaseModel, Field, field_validator
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from datacompass.core.models.base import Base, TimestampMixin
+from datacompass.core.models.base import Base, JSONVariant, ORMResponse, TimestampMixin
 
 
 # =============================================================================
@@ -44,8 +43,8 @@ class Schedule(Base, TimestampMixin):
     cron_expression: Mapped[str] = mapped_column(String(100), nullable=False)
     timezone: Mapped[str] = mapped_column(String(50), nullable=False, default="UTC")
     is_enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
-    next_run_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    last_run_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    next_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_run_status: Mapped[str | None] = mapped_column(String(20), nullable=True)
 
     # Relationships
@@ -55,8 +54,21 @@ class Schedule(Base, TimestampMixin):
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        # Serves the dispatch query: enabled schedules of a job type that are
+        # due. Disabled schedules are never dispatched, so they are left out.
+        Index(
+            "ix_schedules_dispatch",
+            "job_type",
+            "next_run_at",
+            postgresql_where=text("is_enabled"),
+            sqlite_where=text("is_enabled = 1"),
+        ),
+    )
+
     def __repr__(self) -> str:
-        return f"<Schedule(id={self.id}, name={self.name!r}, job_type={self.job_type!r})>"
+        v = self._repr_value
+        return f"<Schedule(id={v('id')}, name={v('name')!r}, job_type={v('job_type')!r})>"
 
 
 class ScheduleRun(Base):
@@ -73,22 +85,30 @@ class ScheduleRun(Base):
         ForeignKey("schedules.id", ondelete="CASCADE"),
         nullable=False,
     )
-    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     status: Mapped[str] = mapped_column(String(20), nullable=False)
-    result_summary: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    result_summary: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
     )
 
     # Relationships
     schedule: Mapped["Schedule"] = relationship("Schedule", back_populates="runs")
 
+    __table_args__ = (
+        # Recent runs of one schedule (detail view, run history)
+        Index("ix_schedule_runs_schedule_started", "schedule_id", "started_at"),
+        # Recent runs across schedules (hub summary) and retention pruning
+        Index("ix_schedule_runs_started_at", "started_at"),
+    )
+
     def __repr__(self) -> str:
-        return f"<ScheduleRun(id={self.id}, status={self.status!r})>"
+        v = self._repr_value
+        return f"<ScheduleRun(id={v('id')}, status={v('status')!r})>"
 
 
 class NotificationChannel(Base, TimestampMixin):
@@ -102,7 +122,7 @@ class NotificationChannel(Base, TimestampMixin):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     channel_type: Mapped[str] = mapped_column(String(20), nullable=False)
-    config: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    config: Mapped[dict[str, Any]] = mapped_column(JSONVariant, nullable=False)
     is_enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
 
     # Relationships
@@ -113,7 +133,8 @@ class NotificationChannel(Base, TimestampMixin):
     )
 
     def __repr__(self) -> str:
-        return f"<NotificationChannel(id={self.id}, name={self.name!r}, type={self.channel_type!r})>"
+        v = self._repr_value
+        return f"<NotificationChannel(id={v('id')}, name={v('name')!r}, type={v('channel_type')!r})>"
 
 
 class NotificationRule(Base, TimestampMixin):
@@ -128,7 +149,7 @@ class NotificationRule(Base, TimestampMixin):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     event_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    conditions: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    conditions: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant, nullable=True)
     channel_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("notification_channels.id", ondelete="CASCADE"),
@@ -139,11 +160,17 @@ class NotificationRule(Base, TimestampMixin):
 
     # Relationships
     channel: Mapped["NotificationChannel"] = relationship(
-        "NotificationChannel", back_populates="rules"
+        "NotificationChannel", back_populates="rules", lazy="joined"
+    )
+
+    __table_args__ = (
+        # Matches get_rules_for_event(): rules of an event type that are enabled
+        Index("ix_notification_rules_event_enabled", "event_type", "is_enabled"),
     )
 
     def __repr__(self) -> str:
-        return f"<NotificationRule(id={self.id}, name={self.name!r}, event={self.event_type!r})>"
+        v = self._repr_value
+        return f"<NotificationRule(id={v('id')}, name={v('name')!r}, event={v('event_type')!r})>"
 
 
 class NotificationLog(Base):
@@ -166,17 +193,28 @@ class NotificationLog(Base):
         nullable=True,
     )
     event_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    event_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    event_payload: Mapped[dict[str, Any]] = mapped_column(JSONVariant, nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=False)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     sent_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
+    )
+
+    __table_args__ = (
+        # Newest-first log listings, windowed status counts and pruning. With
+        # status included, PostgreSQL counts a window by status index-only.
+        Index("ix_notification_log_sent_at", "sent_at", postgresql_include=["status"]),
+        # Deleting a rule or channel sets these to NULL; without an index the
+        # database scans the whole log to find the referencing rows.
+        Index("ix_notification_log_rule_id", "rule_id"),
+        Index("ix_notification_log_channel_id", "channel_id"),
     )
 
     def __repr__(self) -> str:
-        return f"<NotificationLog(id={self.id}, event={self.event_type!r}, status={self.status!r})>"
+        v = self._repr_value
+        return f"<NotificationLog(id={v('id')}, event={v('event_type')!r}, status={v('status')!r})>"
 
 
 # =============================================================================
@@ -184,6 +222,16 @@ class NotificationLog(Base):
 # =============================================================================
 
 
+def _check_cron(value: str | None) -> str | None:
+    """Reject malformed cron expressions at schema-validation time."""
+    if value is None:
+        return None
+    # Imported here because the scheduler module imports these models.
+    from datacompass.core.scheduler.scheduler import validate_cron_expression
+
+    return validate_cron_expression(value)
+
+
 class ScheduleCreate(BaseModel):
     """Request to create a schedule."""
 
@@ -194,6 +242,8 @@ class ScheduleCreate(BaseModel):
     cron_expression: str = Field(..., description="Cron expression (e.g., '0 6 * * *')")
     timezone: str = Field("UTC", description="Timezone for cron expression")
 
+    _validate_cron = field_validator("cron_expression")(_check_cron)
+
 
 class ScheduleUpdate(BaseModel):
     """Request to update a schedule."""
@@ -204,11 +254,11 @@ class ScheduleUpdate(BaseModel):
     timezone: str | None = None
     is_enabled: bool | None = None
 
+    _validate_cron = field_validator("cron_expression")(_check_cron)
 
-class ScheduleResponse(BaseModel):
-    """Response for a schedule."""
 
-    model_config = ConfigDict(from_attributes=True)
+class ScheduleResponse(ORMResponse):
+    """Response for a schedule."""
 
     id: int
     name: str
@@ -225,11 +275,9 @@ class ScheduleResponse(BaseModel):
     updated_at: datetime
 
 
-class ScheduleRunResponse(BaseModel):
+class ScheduleRunResponse(ORMResponse):
     """Response for a schedule run."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     schedule_id: int
     started_at: datetime
@@ -297,11 +345,9 @@ class NotificationChannelUpdate(BaseModel):
     is_enabled: bool | None = None
 
 
-class NotificationChannelResponse(BaseModel):
+class NotificationChannelResponse(ORMResponse):
     """Response for a notification channel."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     name: str
     channel_type: str
@@ -337,11 +383,9 @@ class NotificationRuleUpdate(BaseModel):
     is_enabled: bool | None = None
 
 
-class NotificationRuleResponse(BaseModel):
+class NotificationRuleResponse(ORMResponse):
     """Response for a notification rule."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     name: str
     event_type: str
@@ -365,11 +409,9 @@ class NotificationRuleDetailResponse(NotificationRuleResponse):
 # =============================================================================
 
 
-class NotificationLogResponse(BaseModel):
+class NotificationLogResponse(ORMResponse):
     """Response for a notification log entry."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     rule_id: int | None
     channel_id: int | None
@@ -424,6 +466,8 @@ class YAMLSchedule(BaseModel):
     timezone: str = Field("UTC", description="Timezone")
     enabled: bool = Field(True, description="Whether schedule is enabled")
 
+    _validate_cron = field_validator("cron")(_check_cron)
+
 
 class YAMLChannel(BaseModel):
     """Notification channel as defined in YAML config file."""
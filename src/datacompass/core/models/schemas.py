@@ -3,7 +3,9 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
+
+from datacompass.core.models.base import ORMResponse
 
 # =============================================================================
 # Data Source Schemas
@@ -26,11 +28,9 @@ class DataSourceCreate(DataSourceBase):
     sync_config: dict[str, Any] | None = Field(None, description="Sync/scan configuration")
 
 
-class DataSourceResponse(DataSourceBase):
+class DataSourceResponse(DataSourceBase, ORMResponse):
     """Schema for data source responses."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     last_scan_at: datetime | None = None
     last_scan_status: str | None = None
@@ -60,11 +60,9 @@ class ForeignKeyConstraint(BaseModel):
     references_column: str
 
 
-class ColumnResponse(BaseModel):
+class ColumnResponse(ORMResponse):
     """Schema for column responses."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     column_name: str
     position: int
@@ -108,11 +106,9 @@ class CatalogObjectBase(BaseModel):
     object_type: str = Field(..., description="Type of object (TABLE, VIEW, etc.)")
 
 
-class CatalogObjectResponse(CatalogObjectBase):
+class CatalogObjectResponse(CatalogObjectBase, ORMResponse):
     """Schema for catalog object responses."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     source_id: int
     source_metadata: dict[str, Any] | None = None
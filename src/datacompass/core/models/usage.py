@@ -3,12 +3,11 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
-from sqlalchemy.dialects.sqlite import JSON
+from pydantic import BaseModel, Field
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from datacompass.core.models.base import Base, TimestampMixin
+from datacompass.core.models.base import Base, JSONVariant, ORMResponse, TimestampMixin
 
 if TYPE_CHECKING:
     from datacompass.core.models.catalog_object import CatalogObject
@@ -34,6 +33,8 @@ class UsageMetric(Base, TimestampMixin):
         ForeignKey("catalog_objects.id", ondelete="CASCADE"),
         nullable=False,
     )
+    # Stays a plain TIMESTAMP: on PostgreSQL it is the partition key of
+    # usage_metrics, whose type cannot be altered in place.
     collected_at: Mapped[datetime] = mapped_column(
         DateTime,
         nullable=False,
@@ -41,27 +42,27 @@ class UsageMetric(Base, TimestampMixin):
     )
 
     # Tier 1: Core metrics
-    row_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    size_bytes: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    read_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    write_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    row_count: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    size_bytes: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    read_count: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    write_count: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
 
     # Tier 2: Timestamp metrics
-    last_read_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    last_written_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_read_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_written_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    # Tier 3: Advanced metrics
-    distinct_users: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    query_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Tier 3: Advanced metrics. No adapter fills these yet; a NULL costs only
+    # a bit in the row's null bitmap, so they stay typed columns.
+    distinct_users: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    query_count: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
 
     # Platform-specific metrics (JSON for flexibility)
-    source_metrics: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    source_metrics: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant, nullable=True)
 
     # Relationships
     object: Mapped["CatalogObject"] = relationship("CatalogObject", back_populates="usage_metrics")
 
     __table_args__ = (
-        Index("ix_usage_metrics_object_id", "object_id"),
         Index("ix_usage_metrics_collected_at", "collected_at"),
         Index("ix_usage_metrics_object_collected", "object_id", "collected_at"),
     )
@@ -75,11 +76,9 @@ class UsageMetric(Base, TimestampMixin):
 # =============================================================================
 
 
-class UsageMetricResponse(BaseModel):
+class UsageMetricResponse(ORMResponse):
     """Response schema for a single usage metric record."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     object_id: int
     collected_at: datetime
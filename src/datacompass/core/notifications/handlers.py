@@ -4,22 +4,51 @@ Each handler implements the logic for sending notifications through
 a specific channel (email, Slack, webhook).
 """
 
+import base64
 import json
 import logging
+import random
 import smtplib
+import socket
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import Any
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
+from functools import lru_cache
+from http.client import HTTPConnection, HTTPSConnection, RemoteDisconnected
+from typing import Any, NamedTuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
 from datacompass.core.events import Event
 from datacompass.core.models.scheduling import NotificationChannel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Slack and webhook bodies are encoded once per delivery. orjson, when
+# installed (the "speedups" extra), returns UTF-8 bytes directly.
+if orjson is not None:
+
+    def _json_body(value: Any) -> bytes:
+        # NON_STR_KEYS matches json.dumps, which stringifies int keys
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+
+    def _json_body(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
 
 # =============================================================================
 # Result Type
@@ -44,6 +73,152 @@ class NotificationResult:
         return cls(success=False, error_message=message)
 
 
+# =============================================================================
+# Message Templates
+# =============================================================================
+
+
+class EventTemplate(NamedTuple):
+    """Default email subject and message for one event type."""
+
+    subject: str
+    message: str
+
+
+# Default templates per event type, filled from the event payload with
+# str.format_map. Subject and message come from one lookup.
+EVENT_TEMPLATES: dict[str, EventTemplate] = {
+    "dq_breach": EventTemplate(
+        "[Data Compass] DQ Breach: {full_name}",
+        "🚨 DQ Breach Detected\n\n"
+        "Object: {full_name}\n"
+        "Metric: {expectation_type}{column_suffix}\n"
+        "Value: {metric_value} ({direction} threshold of {threshold_value})\n"
+        "Deviation: {deviation_percent:.1f}%\n"
+        "Priority: {priority}\n"
+        "Date: {snapshot_date}",
+    ),
+    "scan_completed": EventTemplate(
+        "[Data Compass] Scan Completed: {source_name}",
+        "✅ Scan Completed\n\n"
+        "Source: {source_name}\n"
+        "Objects: {objects_discovered} discovered, {objects_updated} updated\n"
+        "Columns: {columns_discovered}\n"
+        "Duration: {duration_seconds:.1f}s",
+    ),
+    "scan_failed": EventTemplate(
+        "[Data Compass] Scan Failed: {source_name}",
+        "❌ Scan Failed\n\n"
+        "Source: {source_name}\n"
+        "Error: {error_message}",
+    ),
+    "digest": EventTemplate(
+        "[Data Compass] {count} notifications",
+        "📬 {count} notifications\n\n{message}",
+    ),
+    "deprecation_deadline": EventTemplate(
+        "[Data Compass] Deprecation Deadline: {campaign_name}",
+        "⏰ Deprecation Deadline Approaching\n\n"
+        "Campaign: {campaign_name}\n"
+        "Source: {source_name}\n"
+        "Target Date: {target_date}\n"
+        "Days Remaining: {days_remaining}\n"
+        "Objects: {object_count}",
+    ),
+}
+
+# Event type of the single event that stands in for a batch of events
+DIGEST_EVENT_TYPE = "digest"
+# Separator between the per-event messages inside a digest
+DIGEST_SEPARATOR = "\n---\n"
+
+# Values shown when a template field is missing from the payload
+_FIELD_DEFAULTS: dict[str, Any] = {
+    "full_name": "Unknown",
+    "expectation_type": "Unknown",
+    "metric_value": "N/A",
+    "threshold_value": "N/A",
+    "deviation_percent": 0,
+    "priority": "Unknown",
+    "snapshot_date": "Unknown",
+    "source_name": "Unknown",
+    "objects_discovered": 0,
+    "objects_updated": 0,
+    "columns_discovered": 0,
+    "duration_seconds": 0,
+    "error_message": "Unknown error",
+    "campaign_name": "Unknown",
+    "target_date": "Unknown",
+    "days_remaining": "Unknown",
+    "object_count": 0,
+}
+
+
+class _PayloadFields(dict[str, Any]):
+    """Event payload that falls back to _FIELD_DEFAULTS for missing keys."""
+
+    def __missing__(self, key: str) -> Any:
+        return _FIELD_DEFAULTS[key]
+
+
+class _SafeDict(dict[str, Any]):
+    """Event payload that leaves unknown placeholders in place."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+# =============================================================================
+# Dispatch Executor
+# =============================================================================
+
+# Upper bound on notifications in flight at once across all handlers. Sends
+# block on SMTP or HTTP, so threads overlap the waits on remote services.
+NOTIFICATION_DISPATCH_WORKERS = 8
+
+# Shared by every handler so worker threads are started once per process
+# rather than once per event.
+_dispatch_executor = ThreadPoolExecutor(
+    max_workers=NOTIFICATION_DISPATCH_WORKERS,
+    thread_name_prefix="notify",
+)
+
+
+# Timeout for shallow connection tests, which only open a TCP connection
+PROBE_TIMEOUT_SECONDS = 3.0
+
+
+def _probe(host: str, port: int, greeting: bytes | None = None) -> NotificationResult:
+    """Check that a host accepts TCP connections.
+
+    Args:
+        host: Hostname to connect to.
+        port: Port to connect to.
+        greeting: Expected start of the server's first line, if the
+            protocol has the server speak first (SMTP sends 220).
+
+    Returns:
+        NotificationResult indicating whether the host is reachable.
+    """
+    try:
+        with socket.create_connection((host, port), timeout=PROBE_TIMEOUT_SECONDS) as sock:
+            if greeting is not None:
+                line = sock.makefile("rb").readline(512)
+                if not line.startswith(greeting):
+                    return NotificationResult.fail(
+                        f"Unexpected greeting from {host}:{port}: {line[:80]!r}"
+                    )
+    except OSError as e:
+        return NotificationResult.fail(f"Cannot reach {host}:{port}: {e}")
+    return NotificationResult.ok()
+
+
+def _probe_url(url: str) -> NotificationResult:
+    """Check that the host of an http or https URL accepts connections."""
+    (scheme, hostname, port), _ = _parse_url(url)
+    return _probe(hostname, port or (443 if scheme == "https" else 80))
+
+
 # =============================================================================
 # Base Handler
 # =============================================================================
@@ -54,8 +229,14 @@ class BaseNotificationHandler(ABC):
 
     Subclasses implement the logic for sending notifications through
     a specific channel type.
+
+    Attributes:
+        supports_digest: Whether several events for one rule may be sent
+            as a single digest built by build_digest().
     """
 
+    supports_digest: bool = False
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the handler.
 
@@ -81,10 +262,31 @@ class BaseNotificationHandler(ABC):
         """
         pass
 
+    def send_async(
+        self,
+        event: Event,
+        template_override: str | None = None,
+    ) -> Future[NotificationResult]:
+        """Send a notification on the shared dispatch threads.
+
+        Args:
+            event: Event that triggered the notification.
+            template_override: Optional custom message template.
+
+        Returns:
+            Future that resolves to the NotificationResult.
+        """
+        return _dispatch_executor.submit(self.send, event, template_override)
+
     @abstractmethod
-    def test_connection(self) -> NotificationResult:
+    def test_connection(self, deep: bool = True) -> NotificationResult:
         """Test the connection to the notification channel.
 
+        Args:
+            deep: Exercise the channel end to end (TLS, login, a test
+                request). When False, only check that the host accepts
+                connections, which costs a single round trip.
+
         Returns:
             NotificationResult indicating success or failure.
         """
@@ -105,14 +307,48 @@ class BaseNotificationHandler(ABC):
             Formatted message string.
         """
         if template_override:
-            # Simple template substitution
-            message = template_override
-            for key, value in event.payload.items():
-                message = message.replace(f"{{{key}}}", str(value))
-            return message
+            # Fill every placeholder in one pass over the template
+            try:
+                return template_override.format_map(_SafeDict(event.payload))
+            except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+                # Stray braces or format specs that don't suit the value:
+                # substitute the plain {key} placeholders only
+                message = template_override
+                for key, value in event.payload.items():
+                    message = message.replace(f"{{{key}}}", str(value))
+                return message
 
         return self._default_format(event)
 
+    def build_digest(
+        self,
+        events: list[Event],
+        template_override: str | None = None,
+    ) -> Event:
+        """Combine several events into one digest event.
+
+        The digest's message lists each event's formatted message, so
+        sending it costs one message instead of one per event. Only used
+        for handlers with supports_digest set.
+
+        Args:
+            events: Events to combine, in the order they are listed.
+            template_override: Optional custom template for each event.
+
+        Returns:
+            Event of type DIGEST_EVENT_TYPE carrying the combined message.
+        """
+        return Event(
+            event_type=DIGEST_EVENT_TYPE,
+            payload={
+                "count": len(events),
+                "events": [event.to_dict() for event in events],
+                "message": DIGEST_SEPARATOR.join(
+                    self.format_message(event, template_override) for event in events
+                ),
+            },
+        )
+
     def _default_format(self, event: Event) -> str:
         """Create default message format for an event.
 
@@ -122,56 +358,454 @@ class BaseNotificationHandler(ABC):
         Returns:
             Default formatted message.
         """
-        event_type = event.event_type
-        payload = event.payload
-
-        if event_type == "dq_breach":
-            direction = "above" if payload.get("breach_direction") == "high" else "below"
+        template = EVENT_TEMPLATES.get(event.event_type)
+        if template is None:
+            # Generic format for unknown event types
             return (
-                f"🚨 DQ Breach Detected\n\n"
-                f"Object: {payload.get('full_name', 'Unknown')}\n"
-                f"Metric: {payload.get('expectation_type', 'Unknown')}"
-                f"{' (' + payload.get('column_name') + ')' if payload.get('column_name') else ''}\n"
-                f"Value: {payload.get('metric_value', 'N/A')} ({direction} threshold of {payload.get('threshold_value', 'N/A')})\n"
-                f"Deviation: {payload.get('deviation_percent', 0):.1f}%\n"
-                f"Priority: {payload.get('priority', 'Unknown')}\n"
-                f"Date: {payload.get('snapshot_date', 'Unknown')}"
+                f"📢 {event.event_type}\n\n"
+                f"Timestamp: {event.timestamp.isoformat()}\n"
+                f"Details: {json.dumps(event.payload, indent=2)}"
             )
 
-        elif event_type == "scan_completed":
-            return (
-                f"✅ Scan Completed\n\n"
-                f"Source: {payload.get('source_name', 'Unknown')}\n"
-                f"Objects: {payload.get('objects_discovered', 0)} discovered, "
-                f"{payload.get('objects_updated', 0)} updated\n"
-                f"Columns: {payload.get('columns_discovered', 0)}\n"
-                f"Duration: {payload.get('duration_seconds', 0):.1f}s"
-            )
+        fields = _PayloadFields(event.payload)
+        if event.event_type == "dq_breach":
+            fields["direction"] = "above" if fields.get("breach_direction") == "high" else "below"
+            column_name = fields.get("column_name")
+            fields["column_suffix"] = f" ({column_name})" if column_name else ""
+        return template.message.format_map(fields)
 
-        elif event_type == "scan_failed":
-            return (
-                f"❌ Scan Failed\n\n"
-                f"Source: {payload.get('source_name', 'Unknown')}\n"
-                f"Error: {payload.get('error_message', 'Unknown error')}"
-            )
 
-        elif event_type == "deprecation_deadline":
-            return (
-                f"⏰ Deprecation Deadline Approaching\n\n"
-                f"Campaign: {payload.get('campaign_name', 'Unknown')}\n"
-                f"Source: {payload.get('source_name', 'Unknown')}\n"
-                f"Target Date: {payload.get('target_date', 'Unknown')}\n"
-                f"Days Remaining: {payload.get('days_remaining', 'Unknown')}\n"
-                f"Objects: {payload.get('object_count', 0)}"
-            )
+# =============================================================================
+# SMTP Connection Pool
+# =============================================================================
+
+SMTP_POOL_MAX_IDLE = 4
+SMTP_POOL_IDLE_SECONDS = 60.0
+SMTP_POOL_MAX_MESSAGES = 100
+SMTP_POOL_VERIFY_AFTER_SECONDS = 2.0
+
+
+class SMTPConnectionPool:
+    """Reuses authenticated SMTP connections across email notifications.
+
+    Opening a connection costs a TCP handshake, STARTTLS and AUTH. Idle
+    connections are kept per server and credentials, checked with NOOP
+    before reuse, and dropped once idle longer than the server is likely
+    to keep them open. The NOOP round trip is skipped for a connection
+    released moments ago, so a burst of alerts pays only for MAIL, RCPT
+    and DATA per message. A connection is also retired after a fixed number of
+    messages, since many providers cap messages per session.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = SMTP_POOL_MAX_IDLE,
+        idle_seconds: float = SMTP_POOL_IDLE_SECONDS,
+        max_messages: int = SMTP_POOL_MAX_MESSAGES,
+        verify_after: float = SMTP_POOL_VERIFY_AFTER_SECONDS,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_idle: Idle connections kept per server and credentials.
+            idle_seconds: Idle time after which a connection is discarded.
+            max_messages: Borrows after which a connection is closed rather
+                than returned to the pool.
+            verify_after: Idle time after which a connection is checked
+                with NOOP before reuse.
+        """
+        self._max_idle = max_idle
+        self._idle_seconds = idle_seconds
+        self._max_messages = max_messages
+        self._verify_after = verify_after
+        # Per key: (connection, released_at, times borrowed)
+        self._idle: dict[tuple[Any, ...], list[tuple[smtplib.SMTP, float, int]]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(
+        self,
+        host: str,
+        port: int,
+        user: str | None,
+        password: str | None,
+        use_tls: bool,
+    ) -> Iterator[smtplib.SMTP]:
+        """Borrow a ready-to-send SMTP connection.
+
+        The connection is returned to the pool when the block exits
+        normally and closed if it raises. Each borrow counts as one message
+        towards the per-connection cap.
+
+        Args:
+            host: SMTP server hostname.
+            port: SMTP server port.
+            user: SMTP username, if the server requires AUTH.
+            password: SMTP password.
+            use_tls: Whether to upgrade the connection with STARTTLS.
+
+        Yields:
+            Connected, authenticated smtplib.SMTP instance.
+        """
+        key = (host, port, user, password, use_tls)
+        server, uses = self._checkout(key)
+        if server is None:
+            server = smtplib.SMTP(host, port, timeout=30)
+            try:
+                if use_tls:
+                    server.starttls()
+                if user and password:
+                    server.login(user, password)
+            except Exception:
+                self._close(server)
+                raise
+
+        try:
+            yield server
+        except Exception:
+            self._close(server)
+            raise
+
+        uses += 1
+        if uses < self._max_messages:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self._max_idle:
+                    idle.append((server, time.monotonic(), uses))
+                    return
+        self._close(server)
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle = [entry[0] for entries in self._idle.values() for entry in entries]
+            self._idle.clear()
+        for server in idle:
+            self._close(server)
+
+    def _checkout(self, key: tuple[Any, ...]) -> tuple[smtplib.SMTP | None, int]:
+        """Take a live idle connection and its borrow count, discarding stale ones."""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None, 0
+                server, released_at, uses = idle.pop()
+
+            idle_for = time.monotonic() - released_at
+            if idle_for <= self._verify_after:
+                return server, uses
+            if idle_for <= self._idle_seconds:
+                try:
+                    if server.noop()[0] == 250:
+                        return server, uses
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self._close(server)
+
+    @staticmethod
+    def _close(server: smtplib.SMTP) -> None:
+        """Close a connection, quietly if the server already hung up."""
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+_smtp_pool = SMTPConnectionPool()
+
+
+# =============================================================================
+# HTTP Connection Pool
+# =============================================================================
+
+# One idle connection per dispatch thread, so a fan-out that posts to the
+# same host from every worker at once finds all of them warm next time.
+HTTP_POOL_MAX_IDLE = NOTIFICATION_DISPATCH_WORKERS
+HTTP_POOL_IDLE_SECONDS = 30.0
+
+# Raised when a keep-alive connection was closed by the server while idle
+_STALE_CONNECTION_ERRORS = (
+    RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+HTTP_URL_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=HTTP_URL_CACHE_SIZE)
+def _parse_url(url: str) -> tuple[tuple[str, str, int | None], str]:
+    """Split a webhook URL into its pool key and request path.
+
+    Channels post to the same few URLs over and over, so the split is
+    cached per URL.
+
+    Args:
+        url: Absolute http or https URL.
+
+    Returns:
+        Tuple of ((scheme, hostname, port), path with query string).
+
+    Raises:
+        ValueError: If the URL is not http or https.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"Unsupported webhook URL: {url}")
+
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return (parts.scheme, parts.hostname, parts.port), path
+
+
+class _Proxy(NamedTuple):
+    """Forward proxy a request is routed through."""
+
+    url: str
+    host: str
+    port: int | None
+    headers: dict[str, str]
+
+
+def _proxy_for(scheme: str, hostname: str) -> _Proxy | None:
+    """Find the proxy for a host from the environment, as urlopen does.
+
+    Honours the http_proxy, https_proxy and no_proxy variables, including
+    credentials embedded in the proxy URL.
+
+    Args:
+        scheme: Target URL scheme.
+        hostname: Target host name.
+
+    Returns:
+        Proxy to route through, or None to connect directly.
+    """
+    proxy_url = getproxies().get(scheme)
+    if not proxy_url or proxy_bypass(hostname):
+        return None
+
+    parts = urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+    if not parts.hostname:
+        return None
+    headers: dict[str, str] = {}
+    if parts.username:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        token = base64.b64encode(credentials.encode()).decode("ascii")
+        headers["Proxy-Authorization"] = f"Basic {token}"
+    return _Proxy(proxy_url, parts.hostname, parts.port, headers)
+
 
+# Pooled connections are keyed by target and by the proxy they go through
+_PoolKey = tuple[tuple[str, str, int | None], str | None]
+
+
+class HTTPConnectionPool:
+    """Keeps webhook connections alive between notifications.
+
+    urlopen opens a new TCP connection, and for HTTPS a new TLS session,
+    for every request. Slack and generic webhooks usually receive many
+    notifications for the same host, so connections are kept per scheme,
+    host and port and reused while the server allows keep-alive.
+
+    Proxies from the environment are honoured like urlopen does: HTTPS
+    is tunnelled with CONNECT and plain HTTP is forwarded by absolute URL.
+    Redirects are not followed; callers see the 3xx status.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = HTTP_POOL_MAX_IDLE,
+        idle_seconds: float = HTTP_POOL_IDLE_SECONDS,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_idle: Idle connections kept per host.
+            idle_seconds: Idle time after which a connection is discarded.
+        """
+        self._max_idle = max_idle
+        self._idle_seconds = idle_seconds
+        self._idle: dict[_PoolKey, list[tuple[HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 30,
+    ) -> tuple[int, str]:
+        """Send a request and read the full response.
+
+        A request on a reused connection that the server has since closed
+        is retried once on a new connection.
+
+        Args:
+            method: HTTP method.
+            url: Absolute http or https URL.
+            body: Request body.
+            headers: Request headers.
+            timeout: Socket timeout in seconds.
+
+        Returns:
+            Tuple of (status code, reason phrase).
+
+        Raises:
+            ValueError: If the URL is not http or https.
+            OSError: If the connection fails.
+        """
+        target, path = _parse_url(url)
+        scheme, hostname, port = target
+        headers = headers or {}
+
+        proxy = _proxy_for(scheme, hostname)
+        key = (target, proxy.url if proxy else None)
+        if proxy is not None and scheme == "http":
+            path = url
+            headers = {**headers, **proxy.headers}
+
+        conn = self._checkout(key)
+        if conn is not None:
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                return self._send(key, conn, method, path, body, headers)
+            except _STALE_CONNECTION_ERRORS:
+                logger.debug(f"Reconnecting to {hostname} after idle disconnect")
+
+        if proxy is None:
+            conn_class = HTTPSConnection if scheme == "https" else HTTPConnection
+            conn = conn_class(hostname, port, timeout=timeout)
+        elif scheme == "https":
+            conn = HTTPSConnection(proxy.host, proxy.port, timeout=timeout)
+            conn.set_tunnel(hostname, port, headers=proxy.headers)
         else:
-            # Generic format for unknown event types
-            return (
-                f"📢 {event_type}\n\n"
-                f"Timestamp: {event.timestamp.isoformat()}\n"
-                f"Details: {json.dumps(payload, indent=2)}"
+            conn = HTTPConnection(proxy.host, proxy.port, timeout=timeout)
+        return self._send(key, conn, method, path, body, headers)
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle = [conn for entries in self._idle.values() for conn, _ in entries]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+    def _send(
+        self,
+        key: _PoolKey,
+        conn: HTTPConnection,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[int, str]:
+        """Send one request on a connection, then pool or close it."""
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            # The body must be consumed before the connection can be reused
+            response.read()
+        except Exception:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self._max_idle:
+                    idle.append((conn, time.monotonic()))
+                    return response.status, response.reason
+            conn.close()
+        return response.status, response.reason
+
+    def _checkout(self, key: _PoolKey) -> HTTPConnection | None:
+        """Take a recently used idle connection for a key, closing stale ones."""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                conn, released_at = idle.pop()
+
+            if time.monotonic() - released_at <= self._idle_seconds:
+                return conn
+            conn.close()
+
+
+_http_pool = HTTPConnectionPool()
+
+# Retry policy for notification POSTs. Only responses that signal a
+# temporary condition are retried; other errors fail at once.
+HTTP_RETRY_ATTEMPTS = 4
+HTTP_RETRY_DEADLINE_SECONDS = 60.0
+HTTP_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Connection failures worth retrying. DNS errors and refused connections
+# usually mean a misconfigured URL and fail at once.
+_RETRY_CONNECTION_ERRORS = (ConnectionResetError, ConnectionAbortedError, TimeoutError)
+
+
+def _request_with_retry(
+    method: str,
+    url: str,
+    body: bytes | None,
+    headers: dict[str, str],
+    timeout: float,
+    max_attempts: int = HTTP_RETRY_ATTEMPTS,
+) -> tuple[int, str]:
+    """Send a request through the pool, retrying transient failures.
+
+    Retries dropped or timed-out connections and HTTP_RETRY_STATUSES with
+    exponential backoff and jitter, giving up early rather than sleeping
+    past HTTP_RETRY_DEADLINE_SECONDS.
+
+    Args:
+        method: HTTP method.
+        url: Absolute http or https URL.
+        body: Request body.
+        headers: Request headers.
+        timeout: Socket timeout per attempt in seconds.
+        max_attempts: Total attempts, including the first.
+
+    Returns:
+        Tuple of (status code, reason phrase) from the last attempt.
+
+    Raises:
+        OSError: If the last attempt could not connect.
+    """
+    deadline = time.monotonic() + HTTP_RETRY_DEADLINE_SECONDS
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            status, reason = _http_pool.request(
+                method, url, body=body, headers=headers, timeout=timeout
             )
+        except _RETRY_CONNECTION_ERRORS:
+            if not _wait_before_retry(attempt, max_attempts, deadline):
+                raise
+        else:
+            if status not in HTTP_RETRY_STATUSES or not _wait_before_retry(
+                attempt, max_attempts, deadline
+            ):
+                return status, reason
+
+
+def _wait_before_retry(attempt: int, max_attempts: int, deadline: float) -> bool:
+    """Sleep before the next attempt, or return False if there is none."""
+    if attempt >= max_attempts:
+        return False
+    delay = min(30.0, 0.5 * 2 ** (attempt - 1)) + random.uniform(0, 0.25)
+    if time.monotonic() + delay > deadline:
+        return False
+    time.sleep(delay)
+    return True
 
 
 # =============================================================================
@@ -182,6 +816,18 @@ class BaseNotificationHandler(ABC):
 class EmailHandler(BaseNotificationHandler):
     """Handler for sending email notifications via SMTP."""
 
+    supports_digest = True
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialize the handler.
+
+        Args:
+            config: Channel-specific configuration.
+        """
+        super().__init__(config)
+        # The recipient header is the same for every message on this channel
+        self._to_header = ", ".join(config.get("to_addresses", []))
+
     def send(
         self,
         event: Event,
@@ -212,19 +858,29 @@ class EmailHandler(BaseNotificationHandler):
             message = self.format_message(event, template_override)
             subject = self._get_subject(event)
 
-            msg = MIMEMultipart()
+            # A single text/plain part; no multipart container is needed.
+            # sendmail() passes bytes through untouched, so the SMTP policy
+            # writes the CRLF line endings the protocol requires.
+            msg = EmailMessage(policy=SMTP_POLICY)
             msg["From"] = from_address
-            msg["To"] = ", ".join(to_addresses)
+            msg["To"] = self._to_header
             msg["Subject"] = subject
-            msg.attach(MIMEText(message, "plain"))
-
-            # Send email
-            with smtplib.SMTP(smtp_host, smtp_port) as server:
-                if use_tls:
-                    server.starttls()
-                if smtp_user and smtp_password:
-                    server.login(smtp_user, smtp_password)
-                server.sendmail(from_address, to_addresses, msg.as_string())
+            msg.set_content(message, cte="quoted-printable")
+            raw_message = msg.as_bytes()
+
+            # Send email over a pooled connection. The server may have dropped
+            # a reused connection since it was last checked, so a disconnect
+            # is retried once on another connection.
+            for attempt in range(2):
+                try:
+                    with _smtp_pool.connection(
+                        smtp_host, smtp_port, smtp_user, smtp_password, use_tls
+                    ) as server:
+                        server.sendmail(from_address, to_addresses, raw_message)
+                    break
+                except smtplib.SMTPServerDisconnected:
+                    if attempt:
+                        raise
 
             logger.info(f"Email sent successfully for event {event.event_type}")
             return NotificationResult.ok()
@@ -238,9 +894,12 @@ class EmailHandler(BaseNotificationHandler):
             logger.error(error_msg)
             return NotificationResult.fail(error_msg)
 
-    def test_connection(self) -> NotificationResult:
+    def test_connection(self, deep: bool = True) -> NotificationResult:
         """Test SMTP connection.
 
+        Args:
+            deep: Run STARTTLS and LOGIN; otherwise only read the greeting.
+
         Returns:
             NotificationResult indicating success or failure.
         """
@@ -253,6 +912,8 @@ class EmailHandler(BaseNotificationHandler):
 
             if not smtp_host:
                 return NotificationResult.fail("Missing SMTP host configuration")
+            if not deep:
+                return _probe(smtp_host, smtp_port, greeting=b"220")
 
             with smtplib.SMTP(smtp_host, smtp_port, timeout=10) as server:
                 if use_tls:
@@ -276,19 +937,10 @@ class EmailHandler(BaseNotificationHandler):
         Returns:
             Email subject line.
         """
-        event_type = event.event_type
-        payload = event.payload
-
-        if event_type == "dq_breach":
-            return f"[Data Compass] DQ Breach: {payload.get('full_name', 'Unknown')}"
-        elif event_type == "scan_completed":
-            return f"[Data Compass] Scan Completed: {payload.get('source_name', 'Unknown')}"
-        elif event_type == "scan_failed":
-            return f"[Data Compass] Scan Failed: {payload.get('source_name', 'Unknown')}"
-        elif event_type == "deprecation_deadline":
-            return f"[Data Compass] Deprecation Deadline: {payload.get('campaign_name', 'Unknown')}"
-        else:
-            return f"[Data Compass] {event_type}"
+        template = EVENT_TEMPLATES.get(event.event_type)
+        if template is None:
+            return f"[Data Compass] {event.event_type}"
+        return template.subject.format_map(_PayloadFields(event.payload))
 
 
 # =============================================================================
@@ -296,9 +948,56 @@ class EmailHandler(BaseNotificationHandler):
 # =============================================================================
 
 
+# Slack truncates message text beyond this many characters
+SLACK_TEXT_LIMIT = 40_000
+
+
+def _split_text(text: str, limit: int) -> list[str]:
+    """Split text into chunks no longer than limit.
+
+    Chunks break on a digest separator where possible, then on a newline,
+    and only cut mid-line when a single line is longer than the limit.
+
+    Args:
+        text: Text to split.
+        limit: Maximum length of each chunk.
+
+    Returns:
+        Chunks in order; a single chunk when the text already fits.
+    """
+    chunks: list[str] = []
+    while len(text) > limit:
+        skip = len(DIGEST_SEPARATOR)
+        cut = text.rfind(DIGEST_SEPARATOR, 0, limit + skip)
+        if cut <= 0:
+            cut = text.rfind("\n", 0, limit + 1)
+            skip = 1
+        if cut <= 0:
+            cut, skip = limit, 0
+        chunks.append(text[:cut])
+        text = text[cut + skip :]
+    chunks.append(text)
+    return chunks
+
+
 class SlackHandler(BaseNotificationHandler):
     """Handler for sending Slack notifications via webhook."""
 
+    supports_digest = True
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialize the handler.
+
+        Args:
+            config: Channel-specific configuration.
+        """
+        super().__init__(config)
+        self._webhook_url: str | None = config.get("webhook_url")
+        # Overrides sent alongside the text of every message
+        self._payload_fields = {
+            key: config[key] for key in ("channel", "username", "icon_emoji") if config.get(key)
+        }
+
     def send(
         self,
         event: Event,
@@ -314,45 +1013,35 @@ class SlackHandler(BaseNotificationHandler):
             NotificationResult indicating success or failure.
         """
         try:
-            webhook_url = self.config.get("webhook_url")
-            if not webhook_url:
+            if not self._webhook_url:
                 return NotificationResult.fail("Missing Slack webhook URL")
 
             message = self.format_message(event, template_override)
 
-            # Build Slack payload
-            slack_payload: dict[str, Any] = {"text": message}
-
-            if self.config.get("channel"):
-                slack_payload["channel"] = self.config["channel"]
-            if self.config.get("username"):
-                slack_payload["username"] = self.config["username"]
-            if self.config.get("icon_emoji"):
-                slack_payload["icon_emoji"] = self.config["icon_emoji"]
-
-            # Send to Slack
-            data = json.dumps(slack_payload).encode("utf-8")
-            request = Request(
-                webhook_url,
-                data=data,
-                headers={"Content-Type": "application/json"},
-            )
-
-            with urlopen(request, timeout=30) as response:
-                if response.status != 200:
-                    return NotificationResult.fail(
-                        f"Slack API returned status {response.status}"
-                    )
+            # Long digests go out as several messages, split between events
+            for text in _split_text(message, SLACK_TEXT_LIMIT):
+                # Send to Slack over a kept-alive connection
+                data = _json_body({"text": text, **self._payload_fields})
+                status, reason = _request_with_retry(
+                    "POST",
+                    self._webhook_url,
+                    body=data,
+                    headers={"Content-Type": "application/json"},
+                    timeout=30,
+                )
+
+                if status >= 400:
+                    error_msg = f"Slack API error: {status} {reason}"
+                    logger.error(error_msg)
+                    return NotificationResult.fail(error_msg)
+                if status != 200:
+                    return NotificationResult.fail(f"Slack API returned status {status}")
 
             logger.info(f"Slack notification sent successfully for event {event.event_type}")
             return NotificationResult.ok()
 
-        except HTTPError as e:
-            error_msg = f"Slack API error: {e.code} {e.reason}"
-            logger.error(error_msg)
-            return NotificationResult.fail(error_msg)
-        except URLError as e:
-            error_msg = f"Slack connection error: {e.reason}"
+        except OSError as e:
+            error_msg = f"Slack connection error: {e}"
             logger.error(error_msg)
             return NotificationResult.fail(error_msg)
         except Exception as e:
@@ -360,9 +1049,12 @@ class SlackHandler(BaseNotificationHandler):
             logger.error(error_msg)
             return NotificationResult.fail(error_msg)
 
-    def test_connection(self) -> NotificationResult:
+    def test_connection(self, deep: bool = True) -> NotificationResult:
         """Test Slack webhook connection.
 
+        Args:
+            deep: Post a test message; otherwise only connect to the host.
+
         Returns:
             NotificationResult indicating success or failure.
         """
@@ -370,10 +1062,12 @@ class SlackHandler(BaseNotificationHandler):
             webhook_url = self.config.get("webhook_url")
             if not webhook_url:
                 return NotificationResult.fail("Missing Slack webhook URL")
+            if not deep:
+                return _probe_url(webhook_url)
 
             # Send a test message
             test_payload = {"text": "🔔 Data Compass notification test"}
-            data = json.dumps(test_payload).encode("utf-8")
+            data = _json_body(test_payload)
             request = Request(
                 webhook_url,
                 data=data,
@@ -401,9 +1095,30 @@ class SlackHandler(BaseNotificationHandler):
 # =============================================================================
 
 
+# Methods whose requests carry the JSON payload as a body
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+
 class WebhookHandler(BaseNotificationHandler):
     """Handler for sending notifications to generic webhooks."""
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialize the handler.
+
+        Args:
+            config: Channel-specific configuration.
+        """
+        super().__init__(config)
+        # Resolved once; a handler sends every delivery for its channel
+        self._url: str | None = config.get("url")
+        self._method: str = config.get("method", "POST")
+        self._method_has_body = self._method in _BODY_METHODS
+        self._timeout = config.get("timeout_seconds", 30)
+        self._headers: dict[str, str] = {
+            "Content-Type": "application/json",
+            **config.get("headers", {}),
+        }
+
     def send(
         self,
         event: Event,
@@ -419,49 +1134,37 @@ class WebhookHandler(BaseNotificationHandler):
             NotificationResult indicating success or failure.
         """
         try:
-            url = self.config.get("url")
-            if not url:
+            if not self._url:
                 return NotificationResult.fail("Missing webhook URL")
 
-            method = self.config.get("method", "POST")
-            headers = self.config.get("headers", {})
-            timeout = self.config.get("timeout_seconds", 30)
-
-            # Build payload
-            payload = {
-                "event": event.to_dict(),
-                "message": self.format_message(event, template_override),
-            }
-
-            # Merge default headers
-            request_headers = {
-                "Content-Type": "application/json",
-                **headers,
-            }
-
-            data = json.dumps(payload).encode("utf-8")
-            request = Request(
-                url,
-                data=data if method in ("POST", "PUT", "PATCH") else None,
-                headers=request_headers,
-                method=method,
+            data = None
+            if self._method_has_body:
+                data = _json_body(
+                    {
+                        "event": event.to_dict(),
+                        "message": self.format_message(event, template_override),
+                    }
+                )
+
+            status, reason = _request_with_retry(
+                self._method,
+                self._url,
+                body=data,
+                headers=self._headers,
+                timeout=self._timeout,
             )
 
-            with urlopen(request, timeout=timeout) as response:
-                if response.status >= 400:
-                    return NotificationResult.fail(
-                        f"Webhook returned status {response.status}"
-                    )
+            # Redirects are not followed, so a 3xx never reached the endpoint
+            if status >= 300:
+                error_msg = f"Webhook HTTP error: {status} {reason}"
+                logger.error(error_msg)
+                return NotificationResult.fail(error_msg)
 
             logger.info(f"Webhook notification sent successfully for event {event.event_type}")
             return NotificationResult.ok()
 
-        except HTTPError as e:
-            error_msg = f"Webhook HTTP error: {e.code} {e.reason}"
-            logger.error(error_msg)
-            return NotificationResult.fail(error_msg)
-        except URLError as e:
-            error_msg = f"Webhook connection error: {e.reason}"
+        except OSError as e:
+            error_msg = f"Webhook connection error: {e}"
             logger.error(error_msg)
             return NotificationResult.fail(error_msg)
         except Exception as e:
@@ -469,12 +1172,16 @@ class WebhookHandler(BaseNotificationHandler):
             logger.error(error_msg)
             return NotificationResult.fail(error_msg)
 
-    def test_connection(self) -> NotificationResult:
+    def test_connection(self, deep: bool = True) -> NotificationResult:
         """Test webhook connection.
 
         Note: This sends a HEAD request to check connectivity without
         triggering any action on the webhook endpoint.
 
+        Args:
+            deep: Send the HEAD (or GET) request; otherwise only connect
+                to the host.
+
         Returns:
             NotificationResult indicating success or failure.
         """
@@ -482,6 +1189,8 @@ class WebhookHandler(BaseNotificationHandler):
             url = self.config.get("url")
             if not url:
                 return NotificationResult.fail("Missing webhook URL")
+            if not deep:
+                return _probe_url(url)
 
             timeout = self.config.get("timeout_seconds", 30)
             headers = self.config.get("headers", {})
@@ -520,6 +1229,13 @@ class WebhookHandler(BaseNotificationHandler):
 # =============================================================================
 
 
+HANDLERS_BY_CHANNEL_TYPE: dict[str, type[BaseNotificationHandler]] = {
+    "email": EmailHandler,
+    "slack": SlackHandler,
+    "webhook": WebhookHandler,
+}
+
+
 def get_handler_for_channel(channel: NotificationChannel) -> BaseNotificationHandler:
     """Get the appropriate handler for a notification channel.
 
@@ -532,13 +1248,7 @@ def get_handler_for_channel(channel: NotificationChannel) -> BaseNotificationHan
     Raises:
         ValueError: If channel type is not supported.
     """
-    handlers = {
-        "email": EmailHandler,
-        "slack": SlackHandler,
-        "webhook": WebhookHandler,
-    }
-
-    handler_class = handlers.get(channel.channel_type)
+    handler_class = HANDLERS_BY_CHANNEL_TYPE.get(channel.channel_type)
     if handler_class is None:
         raise ValueError(f"Unsupported channel type: {channel.channel_type}")
 
@@ -1,13 +1,53 @@
 """Repository for authentication operations."""
 
 from datetime import datetime
+from typing import Any, TypeVar, cast
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, delete, or_, select
+from sqlalchemy.orm import Session as DbSession
 from sqlalchemy.orm import joinedload
 
 from datacompass.core.models.auth import APIKey, RefreshToken, Session, User
 from datacompass.core.repositories.base import BaseRepository
 
+LookupT = TypeVar("LookupT", User, APIKey)
+
+# Key in Session.info holding lookup value -> primary key for this session
+LOOKUP_IDS_INFO_KEY = "auth_lookup_ids"
+
+
+def _cached_lookup(
+    session: DbSession, model: type[LookupT], key: tuple[Any, ...]
+) -> LookupT | None:
+    """Return the instance a previous lookup in this session resolved to.
+
+    Only the primary key is remembered, so the instance comes from the
+    session's identity map and reflects any changes made since. Callers
+    must re-check the lookup predicate against the returned instance.
+
+    Args:
+        session: Database session the lookup ran in.
+        model: Model class that was looked up.
+        key: Lookup value, e.g. ``("email", "a@example.com")``.
+
+    Returns:
+        Model instance, or None if the key was never resolved.
+    """
+    ids = session.info.get(LOOKUP_IDS_INFO_KEY)
+    if not ids or (model, *key) not in ids:
+        return None
+    return session.get(model, ids[(model, *key)])
+
+
+def _remember_lookup(
+    session: DbSession, key: tuple[Any, ...], entity: LookupT | None
+) -> LookupT | None:
+    """Record the primary key a lookup resolved to and return the entity."""
+    if entity is not None:
+        ids = session.info.setdefault(LOOKUP_IDS_INFO_KEY, {})
+        ids[(type(entity), *key)] = entity.id
+    return entity
+
 
 class UserRepository(BaseRepository[User]):
     """Repository for User CRUD operations."""
@@ -17,14 +57,22 @@ class UserRepository(BaseRepository[User]):
     def get_by_email(self, email: str) -> User | None:
         """Get user by email address.
 
+        Repeated lookups in the same session are answered from the
+        identity map without another query.
+
         Args:
             email: Email address to search for.
 
         Returns:
             User instance or None if not found.
         """
+        key = ("email", email)
+        user = _cached_lookup(self.session, User, key)
+        if user is not None and user.email == email:
+            return user
+
         stmt = select(User).where(User.email == email)
-        return self.session.scalar(stmt)
+        return _remember_lookup(self.session, key, self.session.scalar(stmt))
 
     def get_by_external_id(self, provider: str, external_id: str) -> User | None:
         """Get user by external provider and ID.
@@ -36,11 +84,20 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None if not found.
         """
+        key = ("external_id", provider, external_id)
+        user = _cached_lookup(self.session, User, key)
+        if (
+            user is not None
+            and user.external_provider == provider
+            and user.external_id == external_id
+        ):
+            return user
+
         stmt = select(User).where(
             User.external_provider == provider,
             User.external_id == external_id,
         )
-        return self.session.scalar(stmt)
+        return _remember_lookup(self.session, key, self.session.scalar(stmt))
 
     def create(
         self,
@@ -95,6 +152,15 @@ class UserRepository(BaseRepository[User]):
 
         return list(self.session.scalars(stmt))
 
+    def get_inactive_ids(self) -> list[int]:
+        """Get the IDs of all deactivated users.
+
+        Returns:
+            List of user IDs, in ascending order.
+        """
+        stmt = select(User.id).where(User.is_active == False).order_by(User.id)  # noqa: E712
+        return list(self.session.scalars(stmt))
+
     def update_last_login(self, user_id: int) -> User | None:
         """Update user's last login timestamp.
 
@@ -187,6 +253,41 @@ class APIKeyRepository(BaseRepository[APIKey]):
         )
         return self.session.scalar(stmt)
 
+    def get_active_by_prefix(self, prefix: str) -> APIKey | None:
+        """Get an active, unexpired API key by prefix.
+
+        The is_active predicate matches the partial ix_api_keys_key_prefix
+        index, so revoked keys are never read on the authentication path.
+        A key already resolved in this session is re-checked in Python
+        instead of being queried again.
+
+        Args:
+            prefix: Key prefix to search for.
+
+        Returns:
+            APIKey instance or None if no usable key has this prefix.
+        """
+        key = ("active_prefix", prefix)
+        api_key = _cached_lookup(self.session, APIKey, key)
+        if (
+            api_key is not None
+            and api_key.key_prefix == prefix
+            and api_key.is_active
+            and (api_key.expires_at is None or api_key.expires_at > datetime.utcnow())
+        ):
+            return api_key
+
+        stmt = (
+            select(APIKey)
+            .options(joinedload(APIKey.user))
+            .where(
+                APIKey.key_prefix == prefix,
+                APIKey.is_active == True,  # noqa: E712
+                or_(APIKey.expires_at.is_(None), APIKey.expires_at > datetime.utcnow()),
+            )
+        )
+        return _remember_lookup(self.session, key, self.session.scalar(stmt))
+
     def list_by_user(self, user_id: int, include_inactive: bool = False) -> list[APIKey]:
         """List API keys for a user.
 
@@ -213,7 +314,7 @@ class APIKeyRepository(BaseRepository[APIKey]):
         user_id: int,
         name: str,
         key_prefix: str,
-        key_hash: str,
+        key_hash: bytes,
         scopes: list[str] | None = None,
         expires_at: datetime | None = None,
     ) -> APIKey:
@@ -223,7 +324,7 @@ class APIKeyRepository(BaseRepository[APIKey]):
             user_id: ID of the owning user.
             name: Descriptive name for the key.
             key_prefix: First characters of key for identification.
-            key_hash: Hash of the full key.
+            key_hash: SHA-256 digest of the full key.
             scopes: Optional list of permission scopes.
             expires_at: Optional expiration timestamp.
 
@@ -280,7 +381,7 @@ class SessionRepository(BaseRepository[Session]):
 
     model = Session
 
-    def get_active(self, session_id: str) -> Session | None:
+    def get_active(self, session_id: bytes) -> Session | None:
         """Get an active (non-expired) session.
 
         Args:
@@ -289,15 +390,11 @@ class SessionRepository(BaseRepository[Session]):
         Returns:
             Session instance or None if not found or expired.
         """
-        stmt = (
-            select(Session)
-            .options(joinedload(Session.user))
-            .where(
-                Session.id == session_id,
-                Session.expires_at > datetime.utcnow(),
-            )
-        )
-        return self.session.scalar(stmt)
+        # Primary key lookup, so a session already loaded needs no query
+        session = self.session.get(Session, session_id, options=[joinedload(Session.user)])
+        if session is None or session.expires_at <= datetime.utcnow():
+            return None
+        return session
 
     def list_by_user(self, user_id: int) -> list[Session]:
         """List active sessions for a user.
@@ -320,7 +417,7 @@ class SessionRepository(BaseRepository[Session]):
 
     def create(
         self,
-        session_id: str,
+        session_id: bytes,
         user_id: int,
         expires_at: datetime,
         user_agent: str | None = None,
@@ -329,7 +426,8 @@ class SessionRepository(BaseRepository[Session]):
         """Create a new session.
 
         Args:
-            session_id: Unique session identifier.
+            session_id: Unique 16-byte session identifier, e.g. from
+                ``secrets.token_bytes(16)``.
             user_id: ID of the user.
             expires_at: Session expiration timestamp.
             user_agent: Optional user agent string.
@@ -355,11 +453,8 @@ class SessionRepository(BaseRepository[Session]):
         Returns:
             Number of sessions deleted.
         """
-        stmt = select(Session).where(Session.expires_at <= datetime.utcnow())
-        expired = list(self.session.scalars(stmt))
-        for session in expired:
-            self.delete(session)
-        return len(expired)
+        stmt = delete(Session).where(Session.expires_at <= datetime.utcnow())
+        return cast(CursorResult[Any], self.session.execute(stmt)).rowcount
 
     def delete_for_user(self, user_id: int) -> int:
         """Delete all sessions for a user.
@@ -370,11 +465,20 @@ class SessionRepository(BaseRepository[Session]):
         Returns:
             Number of sessions deleted.
         """
-        stmt = select(Session).where(Session.user_id == user_id)
-        sessions = list(self.session.scalars(stmt))
-        for session in sessions:
-            self.delete(session)
-        return len(sessions)
+        stmt = delete(Session).where(Session.user_id == user_id)
+        return cast(CursorResult[Any], self.session.execute(stmt)).rowcount
+
+    def delete_for_users(self, user_ids: list[int]) -> int:
+        """Delete all sessions for a batch of users in one statement.
+
+        Args:
+            user_ids: IDs of the users.
+
+        Returns:
+            Number of sessions deleted.
+        """
+        stmt = delete(Session).where(Session.user_id.in_(user_ids))
+        return cast(CursorResult[Any], self.session.execute(stmt)).rowcount
 
 
 class RefreshTokenRepository(BaseRepository[RefreshToken]):
@@ -382,7 +486,7 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
 
     model = RefreshToken
 
-    def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+    def get_by_hash(self, token_hash: bytes) -> RefreshToken | None:
         """Get refresh token by hash.
 
         Args:
@@ -398,7 +502,7 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         )
         return self.session.scalar(stmt)
 
-    def get_valid(self, token_hash: str) -> RefreshToken | None:
+    def get_valid(self, token_hash: bytes) -> RefreshToken | None:
         """Get a valid (non-expired, non-replaced) refresh token.
 
         Args:
@@ -421,14 +525,14 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
     def create(
         self,
         user_id: int,
-        token_hash: str,
+        token_hash: bytes,
         expires_at: datetime,
     ) -> RefreshToken:
         """Create a new refresh token.
 
         Args:
             user_id: ID of the user.
-            token_hash: Hash of the token.
+            token_hash: SHA-256 digest of the token.
             expires_at: Token expiration timestamp.
 
         Returns:
@@ -468,11 +572,8 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         Returns:
             Number of tokens deleted.
         """
-        stmt = select(RefreshToken).where(RefreshToken.expires_at <= datetime.utcnow())
-        expired = list(self.session.scalars(stmt))
-        for token in expired:
-            self.delete(token)
-        return len(expired)
+        stmt = delete(RefreshToken).where(RefreshToken.expires_at <= datetime.utcnow())
+        return cast(CursorResult[Any], self.session.execute(stmt)).rowcount
 
     def delete_for_user(self, user_id: int) -> int:
         """Delete all refresh tokens for a user.
@@ -483,8 +584,17 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         Returns:
             Number of tokens deleted.
         """
-        stmt = select(RefreshToken).where(RefreshToken.user_id == user_id)
-        tokens = list(self.session.scalars(stmt))
-        for token in tokens:
-            self.delete(token)
-        return len(tokens)
+        stmt = delete(RefreshToken).where(RefreshToken.user_id == user_id)
+        return cast(CursorResult[Any], self.session.execute(stmt)).rowcount
+
+    def delete_for_users(self, user_ids: list[int]) -> int:
+        """Delete all refresh tokens for a batch of users in one statement.
+
+        Args:
+            user_ids: IDs of the users.
+
+        Returns:
+            Number of tokens deleted.
+        """
+        stmt = delete(RefreshToken).where(RefreshToken.user_id.in_(user_ids))
+        return cast(CursorResult[Any], self.session.execute(stmt)).rowcount
@@ -2,7 +2,7 @@
 
 from typing import Generic, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from datacompass.core.models.base import Base
@@ -90,8 +90,8 @@ class BaseRepository(Generic[ModelT]):
         Returns:
             Total number of records.
         """
-        stmt = select(self.model)
-        return len(list(self.session.scalars(stmt)))
+        stmt = select(func.count()).select_from(self.model)
+        return self.session.scalar(stmt) or 0
 
     def flush(self) -> None:
         """Flush pending changes to the database."""
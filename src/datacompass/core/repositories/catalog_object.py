@@ -1,10 +1,12 @@
 """Repository for CatalogObject operations with UPSERT support."""
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, Literal, cast
 
-from sqlalchemy import and_, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import CursorResult, and_, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload, selectinload
 
 from datacompass.core.models import CatalogObject, DataSource
 from datacompass.core.repositories.base import BaseRepository
@@ -132,6 +134,9 @@ class CatalogObjectRepository(BaseRepository[CatalogObject]):
         """Insert or update a catalog object by natural key.
 
         Preserves user_metadata when updating. Un-deletes soft-deleted records.
+        Runs as one INSERT ... ON CONFLICT DO UPDATE ... RETURNING, so a
+        concurrent scan of the same source cannot insert a duplicate between
+        a lookup and the insert.
 
         Args:
             source_id: ID of the data source.
@@ -143,23 +148,99 @@ class CatalogObjectRepository(BaseRepository[CatalogObject]):
         Returns:
             Tuple of (CatalogObject, action) where action is 'created' or 'updated'.
         """
-        existing = self.get_by_natural_key(source_id, schema_name, object_name, object_type)
-
-        if existing:
-            existing.source_metadata = source_metadata
-            existing.updated_at = datetime.utcnow()
-            existing.deleted_at = None  # Un-delete if re-discovered
-            return existing, "updated"
-        else:
-            obj = CatalogObject(
-                source_id=source_id,
-                schema_name=schema_name,
-                object_name=object_name,
-                object_type=object_type,
-                source_metadata=source_metadata,
+        now = datetime.utcnow()
+        dialect_insert = (
+            pg_insert if self.session.get_bind().dialect.name == "postgresql" else sqlite_insert
+        )
+        stmt = dialect_insert(CatalogObject).values(
+            source_id=source_id,
+            schema_name=schema_name,
+            object_name=object_name,
+            object_type=object_type,
+            source_metadata=source_metadata,
+            created_at=now,
+            updated_at=now,
+        )
+        upsert = stmt.on_conflict_do_update(
+            index_elements=["source_id", "schema_name", "object_name", "object_type"],
+            set_={
+                "source_metadata": stmt.excluded.source_metadata,
+                "updated_at": now,
+                "deleted_at": None,  # Un-delete if re-discovered
+            },
+        ).returning(CatalogObject)
+
+        obj = self.session.scalars(upsert, execution_options={"populate_existing": True}).one()
+        # An existing row keeps its original created_at
+        return obj, "created" if obj.created_at == now else "updated"
+
+    def upsert_many(
+        self,
+        source_id: int,
+        rows: list[dict[str, Any]],
+    ) -> dict[tuple[str, str, str], tuple[int, Literal["created", "updated"]]]:
+        """Insert or update many catalog objects of one source at once.
+
+        Behaves like upsert() for each row, but sends the rows as one
+        executemany INSERT ... ON CONFLICT DO UPDATE ... RETURNING, which
+        SQLAlchemy pages into multi-row VALUES statements. A scan of
+        thousands of objects costs a handful of round trips instead of one
+        or two per object, and no ORM instances are built.
+
+        Args:
+            source_id: ID of the data source.
+            rows: Objects with schema_name, object_name, object_type and
+                optional source_metadata. Later rows win over earlier rows
+                with the same natural key.
+
+        Returns:
+            Dict mapping (schema_name, object_name, object_type) to
+            (object ID, action) where action is 'created' or 'updated'.
+        """
+        now = datetime.utcnow()
+        # A statement may not update the same row twice
+        params = {
+            (row["schema_name"], row["object_name"], row["object_type"]): {
+                "source_id": source_id,
+                "schema_name": row["schema_name"],
+                "object_name": row["object_name"],
+                "object_type": row["object_type"],
+                "source_metadata": row.get("source_metadata"),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for row in rows
+        }
+        if not params:
+            return {}
+
+        dialect_insert = (
+            pg_insert if self.session.get_bind().dialect.name == "postgresql" else sqlite_insert
+        )
+        stmt = dialect_insert(CatalogObject)
+        upsert = stmt.on_conflict_do_update(
+            index_elements=["source_id", "schema_name", "object_name", "object_type"],
+            set_={
+                "source_metadata": stmt.excluded.source_metadata,
+                "updated_at": now,
+                "deleted_at": None,  # Un-delete if re-discovered
+            },
+        ).returning(
+            CatalogObject.id,
+            CatalogObject.schema_name,
+            CatalogObject.object_name,
+            CatalogObject.object_type,
+            CatalogObject.created_at,
+        )
+
+        result = self.session.execute(upsert, list(params.values()))
+        return {
+            (row.schema_name, row.object_name, row.object_type): (
+                row.id,
+                "created" if row.created_at == now else "updated",
             )
-            self.add(obj)
-            return obj, "created"
+            for row in result
+        }
 
     def get_by_source(
         self,
@@ -246,7 +327,7 @@ class CatalogObjectRepository(BaseRepository[CatalogObject]):
         """
         stmt = (
             select(CatalogObject)
-            .options(joinedload(CatalogObject.columns))
+            .options(selectinload(CatalogObject.columns))
             .where(CatalogObject.id == object_id)
         )
         return self.session.scalar(stmt)
@@ -271,31 +352,45 @@ class CatalogObjectRepository(BaseRepository[CatalogObject]):
         self,
         source_id: int,
         current_ids: set[int],
+        batch_size: int = 10_000,
     ) -> int:
         """Soft delete objects not in the current set of IDs.
 
         Used after a scan to mark objects that no longer exist in the source.
+        Only the IDs of live objects are read; the missing ones are marked
+        with one UPDATE per batch instead of being loaded and flushed one
+        by one. A NOT IN over current_ids is avoided because a full scan
+        can see more objects than a statement may carry parameters.
 
         Args:
             source_id: ID of the data source.
             current_ids: Set of object IDs that still exist.
+            batch_size: Number of objects per UPDATE statement.
 
         Returns:
             Number of objects soft-deleted.
         """
-        # Get all non-deleted objects for this source
-        stmt = select(CatalogObject).where(
-            and_(
-                CatalogObject.source_id == source_id,
-                CatalogObject.deleted_at.is_(None),
+        live_ids = self.session.scalars(
+            select(CatalogObject.id).where(
+                and_(
+                    CatalogObject.source_id == source_id,
+                    CatalogObject.deleted_at.is_(None),
+                )
             )
         )
-        objects = list(self.session.scalars(stmt))
+        missing_ids = sorted(set(live_ids) - current_ids)
+
+        deleted_at = datetime.utcnow()
         count = 0
-        for obj in objects:
-            if obj.id not in current_ids:
-                obj.soft_delete()
-                count += 1
+        for start in range(0, len(missing_ids), batch_size):
+            batch = missing_ids[start : start + batch_size]
+            stmt = (
+                update(CatalogObject)
+                .where(CatalogObject.id.in_(batch))
+                .values(deleted_at=deleted_at)
+                .execution_options(synchronize_session=False)
+            )
+            count += cast(CursorResult[Any], self.session.execute(stmt)).rowcount
         return count
 
     def list_objects(
@@ -344,7 +439,8 @@ class CatalogObjectRepository(BaseRepository[CatalogObject]):
         if limit is not None:
             stmt = stmt.limit(limit)
 
-        return list(self.session.scalars(stmt).unique())
+        # The source is many-to-one, so the join cannot repeat an object
+        return list(self.session.scalars(stmt))
 
     def count_by_source(self, source_id: int, include_deleted: bool = False) -> int:
         """Count objects for a data source.
@@ -356,10 +452,10 @@ class CatalogObjectRepository(BaseRepository[CatalogObject]):
         Returns:
             Number of objects.
         """
-        stmt = select(CatalogObject).where(CatalogObject.source_id == source_id)
+        stmt = select(func.count()).where(CatalogObject.source_id == source_id)
         if not include_deleted:
             stmt = stmt.where(CatalogObject.deleted_at.is_(None))
-        return len(list(self.session.scalars(stmt)))
+        return self.session.scalar(stmt) or 0
 
     def count_by_type(
         self,
@@ -377,7 +473,7 @@ class CatalogObjectRepository(BaseRepository[CatalogObject]):
         Returns:
             Number of objects.
         """
-        stmt = select(CatalogObject).where(
+        stmt = select(func.count()).where(
             and_(
                 CatalogObject.source_id == source_id,
                 CatalogObject.object_type == object_type,
@@ -385,4 +481,4 @@ class CatalogObjectRepository(BaseRepository[CatalogObject]):
         )
         if not include_deleted:
             stmt = stmt.where(CatalogObject.deleted_at.is_(None))
-        return len(list(self.session.scalars(stmt)))
+        return self.session.scalar(stmt) or 0
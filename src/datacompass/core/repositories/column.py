@@ -2,7 +2,7 @@
 
 from typing import Any, Literal
 
-from sqlalchemy import and_, delete, select
+from sqlalchemy import and_, delete, func, select
 
 from datacompass.core.models import Column
 from datacompass.core.repositories.base import BaseRepository
@@ -171,5 +171,5 @@ class ColumnRepository(BaseRepository[Column]):
         Returns:
             Number of columns.
         """
-        stmt = select(Column).where(Column.object_id == object_id)
-        return len(list(self.session.scalars(stmt)))
+        stmt = select(func.count()).where(Column.object_id == object_id)
+        return self.session.scalar(stmt) or 0
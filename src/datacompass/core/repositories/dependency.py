@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Literal
 
-from sqlalchemy import and_, delete, or_, select
+from sqlalchemy import and_, delete, func, or_, select
 from sqlalchemy.orm import joinedload
 
 from datacompass.core.models import CatalogObject, DataSource
@@ -237,12 +237,12 @@ class DependencyRepository(BaseRepository[Dependency]):
         Returns:
             Dict with 'upstream' and 'downstream' counts.
         """
-        upstream_stmt = select(Dependency).where(Dependency.object_id == object_id)
-        downstream_stmt = select(Dependency).where(Dependency.target_id == object_id)
+        upstream_stmt = select(func.count()).where(Dependency.object_id == object_id)
+        downstream_stmt = select(func.count()).where(Dependency.target_id == object_id)
 
         return {
-            "upstream": len(list(self.session.scalars(upstream_stmt))),
-            "downstream": len(list(self.session.scalars(downstream_stmt))),
+            "upstream": self.session.scalar(upstream_stmt) or 0,
+            "downstream": self.session.scalar(downstream_stmt) or 0,
         }
 
     def get_objects_with_dependencies(
@@ -3,7 +3,7 @@
 from datetime import date, datetime
 
 from sqlalchemy import and_, func, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, lazyload, selectinload
 
 from datacompass.core.models import CatalogObject, DataSource
 from datacompass.core.models.deprecation import Deprecation, DeprecationCampaign
@@ -32,10 +32,10 @@ class DeprecationRepository(BaseRepository[DeprecationCampaign]):
             select(DeprecationCampaign)
             .options(
                 joinedload(DeprecationCampaign.source),
-                joinedload(DeprecationCampaign.deprecations)
-                .joinedload(Deprecation.object),
-                joinedload(DeprecationCampaign.deprecations)
-                .joinedload(Deprecation.replacement),
+                selectinload(DeprecationCampaign.deprecations).options(
+                    joinedload(Deprecation.object),
+                    joinedload(Deprecation.replacement),
+                ),
             )
             .where(DeprecationCampaign.id == campaign_id)
         )
@@ -59,7 +59,7 @@ class DeprecationRepository(BaseRepository[DeprecationCampaign]):
             select(DeprecationCampaign)
             .options(
                 joinedload(DeprecationCampaign.source),
-                joinedload(DeprecationCampaign.deprecations),
+                selectinload(DeprecationCampaign.deprecations),
             )
             .where(
                 and_(
@@ -92,7 +92,7 @@ class DeprecationRepository(BaseRepository[DeprecationCampaign]):
             select(DeprecationCampaign)
             .options(
                 joinedload(DeprecationCampaign.source),
-                joinedload(DeprecationCampaign.deprecations),
+                lazyload(DeprecationCampaign.deprecations),
             )
         )
 
@@ -251,13 +251,15 @@ class DeprecationRepository(BaseRepository[DeprecationCampaign]):
         Returns:
             List of Deprecation instances.
         """
-        stmt = (
-            select(Deprecation)
-            .options(
-                joinedload(Deprecation.campaign).joinedload(DeprecationCampaign.source),
-                joinedload(Deprecation.object),
-                joinedload(Deprecation.replacement),
-            )
+        # Responses only carry object names, so the campaign is not joined and
+        # the catalog rows are narrowed to skip their JSON metadata columns.
+        stmt = select(Deprecation).options(
+            joinedload(Deprecation.object).load_only(
+                CatalogObject.schema_name, CatalogObject.object_name, CatalogObject.object_type
+            ),
+            joinedload(Deprecation.replacement).load_only(
+                CatalogObject.schema_name, CatalogObject.object_name
+            ),
         )
 
         if campaign_id is not None:
@@ -381,6 +383,25 @@ class DeprecationRepository(BaseRepository[DeprecationCampaign]):
         )
         return self.session.scalar(stmt) or 0
 
+    def count_objects_by_campaign(self, campaign_ids: list[int]) -> dict[int, int]:
+        """Count deprecated objects for several campaigns in one query.
+
+        Args:
+            campaign_ids: IDs of the campaigns to count.
+
+        Returns:
+            Dict mapping campaign ID to object count. Campaigns without
+            deprecations are omitted.
+        """
+        if not campaign_ids:
+            return {}
+        stmt = (
+            select(Deprecation.campaign_id, func.count(Deprecation.id))
+            .where(Deprecation.campaign_id.in_(campaign_ids))
+            .group_by(Deprecation.campaign_id)
+        )
+        return dict(self.session.execute(stmt).all())
+
     def get_upcoming_campaigns(
         self,
         days: int = 30,
@@ -404,7 +425,7 @@ class DeprecationRepository(BaseRepository[DeprecationCampaign]):
             select(DeprecationCampaign)
             .options(
                 joinedload(DeprecationCampaign.source),
-                joinedload(DeprecationCampaign.deprecations),
+                lazyload(DeprecationCampaign.deprecations),
             )
             .where(
                 and_(
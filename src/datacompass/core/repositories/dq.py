@@ -1,14 +1,16 @@
 """Repository for Data Quality operations."""
 
 from datetime import date, datetime
-from typing import Any
+from typing import Any, cast
 
-from sqlalchemy import and_, func, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import CursorResult, and_, delete, func, insert, literal_column, select
+from sqlalchemy.orm import joinedload, lazyload, selectinload
 
-from datacompass.core.models import CatalogObject
+from datacompass.core.models import CatalogObject, DataSource
 from datacompass.core.models.dq import (
+    MAX_LIFECYCLE_EVENTS,
     DQBreach,
+    DQBreachEvent,
     DQConfig,
     DQExpectation,
     DQResult,
@@ -37,7 +39,7 @@ class DQRepository(BaseRepository[DQConfig]):
         stmt = (
             select(DQConfig)
             .options(
-                joinedload(DQConfig.expectations),
+                selectinload(DQConfig.expectations),
                 joinedload(DQConfig.object).joinedload(CatalogObject.source),
             )
             .where(DQConfig.object_id == object_id)
@@ -56,7 +58,7 @@ class DQRepository(BaseRepository[DQConfig]):
         stmt = (
             select(DQConfig)
             .options(
-                joinedload(DQConfig.expectations),
+                selectinload(DQConfig.expectations),
                 joinedload(DQConfig.object).joinedload(CatalogObject.source),
             )
             .where(DQConfig.id == config_id)
@@ -85,8 +87,13 @@ class DQRepository(BaseRepository[DQConfig]):
             select(DQConfig)
             .join(CatalogObject)
             .options(
-                joinedload(DQConfig.expectations),
-                joinedload(DQConfig.object).joinedload(CatalogObject.source),
+                lazyload(DQConfig.expectations),
+                # List rows only render source.schema.object, so skip the JSON
+                # metadata columns on the joined object and source rows.
+                joinedload(DQConfig.object)
+                .load_only(CatalogObject.schema_name, CatalogObject.object_name)
+                .joinedload(CatalogObject.source)
+                .load_only(DataSource.name),
             )
         )
 
@@ -445,6 +452,69 @@ class DQRepository(BaseRepository[DQConfig]):
             self.flush()
             return result
 
+    def record_results_many(
+        self,
+        snapshot_date: date,
+        rows: list[dict[str, Any]],
+    ) -> dict[int, DQResult]:
+        """Record results for many expectations on one snapshot date.
+
+        Upserts by (expectation_id, snapshot_date) like record_result, but
+        looks up existing rows with one SELECT and inserts the new ones with
+        a single INSERT ... RETURNING rather than a flush per result.
+
+        Args:
+            snapshot_date: Date of the check.
+            rows: One dict per result, keyed by DQResult column names.
+                Each must include expectation_id and metric_value.
+
+        Returns:
+            Recorded DQResult instances keyed by expectation ID.
+        """
+        if not rows:
+            return {}
+
+        stmt = select(DQResult).where(
+            DQResult.expectation_id.in_([row["expectation_id"] for row in rows]),
+            DQResult.snapshot_date == snapshot_date,
+        )
+        recorded = {r.expectation_id: r for r in self.session.scalars(stmt)}
+
+        new_rows = []
+        for row in rows:
+            existing = recorded.get(row["expectation_id"])
+            if existing is None:
+                new_rows.append({"snapshot_date": snapshot_date, **row})
+                continue
+            for key, value in row.items():
+                setattr(existing, key, value)
+
+        if new_rows:
+            inserted = self.session.scalars(insert(DQResult).returning(DQResult), new_rows)
+            recorded.update((r.expectation_id, r) for r in inserted)
+
+        self.flush()
+        return recorded
+
+    def delete_results_before(self, cutoff: date) -> int:
+        """Delete results older than a cutoff date.
+
+        Results referenced by a breach are kept so breach history survives
+        pruning.
+
+        Args:
+            cutoff: Results with snapshot_date before this date are deleted.
+
+        Returns:
+            Number of results deleted.
+        """
+        stmt = delete(DQResult).where(
+            DQResult.snapshot_date < cutoff,
+            DQResult.id.not_in(select(DQBreach.result_id)),
+        )
+        result = cast(CursorResult[Any], self.session.execute(stmt))
+        return result.rowcount
+
     # =========================================================================
     # Breach Operations
     # =========================================================================
@@ -532,7 +602,9 @@ class DQRepository(BaseRepository[DQConfig]):
                 joinedload(DQBreach.expectation)
                 .joinedload(DQExpectation.config)
                 .joinedload(DQConfig.object)
-                .joinedload(CatalogObject.source),
+                .load_only(CatalogObject.schema_name, CatalogObject.object_name)
+                .joinedload(CatalogObject.source)
+                .load_only(DataSource.name),
             )
         )
 
@@ -641,6 +713,21 @@ class DQRepository(BaseRepository[DQConfig]):
         # Update lifecycle events (create new list to trigger JSON update)
         events = list(breach.lifecycle_events) if breach.lifecycle_events else []
         events.append(event)
+
+        # Keep the inline list bounded; archive the oldest events
+        overflow = len(events) - MAX_LIFECYCLE_EVENTS
+        if overflow > 0:
+            self.session.add_all(
+                DQBreachEvent(
+                    breach_id=breach.id,
+                    status=archived["status"],
+                    changed_by=archived.get("by"),
+                    changed_at=datetime.fromisoformat(archived["at"]),
+                    notes=archived.get("notes"),
+                )
+                for archived in events[:overflow]
+            )
+            events = events[overflow:]
         breach.lifecycle_events = events
 
         breach.status = status
@@ -648,6 +735,22 @@ class DQRepository(BaseRepository[DQConfig]):
 
         return breach
 
+    def get_archived_events(self, breach_id: int) -> list[DQBreachEvent]:
+        """Get lifecycle events archived from a breach, oldest first.
+
+        Args:
+            breach_id: ID of the breach.
+
+        Returns:
+            List of DQBreachEvent instances.
+        """
+        stmt = (
+            select(DQBreachEvent)
+            .where(DQBreachEvent.breach_id == breach_id)
+            .order_by(DQBreachEvent.id)
+        )
+        return list(self.session.scalars(stmt))
+
     # =========================================================================
     # Aggregate Queries
     # =========================================================================
@@ -680,51 +783,54 @@ class DQRepository(BaseRepository[DQConfig]):
             stmt = stmt.where(DQExpectation.is_enabled == True)  # noqa: E712
         return self.session.scalar(stmt) or 0
 
-    def count_breaches_by_status(self) -> dict[str, int]:
-        """Count breaches grouped by status.
+    def count_breaches_by_status_and_priority(self) -> dict[tuple[str, str], int]:
+        """Count breaches grouped by status and expectation priority.
 
         Returns:
-            Dict mapping status to count.
+            Dict mapping (status, priority) to count.
         """
         stmt = (
-            select(DQBreach.status, func.count(DQBreach.id))
-            .group_by(DQBreach.status)
-        )
-        results = self.session.execute(stmt).all()
-        return dict(results)
-
-    def count_open_breaches_by_priority(self) -> dict[str, int]:
-        """Count open breaches grouped by priority.
-
-        Returns:
-            Dict mapping priority to count.
-        """
-        stmt = (
-            select(DQExpectation.priority, func.count(DQBreach.id))
+            select(DQBreach.status, DQExpectation.priority, func.count(DQBreach.id))
             .join(DQExpectation)
-            .where(DQBreach.status == "open")
-            .group_by(DQExpectation.priority)
+            .group_by(DQBreach.status, DQExpectation.priority)
         )
-        results = self.session.execute(stmt).all()
-        return dict(results)
+        return {
+            (status, priority): count
+            for status, priority, count in self.session.execute(stmt)
+        }
 
-    def get_open_breach_count_for_config(self, config_id: int) -> int:
-        """Get count of open breaches for a config.
+    def get_counts_for_configs(self, config_ids: list[int]) -> dict[int, tuple[int, int]]:
+        """Count expectations and open breaches for several configs in one query.
 
         Args:
-            config_id: ID of the DQ config.
+            config_ids: IDs of the DQ configs to count.
 
         Returns:
-            Number of open breaches.
+            Dict mapping config ID to ``(expectation_count, open_breach_count)``.
+            Configs without expectations are omitted.
         """
-        stmt = (
+        if not config_ids:
+            return {}
+        # Literal predicate so the planner can match ix_dq_breaches_open_expectation
+        open_breaches = (
             select(func.count(DQBreach.id))
-            .join(DQExpectation)
             .where(
-                and_(
-                    DQExpectation.config_id == config_id,
-                    DQBreach.status == "open",
-                )
+                DQBreach.expectation_id == DQExpectation.id,
+                DQBreach.status == literal_column("'open'"),
             )
+            .correlate(DQExpectation)
+            .scalar_subquery()
         )
-        return self.session.scalar(stmt) or 0
+        stmt = (
+            select(
+                DQExpectation.config_id,
+                func.count(DQExpectation.id),
+                func.coalesce(func.sum(open_breaches), 0),
+            )
+            .where(DQExpectation.config_id.in_(config_ids))
+            .group_by(DQExpectation.config_id)
+        )
+        return {
+            config_id: (expectations, open_breaches)
+            for config_id, expectations, open_breaches in self.session.execute(stmt)
+        }
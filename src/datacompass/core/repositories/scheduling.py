@@ -1,10 +1,12 @@
 """Repository for Scheduling and Notification operations."""
 
+from collections.abc import Iterable
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, cast
 
-from sqlalchemy import and_, func, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import CursorResult, Row, Select, and_, delete, func, insert, select, true
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from datacompass.core.models.scheduling import (
     NotificationChannel,
@@ -37,6 +39,18 @@ class SchedulingRepository(BaseRepository[Schedule]):
         stmt = select(Schedule).where(Schedule.name == name)
         return self.session.scalar(stmt)
 
+    def get_by_names(self, names: Iterable[str]) -> dict[str, Schedule]:
+        """Get schedules by name in one query.
+
+        Args:
+            names: Schedule names to look up.
+
+        Returns:
+            Dict of schedule name to Schedule for the names that exist.
+        """
+        stmt = select(Schedule).where(Schedule.name.in_(set(names)))
+        return {schedule.name: schedule for schedule in self.session.scalars(stmt)}
+
     def get_with_runs(self, schedule_id: int, run_limit: int = 10) -> Schedule | None:
         """Get schedule with recent runs loaded.
 
@@ -47,17 +61,13 @@ class SchedulingRepository(BaseRepository[Schedule]):
         Returns:
             Schedule with loaded runs or None.
         """
-        stmt = (
-            select(Schedule)
-            .options(joinedload(Schedule.runs))
-            .where(Schedule.id == schedule_id)
-        )
-        schedule = self.session.scalar(stmt)
+        schedule = self.get_by_id(schedule_id)
         if schedule:
-            # Sort runs by started_at desc and limit
-            schedule.runs = sorted(
-                schedule.runs, key=lambda r: r.started_at, reverse=True
-            )[:run_limit]
+            # Fetch only the newest runs and install them as the loaded
+            # collection. Assigning to schedule.runs instead would orphan the
+            # older runs, which the delete-orphan cascade deletes on flush.
+            recent_runs = self.get_runs_for_schedule(schedule_id, limit=run_limit)
+            set_committed_value(schedule, "runs", recent_runs)
         return schedule
 
     def list_schedules(
@@ -101,6 +111,39 @@ class SchedulingRepository(BaseRepository[Schedule]):
         """
         return self.list_schedules(enabled_only=True)
 
+    def get_due_schedules(
+        self,
+        job_type: str,
+        due_at: datetime | None = None,
+    ) -> list[Schedule]:
+        """Get enabled schedules of a job type whose next run is due.
+
+        Matches the column order of ix_schedules_dispatch so the lookup is a
+        single index range scan.
+
+        Args:
+            job_type: Job type to dispatch.
+            due_at: Cutoff for next_run_at (defaults to now).
+
+        Returns:
+            List of due Schedule instances, earliest first.
+        """
+        stmt = self._due_schedules_stmt(job_type, due_at or datetime.utcnow())
+        return list(self.session.scalars(stmt))
+
+    @staticmethod
+    def _due_schedules_stmt(job_type: str, due_at: datetime) -> Select[Schedule]:
+        """Build the dispatch query used by get_due_schedules."""
+        return (
+            select(Schedule)
+            .where(
+                Schedule.is_enabled == True,  # noqa: E712
+                Schedule.job_type == job_type,
+                Schedule.next_run_at <= due_at,
+            )
+            .order_by(Schedule.next_run_at)
+        )
+
     def create_schedule(
         self,
         name: str,
@@ -135,6 +178,22 @@ class SchedulingRepository(BaseRepository[Schedule]):
         self.flush()
         return schedule
 
+    def create_schedules(self, rows: list[dict[str, Any]]) -> int:
+        """Create several schedules with one multi-row INSERT.
+
+        Args:
+            rows: One dict per schedule, keyed by Schedule column names.
+                Every row must carry the same keys.
+
+        Returns:
+            Number of schedules created.
+        """
+        if not rows:
+            return 0
+
+        self.session.execute(insert(Schedule), rows)
+        return len(rows)
+
     def update_schedule(
         self,
         schedule_id: int,
@@ -283,40 +342,42 @@ class SchedulingRepository(BaseRepository[Schedule]):
         )
         return list(self.session.scalars(stmt))
 
-    def get_recent_runs(self, limit: int = 10) -> list[ScheduleRun]:
+    def get_recent_runs(self, limit: int = 10) -> list[Row[Any]]:
         """Get recent runs across all schedules.
 
+        The hub summary only serializes these, so plain column rows are
+        returned instead of ScheduleRun instances, skipping ORM hydration
+        and identity map bookkeeping.
+
         Args:
             limit: Maximum results.
 
         Returns:
-            List of recent ScheduleRun instances.
+            List of rows with the schedule_runs columns, newest first.
         """
         stmt = (
-            select(ScheduleRun)
-            .options(joinedload(ScheduleRun.schedule))
+            select(*ScheduleRun.__table__.c)
             .order_by(ScheduleRun.started_at.desc())
             .limit(limit)
         )
-        return list(self.session.scalars(stmt))
+        return list(self.session.execute(stmt))
 
-    # =========================================================================
-    # Aggregate Queries
-    # =========================================================================
-
-    def count_schedules(self, enabled_only: bool = False) -> int:
-        """Count schedules.
+    def delete_runs_before(self, cutoff: datetime) -> int:
+        """Delete runs that started before a cutoff.
 
         Args:
-            enabled_only: Only count enabled schedules.
+            cutoff: Runs with started_at before this time are deleted.
 
         Returns:
-            Number of schedules.
+            Number of runs deleted.
         """
-        stmt = select(func.count(Schedule.id))
-        if enabled_only:
-            stmt = stmt.where(Schedule.is_enabled == True)  # noqa: E712
-        return self.session.scalar(stmt) or 0
+        stmt = delete(ScheduleRun).where(ScheduleRun.started_at < cutoff)
+        result = cast(CursorResult[Any], self.session.execute(stmt))
+        return result.rowcount
+
+    # =========================================================================
+    # Aggregate Queries
+    # =========================================================================
 
     def count_schedules_by_type(self) -> dict[str, int]:
         """Count schedules grouped by job type.
@@ -331,6 +392,40 @@ class SchedulingRepository(BaseRepository[Schedule]):
         results = self.session.execute(stmt).all()
         return dict(results)
 
+    def get_hub_counts(self) -> dict[str, int]:
+        """Count schedules, channels and rules, in total and enabled.
+
+        Each table is aggregated in a single-row subquery and the three are
+        cross-joined, so all six counts come back from one statement.
+
+        Returns:
+            Dict with total_* and enabled_* counts for schedules, channels
+            and rules.
+        """
+        tables = (
+            ("schedules", Schedule),
+            ("channels", NotificationChannel),
+            ("rules", NotificationRule),
+        )
+        subqueries = [
+            select(
+                func.count().label(f"total_{name}"),
+                func.count()
+                .filter(model.is_enabled == True)  # noqa: E712
+                .label(f"enabled_{name}"),
+            )
+            .select_from(model)
+            .subquery()
+            for name, model in tables
+        ]
+        stmt = (
+            select(*[column for subquery in subqueries for column in subquery.c])
+            .select_from(subqueries[0])
+            .join(subqueries[1], true())
+            .join(subqueries[2], true())
+        )
+        return dict(self.session.execute(stmt).one()._mapping)
+
 
 class NotificationRepository(BaseRepository[NotificationChannel]):
     """Repository for Notification CRUD operations."""
@@ -353,6 +448,18 @@ class NotificationRepository(BaseRepository[NotificationChannel]):
         stmt = select(NotificationChannel).where(NotificationChannel.name == name)
         return self.session.scalar(stmt)
 
+    def get_channels_by_names(self, names: Iterable[str]) -> dict[str, NotificationChannel]:
+        """Get channels by name in one query.
+
+        Args:
+            names: Channel names to look up.
+
+        Returns:
+            Dict of channel name to NotificationChannel for the names that exist.
+        """
+        stmt = select(NotificationChannel).where(NotificationChannel.name.in_(set(names)))
+        return {channel.name: channel for channel in self.session.scalars(stmt)}
+
     def get_channel_with_rules(self, channel_id: int) -> NotificationChannel | None:
         """Get channel with rules loaded.
 
@@ -364,7 +471,7 @@ class NotificationRepository(BaseRepository[NotificationChannel]):
         """
         stmt = (
             select(NotificationChannel)
-            .options(joinedload(NotificationChannel.rules))
+            .options(selectinload(NotificationChannel.rules))
             .where(NotificationChannel.id == channel_id)
         )
         return self.session.scalar(stmt)
@@ -427,6 +534,27 @@ class NotificationRepository(BaseRepository[NotificationChannel]):
         self.flush()
         return channel
 
+    def create_channels(self, rows: list[dict[str, Any]]) -> dict[str, int]:
+        """Create several channels with one INSERT ... RETURNING.
+
+        Args:
+            rows: One dict per channel, keyed by NotificationChannel column
+                names. Every row must carry the same keys.
+
+        Returns:
+            Dict of channel name to the newly assigned ID.
+        """
+        if not rows:
+            return {}
+
+        result = self.session.execute(
+            insert(NotificationChannel).returning(
+                NotificationChannel.name, NotificationChannel.id
+            ),
+            rows,
+        )
+        return {row.name: row.id for row in result}
+
     def update_channel(
         self,
         channel_id: int,
@@ -546,6 +674,22 @@ class NotificationRepository(BaseRepository[NotificationChannel]):
 
         return list(self.session.scalars(stmt).unique())
 
+    def list_rules_by_names(self, names: Iterable[str]) -> list[NotificationRule]:
+        """List rules whose name is one of the given names.
+
+        Args:
+            names: Rule names to look up.
+
+        Returns:
+            Matching NotificationRule instances, ordered by ID.
+        """
+        stmt = (
+            select(NotificationRule)
+            .where(NotificationRule.name.in_(set(names)))
+            .order_by(NotificationRule.id)
+        )
+        return list(self.session.scalars(stmt))
+
     def get_rules_for_event(self, event_type: str) -> list[NotificationRule]:
         """Get all enabled rules for an event type.
 
@@ -598,6 +742,22 @@ class NotificationRepository(BaseRepository[NotificationChannel]):
         self.flush()
         return rule
 
+    def create_rules(self, rows: list[dict[str, Any]]) -> int:
+        """Create several rules with one multi-row INSERT.
+
+        Args:
+            rows: One dict per rule, keyed by NotificationRule column names.
+                Every row must carry the same keys.
+
+        Returns:
+            Number of rules created.
+        """
+        if not rows:
+            return 0
+
+        self.session.execute(insert(NotificationRule), rows)
+        return len(rows)
+
     def update_rule(
         self,
         rule_id: int,
@@ -695,6 +855,25 @@ class NotificationRepository(BaseRepository[NotificationChannel]):
         self.flush()
         return log_entry
 
+    def create_log_entries(self, rows: list[dict[str, Any]]) -> list[NotificationLog]:
+        """Create several notification log entries with one INSERT.
+
+        Used when one event fans out to many rules, so the log rows go out
+        as a single multi-row INSERT ... RETURNING instead of a flush each.
+
+        Args:
+            rows: One dict per entry, keyed by NotificationLog column names.
+                Each must include event_type, event_payload and status.
+
+        Returns:
+            Created NotificationLog instances in insertion order.
+        """
+        if not rows:
+            return []
+
+        inserted = self.session.scalars(insert(NotificationLog).returning(NotificationLog), rows)
+        return sorted(inserted, key=lambda entry: entry.id)
+
     def list_log_entries(
         self,
         event_type: str | None = None,
@@ -731,54 +910,30 @@ class NotificationRepository(BaseRepository[NotificationChannel]):
         if since is not None:
             stmt = stmt.where(NotificationLog.sent_at >= since)
 
-        stmt = stmt.order_by(NotificationLog.sent_at.desc())
+        # sent_at is the server's now(), which several entries written in one
+        # transaction share, so id breaks ties in insertion order.
+        stmt = stmt.order_by(NotificationLog.sent_at.desc(), NotificationLog.id.desc())
         stmt = stmt.offset(offset).limit(limit)
 
         return list(self.session.scalars(stmt))
 
-    def get_recent_logs(self, limit: int = 10) -> list[NotificationLog]:
-        """Get recent notification logs.
+    def delete_logs_before(self, cutoff: datetime) -> int:
+        """Delete notification log entries sent before a cutoff.
 
         Args:
-            limit: Maximum results.
+            cutoff: Entries with sent_at before this time are deleted.
 
         Returns:
-            List of recent NotificationLog instances.
+            Number of entries deleted.
         """
-        return self.list_log_entries(limit=limit)
+        stmt = delete(NotificationLog).where(NotificationLog.sent_at < cutoff)
+        result = cast(CursorResult[Any], self.session.execute(stmt))
+        return result.rowcount
 
     # =========================================================================
     # Aggregate Queries
     # =========================================================================
 
-    def count_channels(self, enabled_only: bool = False) -> int:
-        """Count notification channels.
-
-        Args:
-            enabled_only: Only count enabled channels.
-
-        Returns:
-            Number of channels.
-        """
-        stmt = select(func.count(NotificationChannel.id))
-        if enabled_only:
-            stmt = stmt.where(NotificationChannel.is_enabled == True)  # noqa: E712
-        return self.session.scalar(stmt) or 0
-
-    def count_rules(self, enabled_only: bool = False) -> int:
-        """Count notification rules.
-
-        Args:
-            enabled_only: Only count enabled rules.
-
-        Returns:
-            Number of rules.
-        """
-        stmt = select(func.count(NotificationRule.id))
-        if enabled_only:
-            stmt = stmt.where(NotificationRule.is_enabled == True)  # noqa: E712
-        return self.session.scalar(stmt) or 0
-
     def count_notifications_by_status(
         self,
         days: int = 7,
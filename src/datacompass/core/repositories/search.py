@@ -265,8 +265,20 @@ class SearchRepository:
             )
             count += 1
 
+        # A bulk delete + reinsert leaves many small segments behind
+        self.optimize()
+
         return count
 
+    def optimize(self) -> None:
+        """Merge the FTS index into a single b-tree.
+
+        Reclaims space from deleted rows and keeps query cost flat after
+        repeated rescans. Cost is proportional to the index size, so call
+        it after bulk changes rather than per object.
+        """
+        self.session.execute(text("INSERT INTO catalog_fts(catalog_fts) VALUES('optimize')"))
+
     def delete_object(self, object_id: int) -> None:
         """Remove an object from the FTS index.
 
@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, desc, func, insert, select
 from sqlalchemy.orm import joinedload
 
 from datacompass.core.models import CatalogObject
@@ -68,6 +68,27 @@ class UsageRepository(BaseRepository[UsageMetric]):
         self.flush()
         return metric
 
+    def record_metrics_many(self, rows: list[dict[str, Any]]) -> int:
+        """Record usage metrics for many objects at once.
+
+        Rows are sent as a single executemany, which SQLAlchemy batches into
+        multi-row INSERTs, instead of one INSERT and flush per object.
+
+        Args:
+            rows: One dict per snapshot, keyed by UsageMetric column names.
+                Each must include object_id; collected_at defaults to now.
+
+        Returns:
+            Number of rows inserted.
+        """
+        if not rows:
+            return 0
+
+        now = datetime.utcnow()
+        params = [{"collected_at": now, **row} for row in rows]
+        self.session.execute(insert(UsageMetric), params)
+        return len(params)
+
     def get_latest(self, object_id: int) -> UsageMetric | None:
         """Get the most recent usage metrics for an object.
 
@@ -6,14 +6,16 @@ the actual work and records the results.
 
 import logging
 from datetime import datetime
-from typing import Any
+from typing import Any, get_args
 
 from datacompass.core.database import get_session
 from datacompass.core.events import (
     DeprecationDeadlineEvent,
+    Event,
     ScheduleRunCompletedEvent,
     get_event_bus,
 )
+from datacompass.core.models.scheduling import JobType, Schedule
 from datacompass.core.repositories.scheduling import SchedulingRepository
 
 logger = logging.getLogger(__name__)
@@ -43,8 +45,10 @@ def execute_job(schedule_id: int) -> None:
 
         logger.info(f"Executing scheduled job: {schedule.name} ({schedule.job_type})")
 
-        # Create run record
+        # Create run record, and move next_run_at past this run so a
+        # concurrent run_due_jobs() does not dispatch it again
         run = repo.create_run(schedule_id)
+        _advance_next_run(schedule)
         session.commit()
 
         result_summary: dict[str, Any] = {}
@@ -103,6 +107,50 @@ def execute_job(schedule_id: int) -> None:
         session.close()
 
 
+def run_due_jobs(
+    job_type: str | None = None,
+    due_at: datetime | None = None,
+) -> list[int]:
+    """Execute every enabled schedule whose next run time has passed.
+
+    Lets deployments without the scheduler daemon drive schedules from
+    cron or a systemd timer, and catches up runs missed while the daemon
+    was down. Due schedules are found with get_due_schedules, one job type
+    at a time.
+
+    Args:
+        job_type: Only run schedules of this job type (defaults to all).
+        due_at: Cutoff for next_run_at (defaults to now).
+
+    Returns:
+        IDs of the schedules that were executed, in dispatch order.
+    """
+    job_types = [job_type] if job_type is not None else list(get_args(JobType))
+    due_at = due_at or datetime.utcnow()
+
+    session = get_session()
+    try:
+        repo = SchedulingRepository(session)
+        schedule_ids = [
+            schedule.id
+            for type_ in job_types
+            for schedule in repo.get_due_schedules(type_, due_at=due_at)
+        ]
+    finally:
+        session.close()
+
+    for schedule_id in schedule_ids:
+        execute_job(schedule_id)
+    return schedule_ids
+
+
+def _advance_next_run(schedule: Schedule) -> None:
+    """Set a schedule's next_run_at to its next fire time after now."""
+    from datacompass.core.scheduler.scheduler import compute_next_run_at
+
+    schedule.next_run_at = compute_next_run_at(schedule.cron_expression, schedule.timezone)
+
+
 def _execute_scan(source_id: int | None) -> dict[str, Any]:
     """Execute a catalog scan job.
 
@@ -248,7 +296,7 @@ def _execute_deprecation_check(campaign_id: int | None) -> dict[str, Any]:
             campaigns = deprecation_service.list_campaigns(status="active")
 
         deadlines_approaching = 0
-        events_emitted = 0
+        events: list[Event] = []
 
         for campaign in campaigns:
             # Check if deadline is within threshold (7 days or 14 days)
@@ -266,13 +314,15 @@ def _execute_deprecation_check(campaign_id: int | None) -> dict[str, Any]:
                     days_remaining=days_remaining,
                     object_count=len(campaign.deprecations) if hasattr(campaign, 'deprecations') else 0,
                 )
-                get_event_bus().emit(event)
-                events_emitted += 1
+                events.append(event)
+
+        # One batch, so a rule covering several campaigns sends one digest
+        get_event_bus().emit_many(events)
 
         return {
             "campaigns_checked": len(campaigns),
             "deadlines_approaching": deadlines_approaching,
-            "events_emitted": events_emitted,
+            "events_emitted": len(events),
         }
 
     finally:
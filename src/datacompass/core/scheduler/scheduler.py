@@ -5,7 +5,8 @@ Supports cron expressions and persists jobs to the database.
 """
 
 import logging
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any, Callable
 
 from datacompass.config import get_settings
@@ -16,6 +17,101 @@ from datacompass.core.scheduler.jobs import execute_job
 
 logger = logging.getLogger(__name__)
 
+CRON_TRIGGER_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=CRON_TRIGGER_CACHE_SIZE)
+def get_cron_trigger(cron_expression: str, tz: str) -> Any:
+    """Build an APScheduler trigger for a cron expression.
+
+    Triggers are immutable once built, so one instance is shared by every
+    schedule with the same expression and timezone.
+
+    Args:
+        cron_expression: Five-field cron expression.
+        tz: Timezone the expression is evaluated in.
+
+    Returns:
+        APScheduler CronTrigger instance.
+
+    Raises:
+        ValueError: If the expression does not have five fields.
+    """
+    from apscheduler.triggers.cron import CronTrigger
+
+    # Parse cron expression (5 fields: minute hour day month day_of_week)
+    parts = cron_expression.split()
+    if len(parts) != 5:
+        raise ValueError(f"Invalid cron expression: {cron_expression}")
+
+    minute, hour, day, month, day_of_week = parts
+
+    return CronTrigger(
+        minute=minute,
+        hour=hour,
+        day=day,
+        month=month,
+        day_of_week=day_of_week,
+        timezone=tz,
+    )
+
+
+def validate_cron_expression(cron_expression: str) -> str:
+    """Check that a cron expression is well formed.
+
+    The field count is always checked. When APScheduler is installed the
+    fields are also parsed through get_cron_trigger, so a malformed value
+    such as ``61 * * * *`` is rejected before it reaches the scheduler loop,
+    and a UTC schedule's next_run_at computation reuses the cached trigger.
+
+    Args:
+        cron_expression: Five-field cron expression.
+
+    Returns:
+        The expression, unchanged.
+
+    Raises:
+        ValueError: If the expression is invalid.
+    """
+    parts = cron_expression.split()
+    if len(parts) != 5:
+        raise ValueError(f"expected 5 fields, got {len(parts)}")
+
+    try:
+        get_cron_trigger(cron_expression, "UTC")
+    except ImportError:
+        # Without APScheduler only the field count can be checked.
+        return cron_expression
+    return cron_expression
+
+
+def compute_next_run_at(
+    cron_expression: str,
+    tz: str,
+    now: datetime | None = None,
+) -> datetime | None:
+    """Compute the next fire time of a cron expression.
+
+    Args:
+        cron_expression: Five-field cron expression.
+        tz: Timezone the expression is evaluated in.
+        now: Timezone-aware reference time (defaults to the current time).
+
+    Returns:
+        Next fire time as a naive UTC datetime, matching how next_run_at is
+        compared in get_due_schedules, or None if APScheduler is not installed
+        or the expression never fires again.
+    """
+    try:
+        trigger = get_cron_trigger(cron_expression, tz)
+    except ImportError:
+        return None
+
+    next_fire: datetime | None = trigger.get_next_fire_time(None, now or datetime.now(UTC))
+    if next_fire is None:
+        return None
+    return next_fire.astimezone(UTC).replace(tzinfo=None)
+
 
 class DataCompassScheduler:
     """Scheduler wrapper for managing automated jobs.
@@ -189,7 +285,9 @@ class DataCompassScheduler:
                     if job and job.next_run_time:
                         repo.update_schedule(
                             schedule_id=schedule.id,
-                            next_run_at=job.next_run_time.replace(tzinfo=None),
+                            next_run_at=job.next_run_time.astimezone(
+                                UTC
+                            ).replace(tzinfo=None),
                         )
 
                     logger.info(f"Loaded schedule: {schedule.name}")
@@ -211,23 +309,7 @@ class DataCompassScheduler:
         Returns:
             APScheduler CronTrigger instance.
         """
-        from apscheduler.triggers.cron import CronTrigger
-
-        # Parse cron expression (5 fields: minute hour day month day_of_week)
-        parts = schedule.cron_expression.split()
-        if len(parts) != 5:
-            raise ValueError(f"Invalid cron expression: {schedule.cron_expression}")
-
-        minute, hour, day, month, day_of_week = parts
-
-        return CronTrigger(
-            minute=minute,
-            hour=hour,
-            day=day,
-            month=month,
-            day_of_week=day_of_week,
-            timezone=schedule.timezone,
-        )
+        return get_cron_trigger(schedule.cron_expression, schedule.timezone)
 
 
 # Global scheduler instance
@@ -160,8 +160,9 @@ class AuthService:
         if len(key) < 8:
             raise InvalidCredentialsError("Invalid API key format")
 
+        # Revoked and expired keys are filtered out by the lookup itself
         prefix = key[:8]
-        api_key = self.api_key_repo.get_by_prefix(prefix)
+        api_key = self.api_key_repo.get_active_by_prefix(prefix)
 
         if api_key is None:
             raise InvalidCredentialsError("Invalid API key")
@@ -171,14 +172,6 @@ class AuthService:
         if api_key.key_hash != key_hash:
             raise InvalidCredentialsError("Invalid API key")
 
-        # Check if key is active
-        if not api_key.is_active:
-            raise InvalidCredentialsError("API key has been revoked")
-
-        # Check if key is expired
-        if api_key.expires_at and api_key.expires_at < datetime.utcnow():
-            raise InvalidCredentialsError("API key has expired")
-
         # Check if user is active
         if not api_key.user.is_active:
             raise InvalidCredentialsError("User account is disabled")
@@ -272,9 +265,10 @@ class AuthService:
         """
         user = self.validate_refresh_token(refresh_token)
 
-        # Invalidate old refresh token
+        # Invalidate old refresh token. Both lookups target unreplaced tokens,
+        # so get_valid() can be served by ix_refresh_tokens_token_hash.
         old_hash = self._hash_refresh_token(refresh_token)
-        old_token = self.refresh_token_repo.get_by_hash(old_hash)
+        old_token = self.refresh_token_repo.get_valid(old_hash)
 
         # Create new tokens
         response = self.create_token_response(user)
@@ -282,7 +276,7 @@ class AuthService:
         # Mark old token as replaced
         if old_token:
             new_hash = self._hash_refresh_token(response.refresh_token)
-            new_token = self.refresh_token_repo.get_by_hash(new_hash)
+            new_token = self.refresh_token_repo.get_valid(new_hash)
             if new_token:
                 old_token.replaced_by = new_token.id
 
@@ -449,6 +443,28 @@ class AuthService:
 
         return updated
 
+    def deactivate_and_schedule_purge(self, email: str) -> User:
+        """Disable a user account and defer credential cleanup.
+
+        Unlike disable_user(), sessions and refresh tokens are left in place;
+        they are already rejected because the user is inactive, and
+        purge_inactive_user_credentials() removes them later in batches.
+
+        Args:
+            email: User email address.
+
+        Returns:
+            Updated User instance.
+
+        Raises:
+            UserNotFoundError: If user not found.
+        """
+        user = self.get_user_by_email(email)
+        updated = self.user_repo.set_active(user.id, False)
+        if updated is None:
+            raise UserNotFoundError(email)
+        return updated
+
     def enable_user(self, email: str) -> User:
         """Enable a user account.
 
@@ -599,26 +615,57 @@ class AuthService:
             "refresh_token_expire_days": self._settings.auth_refresh_token_expire_days,
         }
 
+    def purge_expired_sessions(self) -> int:
+        """Delete expired sessions.
+
+        sessions.expires_at is deliberately unindexed; the table stays small
+        as long as this runs periodically, so the scan is cheap.
+
+        Returns:
+            Number of sessions deleted.
+        """
+        return self.session_repo.delete_expired()
+
+    def purge_inactive_user_credentials(self, batch_size: int = 10_000) -> int:
+        """Delete sessions and refresh tokens belonging to inactive users.
+
+        Runs one DELETE per table per batch of users, so the cost is bounded
+        by the number of batches rather than the number of rows.
+
+        Args:
+            batch_size: Number of users per DELETE statement.
+
+        Returns:
+            Total number of sessions and refresh tokens deleted.
+        """
+        user_ids = self.user_repo.get_inactive_ids()
+        deleted = 0
+        for start in range(0, len(user_ids), batch_size):
+            batch = user_ids[start : start + batch_size]
+            deleted += self.session_repo.delete_for_users(batch)
+            deleted += self.refresh_token_repo.delete_for_users(batch)
+        return deleted
+
     @staticmethod
-    def _hash_api_key(key: str) -> str:
+    def _hash_api_key(key: str) -> bytes:
         """Hash an API key for storage.
 
         Args:
             key: Full API key.
 
         Returns:
-            SHA-256 hash of the key.
+            Raw 32-byte SHA-256 digest of the key.
         """
-        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return hashlib.sha256(key.encode("utf-8")).digest()
 
     @staticmethod
-    def _hash_refresh_token(token: str) -> str:
+    def _hash_refresh_token(token: str) -> bytes:
         """Hash a refresh token for storage.
 
         Args:
             token: Refresh token.
 
         Returns:
-            SHA-256 hash of the token.
+            Raw 32-byte SHA-256 digest of the token.
         """
-        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+        return hashlib.sha256(token.encode("utf-8")).digest()
@@ -94,20 +94,13 @@ class CatalogService:
                 # Get all objects from source
                 objects = await adapter.get_objects()
 
+                # Upsert objects in batched statements
+                upserted = self.object_repo.upsert_many(source.id, objects)
+
                 # Track IDs of objects we've seen (for soft-delete detection)
                 seen_ids: set[int] = set()
-
-                # Upsert objects
-                for obj_data in objects:
-                    obj, action = self.object_repo.upsert(
-                        source_id=source.id,
-                        schema_name=obj_data["schema_name"],
-                        object_name=obj_data["object_name"],
-                        object_type=obj_data["object_type"],
-                        source_metadata=obj_data.get("source_metadata"),
-                    )
-                    self.session.flush()  # Get ID for new objects
-                    seen_ids.add(obj.id)
+                for object_id, action in upserted.values():
+                    seen_ids.add(object_id)
 
                     if action == "created":
                         stats.objects_created += 1
@@ -133,18 +126,11 @@ class CatalogService:
                 # Upsert columns for each object
                 for obj_data in objects:
                     key = (obj_data["schema_name"], obj_data["object_name"])
-                    obj = self.object_repo.get_by_natural_key(
-                        source_id=source.id,
-                        schema_name=obj_data["schema_name"],
-                        object_name=obj_data["object_name"],
-                        object_type=obj_data["object_type"],
-                    )
-                    if obj is None:
-                        continue
+                    object_id, _ = upserted[(*key, obj_data["object_type"])]
 
                     obj_columns = columns_by_object.get(key, [])
                     created, updated, deleted = self.column_repo.upsert_batch(
-                        object_id=obj.id,
+                        object_id=object_id,
                         columns=[
                             {
                                 "column_name": c["column_name"],
@@ -371,14 +357,11 @@ class CatalogService:
             source_name, schema_name, object_name = parts
             source = self.source_repo.get_by_name(source_name)
             if source:
-                # Get objects matching schema.name (could be multiple types)
-                objects = self.object_repo.list_objects(
-                    source_id=source.id,
-                    schema_name=schema_name,
+                obj = self.object_repo.get_by_qualified_name(
+                    source.id, schema_name, object_name
                 )
-                for obj in objects:
-                    if obj.object_name == object_name:
-                        return self.object_repo.get_with_source(obj.id)
+                if obj:
+                    return self.object_repo.get_with_source(obj.id)
 
         return None
 
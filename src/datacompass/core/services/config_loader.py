@@ -7,6 +7,10 @@ from typing import Any
 
 import yaml
 
+# libyaml's C loader parses several times faster than the pure-Python one
+# and applies the same safe tag set; PyYAML builds without it fall back.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigLoadError(Exception):
     """Raised when configuration loading fails."""
@@ -77,7 +81,7 @@ def load_yaml_config(path: Path) -> dict[str, Any]:
 
     try:
         with open(path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         raise ConfigLoadError(f"Invalid YAML in {path}: {e}") from e
 
@@ -1,5 +1,6 @@
 """Service for Deprecation Campaign operations."""
 
+from collections.abc import Iterator
 from datetime import date
 
 from sqlalchemy.orm import Session
@@ -22,6 +23,13 @@ from datacompass.core.services.lineage_service import LineageService
 from datacompass.core.services.source_service import SourceNotFoundError
 
 
+def _days_remaining(status: str, target_date: date, today: date) -> int | None:
+    """Days from ``today`` until ``target_date`` (None for completed campaigns)."""
+    if status == "completed":
+        return None
+    return (target_date - today).days
+
+
 class DeprecationServiceError(Exception):
     """Base exception for deprecation service errors."""
 
@@ -174,6 +182,10 @@ class DeprecationService:
             limit=limit,
             offset=offset,
         )
+        object_counts = self.deprecation_repo.count_objects_by_campaign(
+            [c.id for c in campaigns]
+        )
+        today = date.today()
 
         return [
             CampaignListItem(
@@ -183,7 +195,8 @@ class DeprecationService:
                 name=c.name,
                 status=c.status,
                 target_date=c.target_date,
-                object_count=len(c.deprecations),
+                object_count=object_counts.get(c.id, 0),
+                days_remaining=_days_remaining(c.status, c.target_date, today),
             )
             for c in campaigns
         ]
@@ -385,13 +398,58 @@ class DeprecationService:
         Raises:
             CampaignNotFoundError: If campaign not found.
         """
+        campaign = self._get_campaign_or_raise(campaign_id)
+
+        impacts = list(self._iter_campaign_impacts(campaign, depth))
+        total_impacted_ids = {
+            impacted.id for impact in impacts for impacted in impact.impacted_objects
+        }
+
+        return CampaignImpactSummary(
+            campaign_id=campaign.id,
+            campaign_name=campaign.name,
+            total_deprecated=len(campaign.deprecations),
+            total_impacted=len(total_impacted_ids),
+            impacts=impacts,
+        )
+
+    def iter_impacts(
+        self,
+        campaign_id: int,
+        depth: int = 3,
+    ) -> Iterator[DeprecationImpact]:
+        """Yield the downstream impact of each deprecated object in turn.
+
+        Unlike check_impact, only one object's lineage is held at a time,
+        which keeps memory flat for large campaigns. The campaign is looked
+        up before the iterator is returned.
+
+        Args:
+            campaign_id: ID of the campaign.
+            depth: Maximum traversal depth (1-10).
+
+        Returns:
+            Iterator of DeprecationImpact, one per deprecated object.
+
+        Raises:
+            CampaignNotFoundError: If campaign not found.
+        """
+        campaign = self._get_campaign_or_raise(campaign_id)
+        return self._iter_campaign_impacts(campaign, depth)
+
+    def _get_campaign_or_raise(self, campaign_id: int) -> DeprecationCampaign:
+        """Load a campaign or raise CampaignNotFoundError."""
         campaign = self.deprecation_repo.get_campaign(campaign_id)
         if campaign is None:
             raise CampaignNotFoundError(campaign_id)
+        return campaign
 
-        impacts: list[DeprecationImpact] = []
-        total_impacted_ids: set[int] = set()
-
+    def _iter_campaign_impacts(
+        self,
+        campaign: DeprecationCampaign,
+        depth: int,
+    ) -> Iterator[DeprecationImpact]:
+        """Yield a DeprecationImpact for each deprecation in the campaign."""
         for deprecation in campaign.deprecations:
             obj = deprecation.object
             deprecated_name = f"{obj.source.name}.{obj.schema_name}.{obj.object_name}"
@@ -403,49 +461,33 @@ class DeprecationService:
                     direction="downstream",
                     depth=depth,
                 )
-
-                impacted_objects = [
-                    ImpactedObject(
-                        id=node.id,
-                        source_name=node.source_name,
-                        schema_name=node.schema_name,
-                        object_name=node.object_name,
-                        object_type=node.object_type,
-                        distance=node.distance,
-                    )
-                    for node in graph.nodes
-                ]
-
-                # Track unique impacted IDs
-                for node in graph.nodes:
-                    total_impacted_ids.add(node.id)
-
-                impacts.append(
-                    DeprecationImpact(
-                        deprecated_object_id=obj.id,
-                        deprecated_object_name=deprecated_name,
-                        downstream_count=len(impacted_objects),
-                        impacted_objects=impacted_objects,
-                    )
-                )
             except ObjectNotFoundError:
                 # Object might have been deleted; skip
-                impacts.append(
-                    DeprecationImpact(
-                        deprecated_object_id=obj.id,
-                        deprecated_object_name=deprecated_name,
-                        downstream_count=0,
-                        impacted_objects=[],
-                    )
+                yield DeprecationImpact(
+                    deprecated_object_id=obj.id,
+                    deprecated_object_name=deprecated_name,
+                    downstream_count=0,
+                    impacted_objects=[],
                 )
-
-        return CampaignImpactSummary(
-            campaign_id=campaign.id,
-            campaign_name=campaign.name,
-            total_deprecated=len(campaign.deprecations),
-            total_impacted=len(total_impacted_ids),
-            impacts=impacts,
-        )
+                continue
+
+            impacted_objects = [
+                ImpactedObject(
+                    id=node.id,
+                    source_name=node.source_name,
+                    schema_name=node.schema_name,
+                    object_name=node.object_name,
+                    object_type=node.object_type,
+                    distance=node.distance,
+                )
+                for node in graph.nodes
+            ]
+            yield DeprecationImpact(
+                deprecated_object_id=obj.id,
+                deprecated_object_name=deprecated_name,
+                downstream_count=len(impacted_objects),
+                impacted_objects=impacted_objects,
+            )
 
     # =========================================================================
     # Hub Summary
@@ -460,6 +502,10 @@ class DeprecationService:
         status_counts = self.deprecation_repo.count_campaigns_by_status()
         total_deprecated = self.deprecation_repo.count_total_deprecated_objects()
         upcoming = self.deprecation_repo.get_upcoming_campaigns(days=30, limit=5)
+        object_counts = self.deprecation_repo.count_objects_by_campaign(
+            [c.id for c in upcoming]
+        )
+        today = date.today()
 
         upcoming_items = [
             CampaignListItem(
@@ -469,7 +515,8 @@ class DeprecationService:
                 name=c.name,
                 status=c.status,
                 target_date=c.target_date,
-                object_count=len(c.deprecations),
+                object_count=object_counts.get(c.id, 0),
+                days_remaining=_days_remaining(c.status, c.target_date, today),
             )
             for c in upcoming
         ]
@@ -505,6 +552,9 @@ class DeprecationService:
             ],
             created_at=campaign.created_at,
             updated_at=campaign.updated_at,
+            days_remaining=_days_remaining(
+                campaign.status, campaign.target_date, date.today()
+            ),
         )
 
     def _deprecation_to_response(self, deprecation: Deprecation) -> DeprecationResponse:
@@ -292,13 +292,10 @@ class DocumentationService:
             source_name, schema_name, object_name = parts
             source = self.source_repo.get_by_name(source_name)
             if source:
-                # Get objects matching schema.name (could be multiple types)
-                objects = self.object_repo.list_objects(
-                    source_id=source.id,
-                    schema_name=schema_name,
+                obj = self.object_repo.get_by_qualified_name(
+                    source.id, schema_name, object_name
                 )
-                for obj in objects:
-                    if obj.object_name == object_name:
-                        return self.object_repo.get_with_source(obj.id)
+                if obj:
+                    return self.object_repo.get_with_source(obj.id)
 
         return None
@@ -1,7 +1,7 @@
 """Service for Data Quality operations."""
 
 import random
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -22,7 +22,7 @@ from datacompass.core.models.dq import (
     ThresholdConfig,
     YAMLDQConfig,
 )
-from datacompass.core.events import DQBreachEvent, get_event_bus
+from datacompass.core.events import DQBreachEvent, Event, get_event_bus
 from datacompass.core.repositories import CatalogObjectRepository
 from datacompass.core.repositories.dq import DQRepository
 from datacompass.core.services.catalog_service import CatalogService, ObjectNotFoundError
@@ -154,9 +154,11 @@ class DQService:
             offset=offset,
         )
 
+        counts = self.dq_repo.get_counts_for_configs([c.id for c in configs])
+
         result = []
         for config in configs:
-            open_breach_count = self.dq_repo.get_open_breach_count_for_config(config.id)
+            expectation_count, open_breach_count = counts.get(config.id, (0, 0))
             result.append(
                 DQConfigListItem(
                     id=config.id,
@@ -167,7 +169,7 @@ class DQService:
                     date_column=config.date_column,
                     grain=config.grain,
                     is_enabled=config.is_enabled,
-                    expectation_count=len(config.expectations),
+                    expectation_count=expectation_count,
                     open_breach_count=open_breach_count,
                 )
             )
@@ -623,33 +625,38 @@ expectations:
             raise DQConfigNotFoundError(config_id)
 
         expectations = self.dq_repo.get_enabled_expectations(config_id)
-        results: list[DQRunResultItem] = []
-        passed = 0
-        breached = 0
-
+        rows = []
         for expectation in expectations:
-            # Compute thresholds
             low, high = self.compute_threshold(expectation, snapshot_date)
+            rows.append(
+                {
+                    "expectation_id": expectation.id,
+                    # Get metric value (mock for Phase 6.0)
+                    "metric_value": self._get_mock_metric_value(expectation),
+                    "computed_threshold_low": low,
+                    "computed_threshold_high": high,
+                }
+            )
 
-            # Get metric value (mock for Phase 6.0)
-            metric_value = self._get_mock_metric_value(expectation)
+        # Record all results in one batch, then check each for a breach
+        recorded = self.dq_repo.record_results_many(snapshot_date, rows)
 
-            # Record result
-            result = self.dq_repo.record_result(
-                expectation_id=expectation.id,
-                snapshot_date=snapshot_date,
-                metric_value=metric_value,
-                computed_threshold_low=low,
-                computed_threshold_high=high,
-            )
+        results: list[DQRunResultItem] = []
+        breach_events: list[Event] = []
+        passed = 0
+        breached = 0
 
-            # Check for breach
+        for expectation in expectations:
+            result = recorded[expectation.id]
+            low = result.computed_threshold_low
+            high = result.computed_threshold_high
             breach = self._detect_breach(expectation, result, low, high)
 
             if breach:
                 breached += 1
                 status = "breach"
                 breach_id = breach.id
+                breach_events.append(self._breach_event(expectation, breach))
             else:
                 passed += 1
                 status = "pass"
@@ -660,7 +667,7 @@ expectations:
                     expectation_id=expectation.id,
                     expectation_type=expectation.expectation_type,
                     column_name=expectation.column_name,
-                    metric_value=metric_value,
+                    metric_value=result.metric_value,
                     computed_threshold_low=low,
                     computed_threshold_high=high,
                     status=status,
@@ -668,6 +675,10 @@ expectations:
                 )
             )
 
+        # Emit the run's breaches together so notification rules matching
+        # several of them send one digest instead of a message per breach
+        get_event_bus().emit_many(breach_events)
+
         return DQRunResult(
             config_id=config_id,
             object_name=config.object.object_name,
@@ -766,10 +777,20 @@ expectations:
             threshold_snapshot=expectation.threshold_config,
         )
 
-        # Emit DQ breach event for notifications
-        config = expectation.config
-        obj = config.object
-        event = DQBreachEvent.create(
+        return breach
+
+    def _breach_event(self, expectation: DQExpectation, breach: DQBreach) -> DQBreachEvent:
+        """Build the notification event for a detected breach.
+
+        Args:
+            expectation: The expectation that was breached.
+            breach: The breach that was recorded.
+
+        Returns:
+            DQBreachEvent describing the breach.
+        """
+        obj = expectation.config.object
+        return DQBreachEvent.create(
             breach_id=breach.id,
             expectation_id=expectation.id,
             object_name=obj.object_name,
@@ -777,16 +798,29 @@ expectations:
             source_name=obj.source.name,
             expectation_type=expectation.expectation_type,
             column_name=expectation.column_name,
-            metric_value=value,
-            threshold_value=threshold_value,
-            breach_direction=breach_direction,
-            deviation_percent=deviation_percent,
+            metric_value=breach.metric_value,
+            threshold_value=breach.threshold_value,
+            breach_direction=breach.breach_direction,
+            deviation_percent=breach.deviation_percent,
             priority=expectation.priority,
-            snapshot_date=str(result.snapshot_date),
+            snapshot_date=str(breach.snapshot_date),
         )
-        get_event_bus().emit(event)
 
-        return breach
+    def prune_results(self, retain_days: int = 365) -> int:
+        """Delete results older than the retention window.
+
+        Keeps result history bounded so inserts and threshold lookups stay
+        cheap. Results attached to a breach are always kept. The window
+        should exceed the longest threshold lookback (90 days).
+
+        Args:
+            retain_days: Number of days of results to keep.
+
+        Returns:
+            Number of results deleted.
+        """
+        cutoff = date.today() - timedelta(days=retain_days)
+        return self.dq_repo.delete_results_before(cutoff)
 
     # =========================================================================
     # Breach Management
@@ -795,6 +829,9 @@ expectations:
     def get_breach(self, breach_id: int) -> BreachDetailResponse:
         """Get breach with full details.
 
+        The lifecycle history includes events archived out of the breach's
+        inline list, oldest first.
+
         Args:
             breach_id: ID of the breach.
 
@@ -808,7 +845,7 @@ expectations:
         if breach is None:
             raise DQBreachNotFoundError(breach_id)
 
-        return self._breach_to_detail_response(breach)
+        return self._breach_to_detail_response(breach, include_archived=True)
 
     def list_breaches(
         self,
@@ -873,7 +910,7 @@ expectations:
 
         # Reload with full details
         breach = self.dq_repo.get_breach_with_details(breach_id)
-        return self._breach_to_detail_response(breach)
+        return self._breach_to_detail_response(breach, include_archived=True)
 
     # =========================================================================
     # Hub Summary
@@ -890,9 +927,15 @@ expectations:
         total_expectations = self.dq_repo.count_expectations()
         enabled_expectations = self.dq_repo.count_expectations(enabled_only=True)
 
-        breaches_by_status = self.dq_repo.count_breaches_by_status()
+        breaches_by_status: dict[str, int] = {}
+        breaches_by_priority: dict[str, int] = {}
+        for (status, priority), count in (
+            self.dq_repo.count_breaches_by_status_and_priority().items()
+        ):
+            breaches_by_status[status] = breaches_by_status.get(status, 0) + count
+            if status == "open":
+                breaches_by_priority[priority] = count
         open_breaches = breaches_by_status.get("open", 0)
-        breaches_by_priority = self.dq_repo.count_open_breaches_by_priority()
 
         # Get recent open breaches
         recent_breaches = self.list_breaches(status="open", limit=10)
@@ -930,12 +973,32 @@ expectations:
             updated_at=config.updated_at,
         )
 
-    def _breach_to_detail_response(self, breach: DQBreach) -> BreachDetailResponse:
-        """Convert DQBreach to BreachDetailResponse."""
+    def _breach_to_detail_response(
+        self, breach: DQBreach, include_archived: bool = False
+    ) -> BreachDetailResponse:
+        """Convert DQBreach to BreachDetailResponse.
+
+        Args:
+            breach: Breach with its expectation, config and object loaded.
+            include_archived: Prepend lifecycle events archived to
+                dq_breach_events. Costs one query, so list views skip it.
+        """
         expectation = breach.expectation
         config = expectation.config
         obj = config.object
 
+        lifecycle_events: list[dict[str, Any]] = list(breach.lifecycle_events or [])
+        if include_archived:
+            lifecycle_events[:0] = [
+                {
+                    "status": event.status,
+                    "by": event.changed_by or "system",
+                    "at": event.changed_at,
+                    "notes": event.notes,
+                }
+                for event in self.dq_repo.get_archived_events(breach.id)
+            ]
+
         return BreachDetailResponse(
             id=breach.id,
             expectation_id=breach.expectation_id,
@@ -958,5 +1021,5 @@ expectations:
             column_name=expectation.column_name,
             priority=expectation.priority,
             threshold_snapshot=breach.threshold_snapshot,
-            lifecycle_events=breach.lifecycle_events or [],
+            lifecycle_events=lifecycle_events,
         )
@@ -1,11 +1,18 @@
 """Service for lineage operations (dependency tracking and graph traversal)."""
 
-from collections import deque
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from itertools import chain
 from typing import Any, Literal
 
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
 
+from datacompass.core.models import CatalogObject, DataSource
 from datacompass.core.models.dependency import (
+    Dependency,
     ExternalNode,
     LineageEdge,
     LineageGraph,
@@ -23,6 +30,70 @@ class LineageServiceError(Exception):
     pass
 
 
+# =============================================================================
+# Lineage graph cache
+# =============================================================================
+
+LINEAGE_CACHE_SIZE = 1024
+LINEAGE_CACHE_TTL_SECONDS = 60.0
+
+_LINEAGE_MODELS = (CatalogObject, DataSource, Dependency)
+
+_CacheKey = tuple[int, str, int, int]
+
+_cache_lock = threading.Lock()
+_catalog_version = 0
+_lineage_cache: OrderedDict[_CacheKey, tuple[float, LineageGraph]] = OrderedDict()
+
+
+def _bump_catalog_version() -> None:
+    """Invalidate every cached graph by moving to a new catalog version."""
+    global _catalog_version
+    with _cache_lock:
+        _catalog_version += 1
+        _lineage_cache.clear()
+
+
+def clear_lineage_cache() -> None:
+    """Drop all cached lineage graphs."""
+    _bump_catalog_version()
+
+
+@event.listens_for(Session, "after_flush")
+def _on_flush(session: Session, _flush_context: UOWTransaction) -> None:
+    """Bump the catalog version when a flush writes lineage tables."""
+    if any(
+        isinstance(obj, _LINEAGE_MODELS)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info["lineage_written"] = True
+        _bump_catalog_version()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_execute(state: ORMExecuteState) -> None:
+    """Bump the catalog version on bulk INSERT/UPDATE/DELETE of lineage tables."""
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _LINEAGE_MODELS):
+        state.session.info["lineage_written"] = True
+        _bump_catalog_version()
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _on_transaction_end(session: Session) -> None:
+    """Bump again once written lineage tables are committed or rolled back.
+
+    Graphs built by other sessions between the flush and the commit saw the
+    old rows, and graphs built inside a rolled back transaction saw rows that
+    no longer exist.
+    """
+    if session.info.pop("lineage_written", False):
+        _bump_catalog_version()
+
+
 class LineageService:
     """Service for lineage operations.
 
@@ -49,7 +120,15 @@ class LineageService:
         direction: Literal["upstream", "downstream", "both"] = "upstream",
         depth: int = 3,
     ) -> LineageGraph:
-        """Build lineage graph for an object using BFS traversal.
+        """Get the lineage graph for an object.
+
+        Graphs are cached per process, keyed by root, direction, depth and a
+        catalog version that is bumped whenever this process writes catalog
+        objects, sources or dependencies. Entries also expire after
+        LINEAGE_CACHE_TTL_SECONDS, which bounds staleness from writes made by
+        other processes such as scans. A session holding uncommitted lineage
+        writes bypasses the cache, so its own rows are never served to, or
+        read from, other sessions.
 
         Args:
             object_id: ID of the root object.
@@ -66,6 +145,48 @@ class LineageService:
         # Validate depth
         depth = max(1, min(depth, 10))
 
+        if self.session.info.get("lineage_written"):
+            return self._build_lineage(object_id, direction, depth)
+
+        with _cache_lock:
+            key = (object_id, direction, depth, _catalog_version)
+            cached = _lineage_cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                _lineage_cache.move_to_end(key)
+                return cached[1]
+
+        graph = self._build_lineage(object_id, direction, depth)
+
+        with _cache_lock:
+            # Skip storing if the catalog changed while the graph was built
+            if key[3] == _catalog_version:
+                expires_at = time.monotonic() + LINEAGE_CACHE_TTL_SECONDS
+                _lineage_cache[key] = (expires_at, graph)
+                _lineage_cache.move_to_end(key)
+                if len(_lineage_cache) > LINEAGE_CACHE_SIZE:
+                    _lineage_cache.popitem(last=False)
+
+        return graph
+
+    def _build_lineage(
+        self,
+        object_id: int,
+        direction: Literal["upstream", "downstream", "both"],
+        depth: int,
+    ) -> LineageGraph:
+        """Build lineage graph for an object using BFS traversal.
+
+        Args:
+            object_id: ID of the root object.
+            direction: Traversal direction.
+            depth: Maximum traversal depth, already clamped.
+
+        Returns:
+            LineageGraph containing nodes and edges.
+
+        Raises:
+            ObjectNotFoundError: If the object doesn't exist.
+        """
         # Get root object
         root_obj = self.object_repo.get_with_source(object_id)
         if root_obj is None:
@@ -87,6 +208,11 @@ class LineageService:
         edges: list[LineageEdge] = []
         truncated = False
 
+        # Keys of emitted edges and external nodes, so duplicate checks stay
+        # O(1) instead of rescanning the lists for every dependency
+        seen_edges: set[tuple[int, int | str]] = set()
+        seen_external: set[tuple[str | None, str]] = set()
+
         # Determine which directions to traverse
         directions_to_traverse: list[Literal["upstream", "downstream"]] = (
             ["upstream", "downstream"] if direction == "both" else [direction]
@@ -131,16 +257,17 @@ class LineageService:
                                     queue.append((dep.target_id, current_distance + 1))
 
                             # Check for duplicate edges
-                            edge = LineageEdge(
-                                from_id=current_id,
-                                to_id=dep.target_id,
-                                dependency_type=dep.dependency_type,
-                                confidence=dep.confidence,
-                            )
-                            if not any(
-                                e.from_id == edge.from_id and e.to_id == edge.to_id for e in edges
-                            ):
-                                edges.append(edge)
+                            edge_key: tuple[int, int | str] = (current_id, dep.target_id)
+                            if edge_key not in seen_edges:
+                                seen_edges.add(edge_key)
+                                edges.append(
+                                    LineageEdge(
+                                        from_id=current_id,
+                                        to_id=dep.target_id,
+                                        dependency_type=dep.dependency_type,
+                                        confidence=dep.confidence,
+                                    )
+                                )
                         elif dep.target_external:
                             # External dependency
                             ext_key = (
@@ -148,9 +275,8 @@ class LineageService:
                                 dep.target_external.get("name", "unknown"),
                             )
                             # Check if we already have this external node
-                            if not any(
-                                (e.schema_name, e.object_name) == ext_key for e in external_nodes
-                            ):
+                            if ext_key not in seen_external:
+                                seen_external.add(ext_key)
                                 external_nodes.append(
                                     ExternalNode(
                                         schema_name=dep.target_external.get("schema"),
@@ -159,18 +285,21 @@ class LineageService:
                                         distance=current_distance + 1,
                                     )
                                 )
-                            edge = LineageEdge(
-                                from_id=current_id,
-                                to_id=None,
-                                to_external=dep.target_external,
-                                dependency_type=dep.dependency_type,
-                                confidence=dep.confidence,
+                            edge_key = (
+                                current_id,
+                                json.dumps(dep.target_external, sort_keys=True),
                             )
-                            if not any(
-                                e.from_id == edge.from_id and e.to_external == edge.to_external
-                                for e in edges
-                            ):
-                                edges.append(edge)
+                            if edge_key not in seen_edges:
+                                seen_edges.add(edge_key)
+                                edges.append(
+                                    LineageEdge(
+                                        from_id=current_id,
+                                        to_id=None,
+                                        to_external=dep.target_external,
+                                        dependency_type=dep.dependency_type,
+                                        confidence=dep.confidence,
+                                    )
+                                )
                 else:
                     # downstream - get objects that depend on this one
                     deps = self.dependency_repo.get_downstream(current_id)
@@ -194,16 +323,17 @@ class LineageService:
                                 queue.append((dep.object_id, current_distance + 1))
 
                         # Check for duplicate edges
-                        edge = LineageEdge(
-                            from_id=dep.object_id,
-                            to_id=current_id,
-                            dependency_type=dep.dependency_type,
-                            confidence=dep.confidence,
-                        )
-                        if not any(
-                            e.from_id == edge.from_id and e.to_id == edge.to_id for e in edges
-                        ):
-                            edges.append(edge)
+                        edge_key = (dep.object_id, current_id)
+                        if edge_key not in seen_edges:
+                            seen_edges.add(edge_key)
+                            edges.append(
+                                LineageEdge(
+                                    from_id=dep.object_id,
+                                    to_id=current_id,
+                                    dependency_type=dep.dependency_type,
+                                    confidence=dep.confidence,
+                                )
+                            )
 
         return LineageGraph(
             root=root_node,
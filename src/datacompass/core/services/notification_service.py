@@ -1,8 +1,15 @@
 """Service for Notification operations."""
 
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from pydantic import ConfigDict, TypeAdapter
 from sqlalchemy.orm import Session
 
 from datacompass.core.events import Event, get_event_bus
@@ -16,11 +23,142 @@ from datacompass.core.models.scheduling import (
     YAMLSchedulingConfig,
 )
 from datacompass.core.notifications import (
+    BaseNotificationHandler,
     NotificationResult,
     get_handler_for_channel,
 )
 from datacompass.core.repositories.scheduling import NotificationRepository
 
+# An event identical to one already delivered to the same channel within this
+# window (for example a breach re-fired by a retried run) is logged as
+# rate_limited instead of being sent again.
+NOTIFICATION_DEDUP_SECONDS = 300.0
+NOTIFICATION_DEDUP_MAX_ENTRIES = 4096
+
+# Consecutive failed sends after which a channel's circuit opens, and how
+# long it then stays open before the channel is tried again.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN_SECONDS = 30.0
+CIRCUIT_OPEN_MESSAGE = "Circuit open: channel skipped after repeated failures"
+
+# Validates a whole list of log rows in one pydantic-core call. Built on first
+# use, like the response models themselves.
+_LOG_LIST_ADAPTER = TypeAdapter(
+    list[NotificationLogResponse], config=ConfigDict(defer_build=True)
+)
+
+
+def _event_digest(event: Event) -> bytes:
+    """Hash an event's type and payload, ignoring when it was emitted."""
+    body = json.dumps([event.event_type, event.payload], sort_keys=True, default=str)
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=16).digest()
+
+
+class RecentDeliveries:
+    """Remembers which events were recently delivered to which channels.
+
+    Shared by every NotificationService in the process, so duplicates are
+    caught across requests and scheduler runs. Entries expire after the
+    window and the oldest are evicted beyond max_entries.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = NOTIFICATION_DEDUP_SECONDS,
+        max_entries: int = NOTIFICATION_DEDUP_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            window_seconds: How long a delivery suppresses duplicates.
+            max_entries: Upper bound on remembered deliveries.
+        """
+        self._window_seconds = window_seconds
+        self._max_entries = max_entries
+        # Ordered oldest first, so expiry and eviction pop from the front
+        self._entries: OrderedDict[tuple[int, bytes], float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def seen(self, channel_id: int, digest: bytes) -> bool:
+        """Check whether an event was delivered to a channel within the window."""
+        with self._lock:
+            self._expire(time.monotonic())
+            return (channel_id, digest) in self._entries
+
+    def record(self, channel_id: int, digest: bytes) -> None:
+        """Remember a successful delivery."""
+        with self._lock:
+            self._entries[(channel_id, digest)] = time.monotonic()
+            self._entries.move_to_end((channel_id, digest))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all deliveries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _expire(self, now: float) -> None:
+        while self._entries:
+            delivered_at = next(iter(self._entries.values()))
+            if now - delivered_at <= self._window_seconds:
+                return
+            self._entries.popitem(last=False)
+
+
+recent_deliveries = RecentDeliveries()
+
+
+class ChannelCircuitBreaker:
+    """Stops sending to channels that keep failing, for a cooldown.
+
+    A channel whose host is down would otherwise cost a full connection
+    timeout on every event. After a run of consecutive failures its
+    circuit opens and deliveries fail immediately until the cooldown
+    ends; the next send then probes the channel again. Channels may set
+    circuit_failure_threshold and circuit_cooldown_seconds in their config.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with every circuit closed."""
+        # channel_id -> (consecutive failures, monotonic time the circuit closes)
+        self._state: dict[int, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, channel_id: int) -> bool:
+        """Check whether deliveries to a channel are currently skipped."""
+        with self._lock:
+            _, open_until = self._state.get(channel_id, (0, 0.0))
+        return time.monotonic() < open_until
+
+    def record(self, channel_id: int, success: bool, config: dict[str, Any]) -> None:
+        """Record the outcome of a send, opening the circuit when needed.
+
+        Args:
+            channel_id: Channel that was sent to.
+            success: Whether the send succeeded.
+            config: Channel configuration, for the threshold and cooldown.
+        """
+        with self._lock:
+            if success:
+                self._state.pop(channel_id, None)
+                return
+            failures = self._state.get(channel_id, (0, 0.0))[0] + 1
+            threshold = config.get("circuit_failure_threshold", CIRCUIT_FAILURE_THRESHOLD)
+            open_until = 0.0
+            if failures >= threshold:
+                cooldown = config.get("circuit_cooldown_seconds", CIRCUIT_COOLDOWN_SECONDS)
+                open_until = time.monotonic() + cooldown
+            self._state[channel_id] = (failures, open_until)
+
+    def clear(self) -> None:
+        """Close all circuits."""
+        with self._lock:
+            self._state.clear()
+
+
+channel_breakers = ChannelCircuitBreaker()
+
 
 class NotificationServiceError(Exception):
     """Base exception for notification service errors."""
@@ -230,11 +368,13 @@ class NotificationService:
             raise ChannelNotFoundError(channel_id)
         return True
 
-    def test_channel(self, channel_id: int) -> NotificationResult:
+    def test_channel(self, channel_id: int, deep: bool = True) -> NotificationResult:
         """Test a notification channel connection.
 
         Args:
             channel_id: ID of the channel.
+            deep: Run the full check (login, test message); when False,
+                only check that the channel's host is reachable.
 
         Returns:
             NotificationResult indicating success or failure.
@@ -247,7 +387,7 @@ class NotificationService:
             raise ChannelNotFoundError(channel_id)
 
         handler = get_handler_for_channel(channel)
-        return handler.test_connection()
+        return handler.test_connection(deep=deep)
 
     # =========================================================================
     # Rule Management
@@ -422,50 +562,143 @@ class NotificationService:
         Returns:
             List of NotificationLogResponse for sent notifications.
         """
-        # Get matching rules
-        rules = self.notification_repo.get_rules_for_event(event.event_type)
-        logs: list[NotificationLogResponse] = []
-
-        for rule in rules:
-            # Check conditions
-            if not self._check_conditions(rule.conditions, event):
-                continue
+        return self.handle_events([event])
 
-            # Get channel and verify enabled
-            channel = rule.channel
-            if not channel.is_enabled:
-                continue
+    def handle_events(self, events: list[Event]) -> list[NotificationLogResponse]:
+        """Handle a batch of events, sending one digest per matching rule.
 
-            # Send notification
-            handler = get_handler_for_channel(channel)
-            result = handler.send(event, rule.template_override)
+        A rule matched by several events in the batch delivers them as a
+        single digest message rather than one message each, when its
+        channel's handler supports digests (email and Slack). Webhooks
+        still receive one request per event, so receivers keep seeing the
+        original event types and payloads. Every event gets its own log
+        entry per rule.
 
-            # Log the notification
-            log_entry = self.notification_repo.create_log_entry(
-                event_type=event.event_type,
-                event_payload=event.payload,
-                status="sent" if result.success else "failed",
-                rule_id=rule.id,
-                channel_id=channel.id,
-                error_message=result.error_message,
-            )
+        Args:
+            events: Events to handle, in the order they occurred.
 
-            logs.append(NotificationLogResponse.model_validate(log_entry))
+        Returns:
+            List of NotificationLogResponse, one per event and matching rule.
+        """
+        rules_by_type: dict[str, list[NotificationRule]] = {}
+        log_rows: list[dict[str, Any]] = []
+        # Per rule: the events to send and the indexes of their log rows
+        batches: dict[int, tuple[NotificationRule, list[Event], list[int]]] = {}
+        digests: list[bytes] = []
+        # (channel_id, event digest) pairs already queued, matching the key
+        # recent_deliveries uses across batches
+        queued: set[tuple[int, bytes]] = set()
+
+        for event in events:
+            # Get matching rules
+            if event.event_type not in rules_by_type:
+                rules_by_type[event.event_type] = self.notification_repo.get_rules_for_event(
+                    event.event_type
+                )
+            digest = _event_digest(event)
+
+            for rule in rules_by_type[event.event_type]:
+                # Check conditions
+                if not self._check_conditions(rule.conditions, event):
+                    continue
+
+                # Get channel and verify enabled
+                if not rule.channel.is_enabled:
+                    continue
+
+                # Duplicates are logged but not sent; rows to send get their
+                # status once the send completes
+                log_rows.append(
+                    {
+                        "event_type": event.event_type,
+                        "event_payload": event.payload,
+                        "status": "rate_limited",
+                        "rule_id": rule.id,
+                        "channel_id": rule.channel_id,
+                        "error_message": "Duplicate of a recent notification to this channel",
+                    }
+                )
+                digests.append(digest)
+                if (rule.channel_id, digest) in queued or recent_deliveries.seen(
+                    rule.channel_id, digest
+                ):
+                    continue
+                queued.add((rule.channel_id, digest))
+
+                _, batch_events, rows = batches.setdefault(rule.id, (rule, [], []))
+                batch_events.append(event)
+                rows.append(len(log_rows) - 1)
+
+        # Rules that share a channel share its handler
+        handlers: dict[int, BaseNotificationHandler] = {}
+        # One entry per send: its rule and the log rows it covers
+        sends: list[tuple[NotificationRule, list[int]]] = []
+        # Results by send position; channels with an open circuit fail
+        # without being contacted
+        results: list[NotificationResult] = []
+        deliveries: list[tuple[int, BaseNotificationHandler, Event, str | None]] = []
+        for rule, batch_events, rows in batches.values():
+            if channel_breakers.is_open(rule.channel_id):
+                sends.append((rule, rows))
+                results.append(NotificationResult.fail(CIRCUIT_OPEN_MESSAGE))
+                continue
 
-        return logs
+            handler = handlers.get(rule.channel_id)
+            if handler is None:
+                handler = handlers[rule.channel_id] = get_handler_for_channel(rule.channel)
+            if len(batch_events) > 1 and handler.supports_digest:
+                digest_event = handler.build_digest(batch_events, rule.template_override)
+                deliveries.append((len(sends), handler, digest_event, None))
+                sends.append((rule, rows))
+                results.append(NotificationResult.ok())
+                continue
+            for event, row in zip(batch_events, rows, strict=True):
+                deliveries.append((len(sends), handler, event, rule.template_override))
+                sends.append((rule, [row]))
+                results.append(NotificationResult.ok())
+
+        # Send notifications. Handlers only do network I/O, never touch the
+        # session, so several can run at once on the shared dispatch threads.
+        # The results are awaited because each one is logged with its status.
+        if len(deliveries) > 1:
+            futures = [
+                (position, handler.send_async(event, template))
+                for position, handler, event, template in deliveries
+            ]
+            for position, future in futures:
+                results[position] = future.result()
+        else:
+            for position, handler, event, template in deliveries:
+                results[position] = handler.send(event, template)
+
+        delivered = {position for position, *_ in deliveries}
+        for position, ((rule, rows), result) in enumerate(zip(sends, results, strict=True)):
+            if position in delivered:
+                channel_breakers.record(rule.channel_id, result.success, rule.channel.config)
+            for index in rows:
+                log_rows[index]["status"] = "sent" if result.success else "failed"
+                log_rows[index]["error_message"] = result.error_message
+                if result.success:
+                    recent_deliveries.record(rule.channel_id, digests[index])
+
+        # Write all log entries for the batch in one statement
+        logs = self.notification_repo.create_log_entries(log_rows)
+        return _LOG_LIST_ADAPTER.validate_python(logs, from_attributes=True)
 
     def register_with_event_bus(self) -> None:
         """Register this service as a global event handler.
 
         After calling this, all events emitted to the global event bus
-        will be processed by this service.
+        will be processed by this service. Events emitted together with
+        emit_many() are handled as one batch, so rules they share send a
+        digest.
         """
         event_bus = get_event_bus()
-        event_bus.subscribe_all(self._on_event)
+        event_bus.subscribe_batches(self._on_events)
 
-    def _on_event(self, event: Event) -> None:
+    def _on_events(self, events: list[Event]) -> None:
         """Internal event handler callback."""
-        self.handle_event(event)
+        self.handle_events(events)
 
     def _check_conditions(
         self,
@@ -530,7 +763,19 @@ class NotificationService:
             offset=offset,
         )
 
-        return [NotificationLogResponse.model_validate(log) for log in logs]
+        return _LOG_LIST_ADAPTER.validate_python(logs, from_attributes=True)
+
+    def prune_log(self, retain_days: int = 90) -> int:
+        """Delete notification log entries older than the retention window.
+
+        Args:
+            retain_days: Number of days of log entries to keep.
+
+        Returns:
+            Number of entries deleted.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=retain_days)
+        return self.notification_repo.delete_logs_before(cutoff)
 
     # =========================================================================
     # YAML Configuration
@@ -558,16 +803,20 @@ class NotificationService:
         raw_config = load_yaml_config(yaml_path)
         config = YAMLSchedulingConfig.model_validate(raw_config)
 
-        channels_created = 0
         channels_updated = 0
-        rules_created = 0
         rules_updated = 0
 
-        # Process channels first
-        channel_name_to_id: dict[str, int] = {}
+        # Look up every channel the file names, including channels that only
+        # rules refer to, in one query
+        existing_channels = self.notification_repo.get_channels_by_names(
+            [c.name for c in config.channels] + [r.channel for r in config.rules]
+        )
+        channel_name_to_id = {name: channel.id for name, channel in existing_channels.items()}
 
+        # Process channels first
+        new_channels: dict[str, dict[str, Any]] = {}
         for yaml_channel in config.channels:
-            existing = self.notification_repo.get_channel_by_name(yaml_channel.name)
+            existing = existing_channels.get(yaml_channel.name)
 
             if existing:
                 self.notification_repo.update_channel(
@@ -575,38 +824,36 @@ class NotificationService:
                     config=yaml_channel.config,
                     is_enabled=yaml_channel.enabled,
                 )
-                channel_name_to_id[yaml_channel.name] = existing.id
                 channels_updated += 1
             else:
-                channel = self.notification_repo.create_channel(
-                    name=yaml_channel.name,
-                    channel_type=yaml_channel.type,
-                    config=yaml_channel.config,
-                )
-                channel_name_to_id[yaml_channel.name] = channel.id
-                channels_created += 1
+                new_channels[yaml_channel.name] = {
+                    "name": yaml_channel.name,
+                    "channel_type": yaml_channel.type,
+                    "config": yaml_channel.config,
+                }
+
+        # New channels are inserted together; RETURNING gives the IDs that
+        # the rules below refer to
+        channel_name_to_id.update(
+            self.notification_repo.create_channels(list(new_channels.values()))
+        )
+        channels_created = len(new_channels)
+
+        # Existing rules match on name, event type and channel
+        existing_rules: dict[tuple[str, str, int], NotificationRule] = {}
+        for rule in self.notification_repo.list_rules_by_names(r.name for r in config.rules):
+            existing_rules.setdefault((rule.name, rule.event_type, rule.channel_id), rule)
 
         # Process rules
+        new_rules: dict[tuple[str, str, int], dict[str, Any]] = {}
         for yaml_rule in config.rules:
             # Resolve channel name to ID
             channel_id = channel_name_to_id.get(yaml_rule.channel)
             if channel_id is None:
-                # Try to find existing channel
-                existing_channel = self.notification_repo.get_channel_by_name(yaml_rule.channel)
-                if existing_channel:
-                    channel_id = existing_channel.id
-                else:
-                    continue  # Skip rule if channel not found
-
-            # Check if rule with same name exists for this event type
-            existing_rules = self.notification_repo.list_rules(
-                event_type=yaml_rule.event,
-                channel_id=channel_id,
-            )
-            existing_rule = next(
-                (r for r in existing_rules if r.name == yaml_rule.name),
-                None,
-            )
+                continue  # Skip rule if channel not found
+
+            key = (yaml_rule.name, yaml_rule.event, channel_id)
+            existing_rule = existing_rules.get(key)
 
             if existing_rule:
                 self.notification_repo.update_rule(
@@ -617,14 +864,15 @@ class NotificationService:
                 )
                 rules_updated += 1
             else:
-                self.notification_repo.create_rule(
-                    name=yaml_rule.name,
-                    event_type=yaml_rule.event,
-                    channel_id=channel_id,
-                    conditions=yaml_rule.conditions,
-                    template_override=yaml_rule.template,
-                )
-                rules_created += 1
+                new_rules[key] = {
+                    "name": yaml_rule.name,
+                    "event_type": yaml_rule.event,
+                    "channel_id": channel_id,
+                    "conditions": yaml_rule.conditions,
+                    "template_override": yaml_rule.template,
+                }
+
+        rules_created = self.notification_repo.create_rules(list(new_rules.values()))
 
         return {
             "channels_created": channels_created,
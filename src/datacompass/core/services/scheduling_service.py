@@ -1,9 +1,10 @@
 """Service for Schedule operations."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from pydantic import ConfigDict, TypeAdapter
 from sqlalchemy.orm import Session
 
 from datacompass.core.models.scheduling import (
@@ -19,6 +20,12 @@ from datacompass.core.repositories.scheduling import (
     NotificationRepository,
     SchedulingRepository,
 )
+from datacompass.core.scheduler.scheduler import compute_next_run_at, validate_cron_expression
+
+# List adapters convert a page of ORM rows in a single pydantic-core call
+# instead of one model_validate per row. Schemas are built on first use.
+_SCHEDULE_LIST_ADAPTER = TypeAdapter(list[ScheduleResponse], config=ConfigDict(defer_build=True))
+_RUN_LIST_ADAPTER = TypeAdapter(list[ScheduleRunResponse], config=ConfigDict(defer_build=True))
 
 
 class SchedulingServiceError(Exception):
@@ -129,7 +136,7 @@ class SchedulingService:
             offset=offset,
         )
 
-        return [ScheduleResponse.model_validate(s) for s in schedules]
+        return _SCHEDULE_LIST_ADAPTER.validate_python(schedules, from_attributes=True)
 
     def create_schedule(
         self,
@@ -172,6 +179,7 @@ class SchedulingService:
             target_id=target_id,
             timezone=timezone,
         )
+        self._refresh_next_run(schedule)
 
         return ScheduleResponse.model_validate(schedule)
 
@@ -223,6 +231,9 @@ class SchedulingService:
         if schedule is None:
             raise ScheduleNotFoundError(schedule_id)
 
+        if cron_expression is not None or timezone is not None or is_enabled:
+            self._refresh_next_run(schedule)
+
         return ScheduleResponse.model_validate(schedule)
 
     def delete_schedule(self, schedule_id: int) -> bool:
@@ -328,7 +339,22 @@ class SchedulingService:
             offset=offset,
         )
 
-        return [ScheduleRunResponse.model_validate(r) for r in runs]
+        return _RUN_LIST_ADAPTER.validate_python(runs, from_attributes=True)
+
+    def prune_runs(self, retain_days: int = 90) -> int:
+        """Delete schedule runs older than the retention window.
+
+        Run history is only read newest-first, so old runs just grow the
+        table and its indexes. A schedule's last_run_* fields are kept.
+
+        Args:
+            retain_days: Number of days of runs to keep.
+
+        Returns:
+            Number of runs deleted.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=retain_days)
+        return self.scheduling_repo.delete_runs_before(cutoff)
 
     # =========================================================================
     # YAML Configuration
@@ -356,20 +382,25 @@ class SchedulingService:
         raw_config = load_yaml_config(yaml_path)
         config = YAMLSchedulingConfig.model_validate(raw_config)
 
-        created = 0
         updated = 0
+        existing_schedules = self.scheduling_repo.get_by_names(
+            yaml_schedule.name for yaml_schedule in config.schedules
+        )
+        new_schedules: dict[str, dict[str, Any]] = {}
 
         for yaml_schedule in config.schedules:
-            existing = self.scheduling_repo.get_by_name(yaml_schedule.name)
+            existing = existing_schedules.get(yaml_schedule.name)
 
             if existing:
-                self.scheduling_repo.update_schedule(
+                schedule = self.scheduling_repo.update_schedule(
                     schedule_id=existing.id,
                     description=yaml_schedule.description,
                     cron_expression=yaml_schedule.cron,
                     timezone=yaml_schedule.timezone,
                     is_enabled=yaml_schedule.enabled,
                 )
+                if schedule is not None:
+                    self._refresh_next_run(schedule)
                 updated += 1
             else:
                 # Resolve target name to ID if provided
@@ -379,15 +410,20 @@ class SchedulingService:
                         yaml_schedule.job_type, yaml_schedule.target
                     )
 
-                self.scheduling_repo.create_schedule(
-                    name=yaml_schedule.name,
-                    job_type=yaml_schedule.job_type,
-                    cron_expression=yaml_schedule.cron,
-                    description=yaml_schedule.description,
-                    target_id=target_id,
-                    timezone=yaml_schedule.timezone,
-                )
-                created += 1
+                new_schedules[yaml_schedule.name] = {
+                    "name": yaml_schedule.name,
+                    "job_type": yaml_schedule.job_type,
+                    "cron_expression": yaml_schedule.cron,
+                    "description": yaml_schedule.description,
+                    "target_id": target_id,
+                    "timezone": yaml_schedule.timezone,
+                    "next_run_at": compute_next_run_at(
+                        yaml_schedule.cron, yaml_schedule.timezone
+                    ),
+                }
+
+        # New schedules go out as one multi-row INSERT
+        created = self.scheduling_repo.create_schedules(list(new_schedules.values()))
 
         return {
             "schedules_created": created,
@@ -404,27 +440,16 @@ class SchedulingService:
         Returns:
             SchedulerHubSummary with aggregated data.
         """
-        total_schedules = self.scheduling_repo.count_schedules()
-        enabled_schedules = self.scheduling_repo.count_schedules(enabled_only=True)
-        total_channels = self.notification_repo.count_channels()
-        enabled_channels = self.notification_repo.count_channels(enabled_only=True)
-        total_rules = self.notification_repo.count_rules()
-        enabled_rules = self.notification_repo.count_rules(enabled_only=True)
+        counts = self.scheduling_repo.get_hub_counts()
 
         schedules_by_type = self.scheduling_repo.count_schedules_by_type()
         notifications_by_status = self.notification_repo.count_notifications_by_status()
 
         recent_runs = self.scheduling_repo.get_recent_runs(limit=10)
-        recent_logs = self.notification_repo.get_recent_logs(limit=10)
 
         return SchedulerHubSummary(
-            total_schedules=total_schedules,
-            enabled_schedules=enabled_schedules,
-            total_channels=total_channels,
-            enabled_channels=enabled_channels,
-            total_rules=total_rules,
-            enabled_rules=enabled_rules,
-            recent_runs=[ScheduleRunResponse.model_validate(r) for r in recent_runs],
+            **counts,
+            recent_runs=_RUN_LIST_ADAPTER.validate_python(recent_runs, from_attributes=True),
             recent_notifications=[],  # Will be populated by notification service
             schedules_by_type=schedules_by_type,
             notifications_by_status=notifications_by_status,
@@ -450,9 +475,7 @@ class SchedulingService:
             last_run_status=schedule.last_run_status,
             created_at=schedule.created_at,
             updated_at=schedule.updated_at,
-            recent_runs=[
-                ScheduleRunResponse.model_validate(r) for r in schedule.runs
-            ],
+            recent_runs=_RUN_LIST_ADAPTER.validate_python(schedule.runs, from_attributes=True),
         )
 
     def _validate_cron(self, cron_expression: str) -> None:
@@ -464,11 +487,24 @@ class SchedulingService:
         Raises:
             SchedulingServiceError: If cron expression is invalid.
         """
-        parts = cron_expression.split()
-        if len(parts) != 5:
-            raise SchedulingServiceError(
-                f"Invalid cron expression: expected 5 fields, got {len(parts)}"
-            )
+        try:
+            validate_cron_expression(cron_expression)
+        except ValueError as e:
+            raise SchedulingServiceError(f"Invalid cron expression: {e}") from e
+
+    def _refresh_next_run(self, schedule: Schedule) -> None:
+        """Recompute a schedule's next_run_at from its cron expression.
+
+        Called whenever the cron expression, timezone, or enabled flag
+        changes, so the dispatch query can filter on the stored column
+        instead of evaluating every schedule's cron expression per tick.
+
+        Args:
+            schedule: Schedule whose timing fields were just written.
+        """
+        schedule.next_run_at = compute_next_run_at(
+            schedule.cron_expression, schedule.timezone
+        )
 
     def _resolve_target(self, job_type: str, target_name: str) -> int | None:
         """Resolve target name to ID.
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy.orm import Session
 
@@ -94,31 +95,32 @@ class UsageService:
             (m["schema_name"], m["object_name"]): m for m in metrics_data
         }
 
-        collected_count = 0
-        skipped_count = 0
         collected_at = datetime.utcnow()
+        rows: list[dict[str, Any]] = []
 
-        # Record metrics for each object
+        # Build one metrics row per object, then insert them in one batch
         for obj in objects:
             key = (obj.schema_name, obj.object_name)
             if key in metrics_lookup:
                 m = metrics_lookup[key]
-                self.usage_repo.record_metrics(
-                    object_id=obj.id,
-                    row_count=m.get("row_count"),
-                    size_bytes=m.get("size_bytes"),
-                    read_count=m.get("read_count"),
-                    write_count=m.get("write_count"),
-                    last_read_at=m.get("last_read_at"),
-                    last_written_at=m.get("last_written_at"),
-                    distinct_users=m.get("distinct_users"),
-                    query_count=m.get("query_count"),
-                    source_metrics=m.get("source_metrics"),
-                    collected_at=collected_at,
+                rows.append(
+                    {
+                        "object_id": obj.id,
+                        "row_count": m.get("row_count"),
+                        "size_bytes": m.get("size_bytes"),
+                        "read_count": m.get("read_count"),
+                        "write_count": m.get("write_count"),
+                        "last_read_at": m.get("last_read_at"),
+                        "last_written_at": m.get("last_written_at"),
+                        "distinct_users": m.get("distinct_users"),
+                        "query_count": m.get("query_count"),
+                        "source_metrics": m.get("source_metrics"),
+                        "collected_at": collected_at,
+                    }
                 )
-                collected_count += 1
-            else:
-                skipped_count += 1
+
+        collected_count = self.usage_repo.record_metrics_many(rows)
+        skipped_count = len(objects) - collected_count
 
         return UsageCollectResult(
             source_name=source_name,
@@ -317,6 +317,31 @@ class TestRefreshToken:
         assert "access_token" in data
         assert "refresh_token" in data
 
+    def test_refresh_token_cannot_be_reused(
+        self, client_auth_enabled, test_user, auth_enabled_settings
+    ):
+        """Test that a rotated refresh token is rejected."""
+        with patch(
+            "datacompass.core.auth.providers.local.get_settings",
+            return_value=auth_enabled_settings,
+        ):
+            login_response = client_auth_enabled.post(
+                "/api/v1/auth/login",
+                json={"email": "test@example.com", "password": "testpassword123"},
+            )
+            old_refresh = login_response.json()["refresh_token"]
+
+            first = client_auth_enabled.post(
+                "/api/v1/auth/refresh",
+                json={"refresh_token": old_refresh},
+            )
+            second = client_auth_enabled.post(
+                "/api/v1/auth/refresh",
+                json={"refresh_token": old_refresh},
+            )
+        assert first.status_code == 200
+        assert second.status_code == 401
+
     def test_refresh_invalid_token(self, client_auth_enabled, auth_enabled_settings):
         """Test refresh with invalid token."""
         with patch(
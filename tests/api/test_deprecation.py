@@ -1,5 +1,6 @@
 """Tests for Deprecation API endpoints."""
 
+import json
 from collections.abc import Generator
 from datetime import date, timedelta
 
@@ -412,6 +413,44 @@ class TestDeprecationAPI:
         assert data["total_deprecated"] == 1
         assert "impacts" in data
 
+    def test_stream_campaign_impact(self, client_with_objects: TestClient):
+        """Test GET /api/v1/deprecations/campaigns/{id}/impact/stream."""
+        source_id = self._get_source_id(client_with_objects)
+        object_ids = self._get_object_ids(client_with_objects)
+
+        create_resp = client_with_objects.post(
+            "/api/v1/deprecations/campaigns",
+            json={
+                "source_id": source_id,
+                "name": "Test",
+                "target_date": "2025-06-01",
+            },
+        )
+        campaign_id = create_resp.json()["id"]
+
+        for object_id in object_ids[:2]:
+            client_with_objects.post(
+                f"/api/v1/deprecations/campaigns/{campaign_id}/objects",
+                json={"object_id": object_id},
+            )
+
+        response = client_with_objects.get(
+            f"/api/v1/deprecations/campaigns/{campaign_id}/impact/stream"
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert {line["deprecated_object_id"] for line in lines} == set(object_ids[:2])
+
+    def test_stream_campaign_impact_not_found(self, client_with_source: TestClient):
+        """Test streaming impact for a missing campaign returns 404."""
+        response = client_with_source.get(
+            "/api/v1/deprecations/campaigns/99999/impact/stream"
+        )
+
+        assert response.status_code == 404
+
     # =========================================================================
     # Hub Summary Endpoint
     # =========================================================================
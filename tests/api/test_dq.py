@@ -413,6 +413,13 @@ class TestDQAPI:
         assert data["status"] == "acknowledged"
         assert len(data["lifecycle_events"]) >= 1
 
+        # Oversized notes are rejected before touching the breach
+        response = client_with_object.patch(
+            f"/api/v1/dq/breaches/{breach_id}/status",
+            json={"status": "resolved", "notes": "x" * 2001},
+        )
+        assert response.status_code == 422
+
     # =========================================================================
     # Hub Tests
     # =========================================================================
@@ -181,6 +181,49 @@ class TestUserCommands:
         assert result.exit_code == 0
         assert "success" in result.stdout.lower() or "disabled" in result.stdout.lower()
 
+    def test_user_disable_defer_purge(self, cli_runner: CliRunner, auth_enabled_env):
+        """Test that a deferred disable leaves tokens for 'auth purge' to delete."""
+        from datacompass.core.database import get_session
+        from datacompass.core.services.auth_service import AuthService
+
+        cli_runner.invoke(app, ["auth", "user", "create", "purge@example.com"])
+        with get_session() as session:
+            auth_service = AuthService(session)
+            auth_service.create_refresh_token(auth_service.get_user_by_email("purge@example.com"))
+            session.commit()
+
+        result = cli_runner.invoke(
+            app, ["auth", "user", "disable", "purge@example.com", "--defer-purge"]
+        )
+        assert result.exit_code == 0
+
+        result = cli_runner.invoke(app, ["auth", "purge"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout) == {"expired_sessions": 0, "inactive_user_credentials": 1}
+
+    def test_purge_deletes_expired_sessions(self, cli_runner: CliRunner, auth_enabled_env):
+        """Test that 'auth purge' deletes expired sessions and keeps live ones."""
+        from datetime import datetime, timedelta
+
+        from datacompass.core.database import get_session
+        from datacompass.core.repositories.auth import SessionRepository
+        from datacompass.core.services.auth_service import AuthService
+
+        cli_runner.invoke(app, ["auth", "user", "create", "sessions@example.com"])
+        with get_session() as session:
+            user = AuthService(session).get_user_by_email("sessions@example.com")
+            repo = SessionRepository(session)
+            now = datetime.utcnow()
+            repo.create(b"e" * 32, user.id, now - timedelta(hours=1))
+            repo.create(b"l" * 32, user.id, now + timedelta(hours=1))
+            session.commit()
+
+        result = cli_runner.invoke(app, ["auth", "purge"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout) == {"expired_sessions": 1, "inactive_user_credentials": 0}
+
     def test_user_enable(self, cli_runner: CliRunner, auth_enabled_env):
         """Test enabling a user."""
         cli_runner.invoke(app, ["auth", "user", "create", "enable@example.com"])
@@ -1,8 +1,10 @@
 """Tests for the main CLI entry point."""
 
 import json
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from datacompass import __version__
@@ -175,6 +177,35 @@ class TestDqCommands:
         # Should return empty array when no configs
         assert "[]" in result.output or "No enabled" in result.output
 
+    def test_dq_prune(self, cli_runner: CliRunner, temp_data_dir: Path):
+        """Test dq prune deletes results outside the retention window."""
+        from datacompass.core.database import get_session, init_database
+        from datacompass.core.repositories import CatalogObjectRepository, DataSourceRepository
+        from datacompass.core.repositories.dq import DQRepository
+
+        init_database()
+        with get_session() as session:
+            source = DataSourceRepository(session).create(
+                name="demo", source_type="databricks", connection_info={}
+            )
+            session.flush()
+            obj, _ = CatalogObjectRepository(session).upsert(source.id, "core", "orders", "TABLE")
+            repo = DQRepository(session)
+            config = repo.create_config(object_id=obj.id)
+            exp = repo.create_expectation(
+                config_id=config.id,
+                expectation_type="row_count",
+                threshold_config={"type": "absolute"},
+            )
+            repo.record_result(exp.id, date.today() - timedelta(days=60), 100)
+            repo.record_result(exp.id, date.today(), 100)
+            session.commit()
+
+        result = cli_runner.invoke(app, ["dq", "prune", "--days", "30"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout) == {"deleted": 1, "retain_days": 30}
+
 
 class TestScanCommand:
     """Tests for scan command."""
@@ -193,6 +224,93 @@ class TestScanCommand:
         assert "not found" in result.output.lower()
 
 
+class TestScheduleCommands:
+    """Tests for schedule subcommands."""
+
+    def test_schedule_run_due(self, cli_runner: CliRunner, temp_data_dir: Path):
+        """Test that only due, enabled schedules run and their next run advances."""
+        pytest.importorskip("apscheduler")
+        from datacompass.core.database import get_session, init_database
+        from datacompass.core.repositories.scheduling import SchedulingRepository
+
+        init_database()
+        with get_session() as session:
+            repo = SchedulingRepository(session)
+            due = repo.create_schedule(
+                name="due", job_type="deprecation_check", cron_expression="0 6 * * *"
+            )
+            later = repo.create_schedule(
+                name="later", job_type="deprecation_check", cron_expression="0 6 * * *"
+            )
+            due.next_run_at = datetime(2026, 1, 1)
+            later.next_run_at = datetime(2999, 1, 1)
+            session.commit()
+            due_id = due.id
+
+        # The job type filter leaves the due schedule alone
+        result = cli_runner.invoke(app, ["schedule", "run-due", "--job-type", "scan"])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout) == {"executed": 0, "schedule_ids": []}
+
+        result = cli_runner.invoke(app, ["schedule", "run-due"])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout) == {"executed": 1, "schedule_ids": [due_id]}
+
+        with get_session() as session:
+            schedule = SchedulingRepository(session).get_by_id(due_id)
+            assert schedule.last_run_status == "success"
+            assert schedule.next_run_at > datetime.utcnow()
+
+        # The schedule that just ran is no longer due, so it is not dispatched again
+        result = cli_runner.invoke(app, ["schedule", "run-due"])
+        assert json.loads(result.stdout) == {"executed": 0, "schedule_ids": []}
+        result = cli_runner.invoke(app, ["schedule", "run-due", "--job-type", "deprecation_check"])
+        assert json.loads(result.stdout) == {"executed": 0, "schedule_ids": []}
+
+    def test_schedule_prune(self, cli_runner: CliRunner, temp_data_dir: Path):
+        """Test schedule prune deletes runs outside the retention window."""
+        from datacompass.core.database import get_session, init_database
+        from datacompass.core.repositories.scheduling import SchedulingRepository
+
+        init_database()
+        with get_session() as session:
+            repo = SchedulingRepository(session)
+            schedule = repo.create_schedule(
+                name="nightly", job_type="scan", cron_expression="0 2 * * *"
+            )
+            old = repo.create_run(schedule.id)
+            repo.create_run(schedule.id)
+            old.started_at = datetime.utcnow() - timedelta(days=120)
+            session.commit()
+
+        result = cli_runner.invoke(app, ["schedule", "prune"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout) == {"deleted": 1, "retain_days": 90}
+
+
+class TestNotifyCommands:
+    """Tests for notify command group."""
+
+    def test_notify_prune(self, cli_runner: CliRunner, temp_data_dir: Path):
+        """Test notify prune deletes log entries outside the retention window."""
+        from datacompass.core.database import get_session, init_database
+        from datacompass.core.repositories.scheduling import NotificationRepository
+
+        init_database()
+        with get_session() as session:
+            repo = NotificationRepository(session)
+            old = repo.create_log_entry("scan_completed", {}, "sent")
+            repo.create_log_entry("scan_completed", {}, "sent")
+            old.sent_at = datetime.utcnow() - timedelta(days=45)
+            session.commit()
+
+        result = cli_runner.invoke(app, ["notify", "prune", "--days", "30"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout) == {"deleted": 1, "retain_days": 30}
+
+
 class TestAdaptersCommands:
     """Tests for adapters command group."""
 
@@ -1,12 +1,14 @@
 """Pytest configuration and shared fixtures."""
 
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from typer.testing import CliRunner
 
@@ -62,6 +64,33 @@ def test_db() -> Generator[Session, None, None]:
         session.close()
 
 
+@pytest.fixture
+def count_queries(test_db: Session) -> Callable[[], AbstractContextManager[list[str]]]:
+    """Record the SQL statements test_db sends to the database.
+
+    Usage:
+        with count_queries() as statements:
+            repo.get_by_id(1)
+        assert len(statements) == 1
+    """
+    engine = test_db.get_bind()
+
+    @contextmanager
+    def recorder() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def listener(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+    return recorder
+
+
 @pytest.fixture
 def temp_data_dir(tmp_path: Path) -> Generator[Path, None, None]:
     """Create a temporary data directory for testing.
@@ -1,8 +1,11 @@
 """Tests for authentication repositories."""
 
+import secrets
 from datetime import datetime, timedelta
 
 import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from datacompass.core.repositories.auth import (
@@ -47,6 +50,17 @@ class TestUserRepository:
 
         assert user.is_superuser is True
 
+    def test_email_is_unique(self, test_db: Session):
+        """Test that ix_users_email rejects a duplicate email."""
+        repo = UserRepository(test_db)
+
+        repo.create(email="dup@example.com")
+        test_db.commit()
+
+        with pytest.raises(IntegrityError):
+            repo.create(email="dup@example.com")
+        test_db.rollback()
+
     def test_get_by_email(self, test_db: Session):
         """Test getting user by email."""
         repo = UserRepository(test_db)
@@ -61,6 +75,24 @@ class TestUserRepository:
         not_found = repo.get_by_email("notfound@example.com")
         assert not_found is None
 
+    def test_repeated_lookup_uses_identity_map(self, test_db: Session, count_queries):
+        """Test that a second lookup in the same session issues no query."""
+        repo = UserRepository(test_db)
+        repo.create(email="hot@example.com")
+        test_db.commit()
+        first = repo.get_by_email("hot@example.com")
+
+        with count_queries() as statements:
+            again = repo.get_by_email("hot@example.com")
+
+        assert again is first
+        assert statements == []
+
+        # A changed email must not be served from the remembered id
+        first.email = "renamed@example.com"
+        test_db.flush()
+        assert repo.get_by_email("hot@example.com") is None
+
     def test_get_by_external_id(self, test_db: Session):
         """Test getting user by external provider and ID."""
         repo = UserRepository(test_db)
@@ -169,7 +201,7 @@ class TestAPIKeyRepository:
             user_id=user.id,
             name="Test Key",
             key_prefix="test1234",
-            key_hash="hashed_key_value",
+            key_hash=b"hashed_key_value",
             scopes=["read", "write"],
         )
         test_db.commit()
@@ -194,7 +226,7 @@ class TestAPIKeyRepository:
             user_id=user.id,
             name="Expiring Key",
             key_prefix="exp12345",
-            key_hash="hashed",
+            key_hash=b"hashed",
             expires_at=expires_at,
         )
         test_db.commit()
@@ -213,7 +245,7 @@ class TestAPIKeyRepository:
             user_id=user.id,
             name="Find Key",
             key_prefix="find1234",
-            key_hash="hashed",
+            key_hash=b"hashed",
         )
         test_db.commit()
 
@@ -224,6 +256,58 @@ class TestAPIKeyRepository:
         assert api_key.user is not None
         assert api_key.user.email == "prefix@example.com"
 
+    def test_get_active_by_prefix(self, test_db: Session):
+        """Test that revoked and expired keys are not returned by prefix."""
+        user_repo = UserRepository(test_db)
+        key_repo = APIKeyRepository(test_db)
+
+        user = user_repo.create(email="active@example.com")
+        test_db.commit()
+
+        key_repo.create(user_id=user.id, name="Active", key_prefix="actv1234", key_hash=b"h1")
+        revoked = key_repo.create(
+            user_id=user.id, name="Revoked", key_prefix="rvkd1234", key_hash=b"h2"
+        )
+        key_repo.create(
+            user_id=user.id,
+            name="Expired",
+            key_prefix="expd1234",
+            key_hash=b"h3",
+            expires_at=datetime.utcnow() - timedelta(days=1),
+        )
+        key_repo.revoke(revoked.id)
+        test_db.commit()
+
+        assert key_repo.get_active_by_prefix("actv1234").name == "Active"
+        assert key_repo.get_active_by_prefix("rvkd1234") is None
+        assert key_repo.get_active_by_prefix("expd1234") is None
+
+    def test_get_active_by_prefix_sees_revoke_in_same_session(self, test_db: Session):
+        """Test that a key resolved earlier is not returned once revoked."""
+        user = UserRepository(test_db).create(email="revoke@example.com")
+        key_repo = APIKeyRepository(test_db)
+        api_key = key_repo.create(
+            user_id=user.id, name="Key", key_prefix="once1234", key_hash=b"h"
+        )
+        test_db.commit()
+
+        assert key_repo.get_active_by_prefix("once1234") is api_key
+        key_repo.revoke(api_key.id)
+        test_db.flush()
+
+        assert key_repo.get_active_by_prefix("once1234") is None
+
+    def test_get_active_by_prefix_uses_partial_index(self, test_db: Session):
+        """Test that the active-key lookup is served by ix_api_keys_key_prefix."""
+        plan = test_db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM api_keys "
+                "WHERE key_prefix = 'abcd1234' AND is_active = 1"
+            )
+        ).all()
+
+        assert "USING INDEX ix_api_keys_key_prefix" in " ".join(row[-1] for row in plan)
+
     def test_list_by_user(self, test_db: Session):
         """Test listing API keys for a user."""
         user_repo = UserRepository(test_db)
@@ -232,9 +316,9 @@ class TestAPIKeyRepository:
         user = user_repo.create(email="multikey@example.com")
         test_db.commit()
 
-        key_repo.create(user_id=user.id, name="Key 1", key_prefix="key11111", key_hash="hash1")
-        key_repo.create(user_id=user.id, name="Key 2", key_prefix="key22222", key_hash="hash2")
-        revoked = key_repo.create(user_id=user.id, name="Key 3", key_prefix="key33333", key_hash="hash3")
+        key_repo.create(user_id=user.id, name="Key 1", key_prefix="key11111", key_hash=b"hash1")
+        key_repo.create(user_id=user.id, name="Key 2", key_prefix="key22222", key_hash=b"hash2")
+        revoked = key_repo.create(user_id=user.id, name="Key 3", key_prefix="key33333", key_hash=b"hash3")
         test_db.commit()
 
         # Revoke one key
@@ -249,6 +333,19 @@ class TestAPIKeyRepository:
         all_keys = key_repo.list_by_user(user.id, include_inactive=True)
         assert len(all_keys) == 3
 
+    def test_list_by_user_avoids_sort(self, test_db: Session):
+        """Test that listing active keys reads them in index order."""
+        plan = test_db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM api_keys "
+                "WHERE user_id = 1 AND is_active = 1 ORDER BY created_at DESC"
+            )
+        ).all()
+        details = " ".join(row[-1] for row in plan)
+
+        assert "USING INDEX ix_api_keys_user_id_active_created" in details
+        assert "TEMP B-TREE" not in details
+
     def test_update_last_used(self, test_db: Session):
         """Test updating last used timestamp."""
         user_repo = UserRepository(test_db)
@@ -261,7 +358,7 @@ class TestAPIKeyRepository:
             user_id=user.id,
             name="Usage Key",
             key_prefix="use12345",
-            key_hash="hashed",
+            key_hash=b"hashed",
         )
         test_db.commit()
 
@@ -284,7 +381,7 @@ class TestAPIKeyRepository:
             user_id=user.id,
             name="Revoke Key",
             key_prefix="rev12345",
-            key_hash="hashed",
+            key_hash=b"hashed",
         )
         test_db.commit()
 
@@ -308,8 +405,9 @@ class TestSessionRepository:
         test_db.commit()
 
         expires_at = datetime.utcnow() + timedelta(hours=1)
+        session_id = secrets.token_bytes(16)
         session = session_repo.create(
-            session_id="sess-123-abc",
+            session_id=session_id,
             user_id=user.id,
             expires_at=expires_at,
             user_agent="Test Agent",
@@ -317,7 +415,8 @@ class TestSessionRepository:
         )
         test_db.commit()
 
-        assert session.id == "sess-123-abc"
+        assert session.id == session_id
+        assert session_id.hex()[:8] in repr(session)
         assert session.user_id == user.id
         assert session.user_agent == "Test Agent"
         assert session.ip_address == "127.0.0.1"
@@ -330,10 +429,13 @@ class TestSessionRepository:
         user = user_repo.create(email="active@example.com")
         test_db.commit()
 
+        active_id = secrets.token_bytes(16)
+        expired_id = secrets.token_bytes(16)
+
         # Active session
         active_expires = datetime.utcnow() + timedelta(hours=1)
         session_repo.create(
-            session_id="active-sess",
+            session_id=active_id,
             user_id=user.id,
             expires_at=active_expires,
         )
@@ -341,16 +443,16 @@ class TestSessionRepository:
         # Expired session
         expired_expires = datetime.utcnow() - timedelta(hours=1)
         session_repo.create(
-            session_id="expired-sess",
+            session_id=expired_id,
             user_id=user.id,
             expires_at=expired_expires,
         )
         test_db.commit()
 
-        active = session_repo.get_active("active-sess")
+        active = session_repo.get_active(active_id)
         assert active is not None
 
-        expired = session_repo.get_active("expired-sess")
+        expired = session_repo.get_active(expired_id)
         assert expired is None
 
     def test_list_by_user(self, test_db: Session):
@@ -362,8 +464,12 @@ class TestSessionRepository:
         test_db.commit()
 
         active_expires = datetime.utcnow() + timedelta(hours=1)
-        session_repo.create(session_id="sess-1", user_id=user.id, expires_at=active_expires)
-        session_repo.create(session_id="sess-2", user_id=user.id, expires_at=active_expires)
+        for _ in range(2):
+            session_repo.create(
+                session_id=secrets.token_bytes(16),
+                user_id=user.id,
+                expires_at=active_expires,
+            )
         test_db.commit()
 
         sessions = session_repo.list_by_user(user.id)
@@ -378,8 +484,12 @@ class TestSessionRepository:
         test_db.commit()
 
         active_expires = datetime.utcnow() + timedelta(hours=1)
-        session_repo.create(session_id="del-1", user_id=user.id, expires_at=active_expires)
-        session_repo.create(session_id="del-2", user_id=user.id, expires_at=active_expires)
+        for _ in range(2):
+            session_repo.create(
+                session_id=secrets.token_bytes(16),
+                user_id=user.id,
+                expires_at=active_expires,
+            )
         test_db.commit()
 
         deleted = session_repo.delete_for_user(user.id)
@@ -403,16 +513,40 @@ class TestRefreshTokenRepository:
         expires_at = datetime.utcnow() + timedelta(days=7)
         token = token_repo.create(
             user_id=user.id,
-            token_hash="hashed_token_123",
+            token_hash=b"hashed_token_123",
             expires_at=expires_at,
         )
         test_db.commit()
 
         assert token.id is not None
         assert token.user_id == user.id
-        assert token.token_hash == "hashed_token_123"
+        assert token.token_hash == b"hashed_token_123"
         assert token.replaced_by is None
 
+    def test_token_hash_unique_among_unreplaced(self, test_db: Session):
+        """Test that only unreplaced tokens must have unique hashes."""
+        user_repo = UserRepository(test_db)
+        token_repo = RefreshTokenRepository(test_db)
+
+        user = user_repo.create(email="uniquehash@example.com")
+        test_db.commit()
+
+        expires_at = datetime.utcnow() + timedelta(days=7)
+        old = token_repo.create(user_id=user.id, token_hash=b"same_hash", expires_at=expires_at)
+        replacement = token_repo.create(
+            user_id=user.id, token_hash=b"other_hash", expires_at=expires_at
+        )
+        old.replaced_by = replacement.id
+        test_db.commit()
+
+        # A replaced token no longer occupies the hash
+        token_repo.create(user_id=user.id, token_hash=b"same_hash", expires_at=expires_at)
+        test_db.commit()
+
+        with pytest.raises(IntegrityError):
+            token_repo.create(user_id=user.id, token_hash=b"same_hash", expires_at=expires_at)
+        test_db.rollback()
+
     def test_get_valid(self, test_db: Session):
         """Test getting valid refresh token."""
         user_repo = UserRepository(test_db)
@@ -423,19 +557,30 @@ class TestRefreshTokenRepository:
 
         # Valid token
         valid_expires = datetime.utcnow() + timedelta(days=7)
-        token_repo.create(user_id=user.id, token_hash="valid_hash", expires_at=valid_expires)
+        token_repo.create(user_id=user.id, token_hash=b"valid_hash", expires_at=valid_expires)
 
         # Expired token
         expired_expires = datetime.utcnow() - timedelta(days=1)
-        token_repo.create(user_id=user.id, token_hash="expired_hash", expires_at=expired_expires)
+        token_repo.create(user_id=user.id, token_hash=b"expired_hash", expires_at=expired_expires)
         test_db.commit()
 
-        valid = token_repo.get_valid("valid_hash")
+        valid = token_repo.get_valid(b"valid_hash")
         assert valid is not None
 
-        expired = token_repo.get_valid("expired_hash")
+        expired = token_repo.get_valid(b"expired_hash")
         assert expired is None
 
+    def test_get_valid_uses_partial_index(self, test_db: Session):
+        """Test that the unreplaced-token lookup is served by the partial index."""
+        plan = test_db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM refresh_tokens "
+                "WHERE token_hash = x'00' AND replaced_by IS NULL"
+            )
+        ).all()
+
+        assert "USING INDEX ix_refresh_tokens_token_hash" in " ".join(row[-1] for row in plan)
+
     def test_delete_for_user(self, test_db: Session):
         """Test deleting all tokens for a user."""
         user_repo = UserRepository(test_db)
@@ -445,11 +590,41 @@ class TestRefreshTokenRepository:
         test_db.commit()
 
         expires_at = datetime.utcnow() + timedelta(days=7)
-        token_repo.create(user_id=user.id, token_hash="hash1", expires_at=expires_at)
-        token_repo.create(user_id=user.id, token_hash="hash2", expires_at=expires_at)
+        token_repo.create(user_id=user.id, token_hash=b"hash1", expires_at=expires_at)
+        token_repo.create(user_id=user.id, token_hash=b"hash2", expires_at=expires_at)
         test_db.commit()
 
         deleted = token_repo.delete_for_user(user.id)
         test_db.commit()
 
         assert deleted == 2
+
+    def test_delete_expired(self, test_db: Session):
+        """Test that expired tokens are removed, even when a live token replaced them."""
+        user_repo = UserRepository(test_db)
+        token_repo = RefreshTokenRepository(test_db)
+
+        user = user_repo.create(email="expiredtoken@example.com")
+        test_db.commit()
+
+        expired = token_repo.create(
+            user_id=user.id,
+            token_hash=b"old_hash",
+            expires_at=datetime.utcnow() - timedelta(days=1),
+        )
+        replacement = token_repo.create(
+            user_id=user.id,
+            token_hash=b"new_hash",
+            expires_at=datetime.utcnow() + timedelta(days=7),
+        )
+        expired.replaced_by = replacement.id
+        test_db.commit()
+        expired_id = expired.id
+
+        deleted = token_repo.delete_expired()
+        test_db.commit()
+
+        assert deleted == 1
+        assert token_repo.get_valid(b"new_hash") is not None
+        assert token_repo.get_by_id(expired_id) is None
+
@@ -1,10 +1,15 @@
 """Tests for CatalogObjectRepository."""
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from datacompass.core.models import DataSource
-from datacompass.core.repositories import CatalogObjectRepository, DataSourceRepository
+from datacompass.core.repositories import (
+    CatalogObjectRepository,
+    ColumnRepository,
+    DataSourceRepository,
+)
 
 
 class TestCatalogObjectRepository:
@@ -129,6 +134,54 @@ class TestCatalogObjectRepository:
         assert action == "updated"
         assert obj2.deleted_at is None
 
+    def test_upsert_is_one_statement(self, test_db: Session, source: DataSource, count_queries):
+        """Test that upsert writes with a single INSERT ... ON CONFLICT."""
+        repo = CatalogObjectRepository(test_db)
+        repo.upsert(source.id, "analytics", "customers", "TABLE")
+        test_db.commit()
+        source_id = source.id
+
+        with count_queries() as statements:
+            _, existing = repo.upsert(source_id, "analytics", "customers", "TABLE")
+            obj, created = repo.upsert(source_id, "analytics", "orders", "TABLE")
+
+        assert (existing, created) == ("updated", "created")
+        assert obj.id is not None
+        assert len(statements) == 2
+        assert all("ON CONFLICT" in stmt for stmt in statements)
+
+    def test_upsert_many(self, test_db: Session, source: DataSource):
+        """Test that a batch upsert creates, updates and un-deletes by natural key."""
+        repo = CatalogObjectRepository(test_db)
+        existing, _ = repo.upsert(source.id, "analytics", "customers", "TABLE")
+        existing.user_metadata = {"owner": "data-team"}
+        existing.soft_delete()
+        test_db.commit()
+
+        result = repo.upsert_many(
+            source.id,
+            [
+                {
+                    "schema_name": "analytics",
+                    "object_name": "customers",
+                    "object_type": "TABLE",
+                    "source_metadata": {"version": 2},
+                },
+                {"schema_name": "analytics", "object_name": "orders", "object_type": "TABLE"},
+                {"schema_name": "analytics", "object_name": "orders", "object_type": "VIEW"},
+            ],
+        )
+        test_db.commit()
+
+        assert result[("analytics", "customers", "TABLE")] == (existing.id, "updated")
+        assert result[("analytics", "orders", "TABLE")][1] == "created"
+        assert result[("analytics", "orders", "VIEW")][1] == "created"
+        test_db.refresh(existing)
+        assert existing.deleted_at is None
+        assert existing.source_metadata == {"version": 2}
+        assert existing.user_metadata == {"owner": "data-team"}
+        assert repo.upsert_many(source.id, []) == {}
+
     def test_get_by_source(self, test_db: Session, source: DataSource):
         """Test getting all objects for a source."""
         repo = CatalogObjectRepository(test_db)
@@ -178,6 +231,46 @@ class TestCatalogObjectRepository:
         test_db.refresh(obj3)
         assert obj3.deleted_at is not None
 
+    def test_soft_delete_missing_in_batches(
+        self, test_db: Session, source: DataSource, count_queries
+    ):
+        """Test that missing objects are marked with one UPDATE per batch."""
+        repo = CatalogObjectRepository(test_db)
+
+        objs = [repo.upsert(source.id, "schema1", f"table{i}", "TABLE")[0] for i in range(5)]
+        test_db.commit()
+
+        with count_queries() as statements:
+            deleted_count = repo.soft_delete_missing(source.id, {objs[0].id}, batch_size=2)
+        test_db.commit()
+
+        assert deleted_count == 4
+        assert sum(stmt.startswith("UPDATE catalog_objects") for stmt in statements) == 2
+        assert [obj.id for obj in repo.get_by_source(source.id)] == [objs[0].id]
+
+    def test_counts_are_computed_in_sql(self, test_db: Session, source: DataSource, count_queries):
+        """Test that counts run a COUNT query instead of loading objects."""
+        repo = CatalogObjectRepository(test_db)
+
+        table, _ = repo.upsert(source.id, "schema1", "table1", "TABLE")
+        repo.upsert(source.id, "schema1", "table2", "TABLE")
+        repo.upsert(source.id, "schema1", "view1", "VIEW")
+        table.soft_delete()
+        test_db.commit()
+        source_id = source.id
+
+        with count_queries() as statements:
+            counts = (
+                repo.count(),
+                repo.count_by_source(source_id),
+                repo.count_by_source(source_id, include_deleted=True),
+                repo.count_by_type(source_id, "TABLE"),
+                repo.count_by_type(source_id, "TABLE", include_deleted=True),
+            )
+
+        assert counts == (3, 2, 3, 1, 2)
+        assert all(stmt.startswith("SELECT count(*)") for stmt in statements)
+
     def test_list_objects_with_filters(self, test_db: Session, source: DataSource):
         """Test listing objects with various filters."""
         repo = CatalogObjectRepository(test_db)
@@ -202,3 +295,45 @@ class TestCatalogObjectRepository:
             schema_name="schema2",
         )
         assert len(schema2_tables) == 1
+
+    def test_get_with_columns_does_not_repeat_object_row(
+        self, test_db: Session, source: DataSource, count_queries
+    ):
+        """Test that columns are loaded by a separate IN query, not a JOIN."""
+        repo = CatalogObjectRepository(test_db)
+        obj, _ = repo.upsert(source.id, "analytics", "customers", "TABLE")
+        ColumnRepository(test_db).upsert_batch(
+            obj.id,
+            [{"column_name": f"col{i}", "position": i} for i in range(3)],
+        )
+        test_db.commit()
+        object_id = obj.id
+        test_db.expunge_all()
+
+        with count_queries() as statements:
+            loaded = repo.get_with_columns(object_id)
+
+        assert [c.column_name for c in loaded.columns] == ["col0", "col1", "col2"]
+        assert len(statements) == 2
+        assert "JOIN" not in statements[0]
+
+    def test_find_by_schema_and_name(self, test_db: Session, source: DataSource):
+        """Test cross-source lookup by schema and object name."""
+        repo = CatalogObjectRepository(test_db)
+
+        repo.upsert(source.id, "analytics", "orders", "TABLE")
+        test_db.commit()
+
+        obj = repo.find_by_schema_and_name("analytics", "orders")
+        assert obj is not None
+        assert obj.full_name == "analytics.orders"
+        assert repo.find_by_schema_and_name("analytics", "missing") is None
+
+        plan = test_db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM catalog_objects "
+                "WHERE schema_name = 'analytics' AND object_name = 'orders'"
+            )
+        ).all()
+        details = " ".join(row[-1] for row in plan)
+        assert "USING INDEX ix_catalog_objects_schema_object" in details
@@ -223,6 +223,37 @@ class TestDeprecationRepository:
         assert deprecation.replacement_id == catalog_objects[1].id
         assert deprecation.migration_notes == "Use new_table instead"
 
+    def test_get_campaign_loads_deprecations_eagerly(
+        self, test_db: Session, source: DataSource, catalog_objects: list[CatalogObject],
+        count_queries,
+    ):
+        """Test that campaign detail does not issue a query per deprecation."""
+        repo = DeprecationRepository(test_db)
+
+        campaign = repo.create_campaign(
+            source_id=source.id,
+            name="Eager",
+            target_date=date(2025, 6, 1),
+        )
+        for obj in catalog_objects[:2]:
+            repo.add_object_to_campaign(
+                campaign_id=campaign.id,
+                object_id=obj.id,
+                replacement_id=catalog_objects[2].id,
+            )
+        test_db.commit()
+        campaign_id = campaign.id
+        test_db.expunge_all()
+
+        with count_queries() as statements:
+            loaded = repo.get_campaign(campaign_id)
+            names = [
+                (d.object.object_name, d.replacement.object_name) for d in loaded.deprecations
+            ]
+
+        assert sorted(names) == [("new_table", "other_table"), ("old_table", "other_table")]
+        assert len(statements) <= 2  # campaign + source, then deprecations
+
     def test_get_deprecation(
         self, test_db: Session, source: DataSource, catalog_objects: list[CatalogObject]
     ):
@@ -287,6 +318,34 @@ class TestDeprecationRepository:
         deprecations = repo.list_deprecations(campaign_id=campaign.id)
         assert len(deprecations) == 2
 
+    def test_list_deprecations_skips_campaign_and_metadata(
+        self, test_db: Session, source: DataSource, catalog_objects: list[CatalogObject],
+        count_queries,
+    ):
+        """Test that listing deprecations loads object names in a single narrow query."""
+        repo = DeprecationRepository(test_db)
+
+        campaign = repo.create_campaign(
+            source_id=source.id,
+            name="Narrow",
+            target_date=date(2025, 6, 1),
+        )
+        repo.add_object_to_campaign(
+            campaign.id, catalog_objects[0].id, replacement_id=catalog_objects[2].id
+        )
+        test_db.commit()
+        campaign_id = campaign.id
+        test_db.expunge_all()
+
+        with count_queries() as statements:
+            deprecations = repo.list_deprecations(campaign_id=campaign_id)
+            names = [(d.object.object_name, d.replacement.object_name) for d in deprecations]
+
+        assert names == [("old_table", "other_table")]
+        assert len(statements) == 1
+        assert "source_metadata" not in statements[0]
+        assert "deprecation_campaigns" not in statements[0]
+
     def test_remove_object_from_campaign(
         self, test_db: Session, source: DataSource, catalog_objects: list[CatalogObject]
     ):
@@ -358,6 +417,37 @@ class TestDeprecationRepository:
         count = repo.count_total_deprecated_objects()
         assert count == 2
 
+    def test_count_objects_by_campaign(
+        self, test_db: Session, source: DataSource, catalog_objects: list[CatalogObject]
+    ):
+        """Test batched object counts for several campaigns."""
+        repo = DeprecationRepository(test_db)
+
+        first = repo.create_campaign(
+            source_id=source.id,
+            name="First",
+            target_date=date(2025, 6, 1),
+        )
+        second = repo.create_campaign(
+            source_id=source.id,
+            name="Second",
+            target_date=date(2025, 7, 1),
+        )
+        empty = repo.create_campaign(
+            source_id=source.id,
+            name="Empty",
+            target_date=date(2025, 8, 1),
+        )
+        repo.add_object_to_campaign(first.id, catalog_objects[0].id)
+        repo.add_object_to_campaign(first.id, catalog_objects[1].id)
+        repo.add_object_to_campaign(second.id, catalog_objects[2].id)
+        test_db.commit()
+
+        counts = repo.count_objects_by_campaign([first.id, second.id, empty.id])
+
+        assert counts == {first.id: 2, second.id: 1}
+        assert repo.count_objects_by_campaign([]) == {}
+
     def test_get_upcoming_campaigns(self, test_db: Session, source: DataSource):
         """Test getting campaigns with upcoming deadlines."""
         repo = DeprecationRepository(test_db)
@@ -3,9 +3,11 @@
 from datetime import date, timedelta
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from datacompass.core.models import CatalogObject, DataSource
+from datacompass.core.models.dq import MAX_LIFECYCLE_EVENTS
 from datacompass.core.repositories import CatalogObjectRepository, DataSourceRepository
 from datacompass.core.repositories.dq import DQRepository
 
@@ -115,6 +117,27 @@ class TestDQRepository:
         assert result is True
         assert repo.get_by_id(config_id) is None
 
+    def test_list_configs_skips_metadata_columns(
+        self, test_db: Session, catalog_object: CatalogObject, count_queries
+    ):
+        """Test that listing configs loads names without the JSON metadata columns."""
+        repo = DQRepository(test_db)
+        repo.create_config(object_id=catalog_object.id)
+        test_db.commit()
+        test_db.expunge_all()
+
+        with count_queries() as statements:
+            configs = repo.list_configs()
+            names = [
+                (c.object.source.name, c.object.schema_name, c.object.object_name)
+                for c in configs
+            ]
+
+        assert names == [("demo", "core", "orders")]
+        assert len(statements) == 1
+        assert "source_metadata" not in statements[0]
+        assert "connection_info" not in statements[0]
+
     # =========================================================================
     # Expectation Tests
     # =========================================================================
@@ -254,6 +277,42 @@ class TestDQRepository:
         assert result2.id == result1_id
         assert result2.metric_value == 16000.0
 
+    def test_record_results_many(
+        self, test_db: Session, catalog_object: CatalogObject, count_queries
+    ):
+        """Test batch recording inserts new results and updates existing ones."""
+        repo = DQRepository(test_db)
+
+        config = repo.create_config(object_id=catalog_object.id)
+        expectations = [
+            repo.create_expectation(
+                config_id=config.id,
+                expectation_type=f"metric_{i}",
+                threshold_config={"type": "absolute"},
+            )
+            for i in range(3)
+        ]
+        snapshot_date = date.today()
+        existing = repo.record_result(expectations[0].id, snapshot_date, 1.0)
+        test_db.commit()
+
+        with count_queries() as statements:
+            recorded = repo.record_results_many(
+                snapshot_date,
+                [
+                    {"expectation_id": e.id, "metric_value": 10.0 * i, "computed_threshold_low": 0}
+                    for i, e in enumerate(expectations)
+                ],
+            )
+        test_db.commit()
+
+        inserts = [s for s in statements if s.startswith("INSERT")]
+        assert len(inserts) == 1
+        assert recorded[expectations[0].id].id == existing.id
+        assert [recorded[e.id].metric_value for e in expectations] == [0.0, 10.0, 20.0]
+        assert all(r.created_at is not None for r in recorded.values())
+        assert repo.record_results_many(snapshot_date, []) == {}
+
     def test_get_historical_results(
         self, test_db: Session, catalog_object: CatalogObject
     ):
@@ -289,6 +348,58 @@ class TestDQRepository:
         # Results should be ordered by date desc
         assert results[0].snapshot_date > results[1].snapshot_date
 
+    def test_delete_results_before(
+        self, test_db: Session, catalog_object: CatalogObject
+    ):
+        """Test pruning old results keeps recent and breached ones."""
+        repo = DQRepository(test_db)
+
+        config = repo.create_config(object_id=catalog_object.id)
+        expectation = repo.create_expectation(
+            config_id=config.id,
+            expectation_type="row_count",
+            threshold_config={"type": "absolute", "min": 100},
+        )
+        test_db.commit()
+
+        today = date.today()
+        repo.record_result(
+            expectation_id=expectation.id,
+            snapshot_date=today - timedelta(days=400),
+            metric_value=1000.0,
+        )
+        old_breached = repo.record_result(
+            expectation_id=expectation.id,
+            snapshot_date=today - timedelta(days=401),
+            metric_value=50.0,
+        )
+        recent = repo.record_result(
+            expectation_id=expectation.id,
+            snapshot_date=today - timedelta(days=1),
+            metric_value=1000.0,
+        )
+        repo.create_breach(
+            expectation_id=expectation.id,
+            result_id=old_breached.id,
+            snapshot_date=old_breached.snapshot_date,
+            metric_value=50.0,
+            breach_direction="low",
+            threshold_value=100.0,
+            deviation_value=50.0,
+            deviation_percent=50.0,
+            threshold_snapshot={"type": "absolute", "min": 100},
+        )
+        test_db.commit()
+
+        deleted = repo.delete_results_before(today - timedelta(days=365))
+        test_db.commit()
+        test_db.expire_all()
+
+        assert deleted == 1
+        assert repo.get_result(expectation.id, today - timedelta(days=400)) is None
+        assert repo.get_result(expectation.id, old_breached.snapshot_date) is not None
+        assert repo.get_result(expectation.id, recent.snapshot_date) is not None
+
     # =========================================================================
     # Breach Tests
     # =========================================================================
@@ -333,6 +444,32 @@ class TestDQRepository:
         assert breach.status == "open"
         assert breach.breach_direction == "low"
         assert breach.deviation_percent == 50.0
+        assert breach.detected_at is not None
+        assert result.created_at is not None
+
+    def test_recent_open_breaches_avoid_sort(self, test_db: Session):
+        """Test that recent breaches by status are read in index order."""
+        plan = test_db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM dq_breaches "
+                "WHERE status = 'open' ORDER BY detected_at DESC LIMIT 10"
+            )
+        ).all()
+        details = " ".join(row[-1] for row in plan)
+
+        assert "USING INDEX ix_dq_breaches_status_detected" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_open_breach_counts_use_partial_index(self, test_db: Session):
+        """Test that per-expectation open counts read the open-only index."""
+        plan = test_db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT count(id) FROM dq_breaches "
+                "WHERE expectation_id = 1 AND status = 'open'"
+            )
+        ).all()
+
+        assert "INDEX ix_dq_breaches_open_expectation" in " ".join(row[-1] for row in plan)
 
     def test_update_breach_status(
         self, test_db: Session, catalog_object: CatalogObject
@@ -378,6 +515,35 @@ class TestDQRepository:
         assert updated.lifecycle_events[0]["by"] == "test_user"
         assert updated.lifecycle_events[0]["notes"] == "Looking into it"
 
+    def test_update_breach_status_archives_old_events(
+        self, test_db: Session, catalog_object: CatalogObject
+    ):
+        """Test that lifecycle events beyond the inline cap are archived."""
+        repo = DQRepository(test_db)
+
+        config = repo.create_config(object_id=catalog_object.id)
+        expectation = repo.create_expectation(config.id, "row_count", {})
+        result = repo.record_result(expectation.id, date.today(), 50.0)
+        breach = repo.create_breach(
+            expectation.id, result.id, date.today(), 50.0, "low", 100.0, 50.0, 50.0, {}
+        )
+        test_db.commit()
+
+        total = MAX_LIFECYCLE_EVENTS + 3
+        for i in range(total):
+            status = "acknowledged" if i % 2 == 0 else "open"
+            repo.update_breach_status(breach.id, status, notes=f"event {i}")
+        test_db.commit()
+
+        assert len(breach.lifecycle_events) == MAX_LIFECYCLE_EVENTS
+        assert breach.lifecycle_events[0]["notes"] == "event 3"
+        assert breach.lifecycle_events[-1]["notes"] == f"event {total - 1}"
+
+        archived = repo.get_archived_events(breach.id)
+        assert [event.notes for event in archived] == ["event 0", "event 1", "event 2"]
+        assert archived[0].status == "acknowledged"
+        assert archived[0].changed_at is not None
+
     def test_list_breaches_with_filters(
         self, test_db: Session, source: DataSource
     ):
@@ -458,28 +624,62 @@ class TestDQRepository:
         assert total == 2
         assert enabled == 1
 
-    def test_count_breaches_by_status(
+    def test_count_breaches_by_status_and_priority(
         self, test_db: Session, catalog_object: CatalogObject
     ):
-        """Test counting breaches by status."""
+        """Test counting breaches grouped by status and priority together."""
         repo = DQRepository(test_db)
 
         config = repo.create_config(catalog_object.id)
-        exp = repo.create_expectation(config.id, "row_count", {})
+        high = repo.create_expectation(config.id, "row_count", {}, priority="high")
+        low = repo.create_expectation(config.id, "null_count", {}, column_name="id", priority="low")
+
+        for i, (exp, status) in enumerate(
+            [(high, "open"), (high, "open"), (high, "resolved"), (low, "open")]
+        ):
+            snapshot = date.today() - timedelta(days=i)
+            result = repo.record_result(exp.id, snapshot, 100)
+            breach = repo.create_breach(
+                exp.id, result.id, snapshot, 100, "high", 50, 50, 100, {}
+            )
+            if status != "open":
+                repo.update_breach_status(breach.id, status)
+        test_db.commit()
+
+        counts = repo.count_breaches_by_status_and_priority()
+
+        assert counts == {("open", "high"): 2, ("resolved", "high"): 1, ("open", "low"): 1}
+
+    def test_get_counts_for_configs(
+        self, test_db: Session, source: DataSource
+    ):
+        """Test batched expectation and open breach counts per config."""
+        repo = DQRepository(test_db)
+        obj_repo = CatalogObjectRepository(test_db)
+
+        obj1, _ = obj_repo.upsert(source.id, "core", "table1", "TABLE")
+        obj2, _ = obj_repo.upsert(source.id, "core", "table2", "TABLE")
+        obj3, _ = obj_repo.upsert(source.id, "core", "table3", "TABLE")
+        test_db.commit()
+
+        config1 = repo.create_config(obj1.id)
+        config2 = repo.create_config(obj2.id)
+        config3 = repo.create_config(obj3.id)
+        exp1 = repo.create_expectation(config1.id, "row_count", {})
+        repo.create_expectation(config1.id, "null_count", {}, column_name="id")
+        repo.create_expectation(config2.id, "row_count", {})
 
-        # Create breaches with different statuses
-        for i, status in enumerate(["open", "open", "acknowledged", "resolved"]):
-            result = repo.record_result(exp.id, date.today() - timedelta(days=i), 100)
+        for i, status in enumerate(["open", "open", "resolved"]):
+            result = repo.record_result(exp1.id, date.today() - timedelta(days=i), 100)
             breach = repo.create_breach(
-                exp.id, result.id, date.today() - timedelta(days=i),
+                exp1.id, result.id, date.today() - timedelta(days=i),
                 100, "high", 50, 50, 100, {}
             )
             if status != "open":
                 repo.update_breach_status(breach.id, status)
         test_db.commit()
 
-        counts = repo.count_breaches_by_status()
+        counts = repo.get_counts_for_configs([config1.id, config2.id, config3.id])
 
-        assert counts.get("open", 0) == 2
-        assert counts.get("acknowledged", 0) == 1
-        assert counts.get("resolved", 0) == 1
+        assert counts == {config1.id: (2, 2), config2.id: (1, 0)}
+        assert repo.get_counts_for_configs([]) == {}
@@ -0,0 +1,247 @@
+"""Tests for SchedulingRepository."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
+
+from datacompass.core.models.scheduling import NotificationLog
+from datacompass.core.repositories.scheduling import (
+    NotificationRepository,
+    SchedulingRepository,
+)
+
+
+class TestSchedulingRepository:
+    """Test cases for SchedulingRepository."""
+
+    @pytest.fixture
+    def repo(self, test_db: Session) -> SchedulingRepository:
+        """Create a scheduling repository."""
+        return SchedulingRepository(test_db)
+
+    # =========================================================================
+    # Dispatch Query Tests
+    # =========================================================================
+
+    def test_get_due_schedules(self, test_db: Session, repo: SchedulingRepository):
+        """Test that only enabled, due schedules of the job type are returned."""
+        now = datetime(2026, 10, 18, 12, 0)
+
+        due = repo.create_schedule(name="due", job_type="scan", cron_expression="0 * * * *")
+        due.next_run_at = now - timedelta(minutes=5)
+
+        earlier = repo.create_schedule(
+            name="earlier", job_type="scan", cron_expression="0 * * * *"
+        )
+        earlier.next_run_at = now - timedelta(hours=1)
+
+        future = repo.create_schedule(name="future", job_type="scan", cron_expression="0 * * * *")
+        future.next_run_at = now + timedelta(minutes=5)
+
+        disabled = repo.create_schedule(
+            name="disabled", job_type="scan", cron_expression="0 * * * *"
+        )
+        disabled.next_run_at = now - timedelta(minutes=5)
+        disabled.is_enabled = False
+
+        other_type = repo.create_schedule(
+            name="other", job_type="dq_run", cron_expression="0 * * * *"
+        )
+        other_type.next_run_at = now - timedelta(minutes=5)
+        test_db.commit()
+
+        schedules = repo.get_due_schedules("scan", due_at=now)
+
+        assert [s.name for s in schedules] == ["earlier", "due"]
+
+    def test_get_due_schedules_uses_dispatch_index(
+        self, test_db: Session, repo: SchedulingRepository
+    ):
+        """Test that the dispatch query is served by ix_schedules_dispatch."""
+        stmt = repo._due_schedules_stmt("scan", datetime(2026, 10, 18))
+        sql = stmt.compile(test_db.get_bind(), compile_kwargs={"literal_binds": True})
+        plan = test_db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+
+        details = " ".join(row[-1] for row in plan)
+        assert "USING INDEX ix_schedules_dispatch" in details
+
+    def test_get_hub_counts_single_query(
+        self, test_db: Session, repo: SchedulingRepository, count_queries
+    ):
+        """Test that all hub counts come back from one statement."""
+        notifications = NotificationRepository(test_db)
+        repo.create_schedule(name="a", job_type="scan", cron_expression="0 6 * * *")
+        disabled = repo.create_schedule(name="b", job_type="scan", cron_expression="0 7 * * *")
+        disabled.is_enabled = False
+        channel = notifications.create_channel(name="alerts", channel_type="slack", config={})
+        notifications.create_rule(name="r", event_type="dq_breach", channel_id=channel.id)
+        test_db.commit()
+
+        with count_queries() as statements:
+            counts = repo.get_hub_counts()
+
+        assert len(statements) == 1
+        assert counts == {
+            "total_schedules": 2,
+            "enabled_schedules": 1,
+            "total_channels": 1,
+            "enabled_channels": 1,
+            "total_rules": 1,
+            "enabled_rules": 1,
+        }
+
+    def test_repr_does_not_refresh_expired_instance(
+        self, test_db: Session, repo: SchedulingRepository
+    ):
+        """Test that repr of an expired, detached schedule issues no query."""
+        schedule = repo.create_schedule(name="nightly", job_type="scan", cron_expression="0 2 * * *")
+        test_db.commit()
+        test_db.expunge(schedule)
+
+        assert repr(schedule) == "<Schedule(id=<unloaded>, name=<unloaded>, job_type=<unloaded>)>"
+
+    # =========================================================================
+    # Run History Tests
+    # =========================================================================
+
+    def test_get_with_runs_limits_without_deleting(
+        self, test_db: Session, repo: SchedulingRepository
+    ):
+        """Test that loading recent runs keeps the rest of the run history."""
+        schedule = repo.create_schedule(name="nightly", job_type="scan", cron_expression="0 2 * * *")
+        start = datetime(2026, 10, 1, 2, 0)
+        for day in range(15):
+            repo.create_run(schedule.id, started_at=start + timedelta(days=day))
+        test_db.commit()
+        schedule_id = schedule.id
+        test_db.expunge_all()
+
+        loaded = repo.get_with_runs(schedule_id, run_limit=10)
+        assert [r.started_at.day for r in loaded.runs] == list(range(15, 5, -1))
+
+        test_db.commit()
+        assert len(repo.get_runs_for_schedule(schedule_id)) == 15
+
+    def test_rule_loads_channel_in_same_query(self, test_db: Session, count_queries):
+        """Test that a rule fetched by ID brings its channel without a second query."""
+        repo = NotificationRepository(test_db)
+        channel = repo.create_channel(name="alerts", channel_type="slack", config={})
+        rule = repo.create_rule(name="breaches", event_type="dq_breach", channel_id=channel.id)
+        test_db.commit()
+        rule_id = rule.id
+        test_db.expunge_all()
+
+        with count_queries() as statements:
+            loaded = repo.get_rule(rule_id)
+            channel_name = loaded.channel.name
+
+        assert channel_name == "alerts"
+        assert len(statements) == 1
+
+    def test_rules_for_event_use_event_index(self, test_db: Session):
+        """Test that rule matching for an event is served by an index."""
+        plan = test_db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM notification_rules "
+                "WHERE event_type = 'dq_breach' AND is_enabled = 1"
+            )
+        ).all()
+
+        details = " ".join(row[-1] for row in plan)
+        assert "USING INDEX ix_notification_rules_event_enabled" in details
+
+    def test_get_recent_runs_returns_rows(
+        self, test_db: Session, repo: SchedulingRepository
+    ):
+        """Test that recent runs come back as column rows, newest first."""
+        schedule = repo.create_schedule(name="hourly", job_type="scan", cron_expression="0 * * * *")
+        repo.create_run(schedule.id, started_at=datetime(2026, 10, 1))
+        newer = repo.create_run(schedule.id, started_at=datetime(2026, 10, 2))
+        test_db.commit()
+        newer_id, schedule_id = newer.id, schedule.id
+        test_db.expunge_all()
+
+        rows = repo.get_recent_runs(limit=1)
+
+        assert [row.id for row in rows] == [newer_id]
+        assert rows[0].schedule_id == schedule_id
+        assert len(test_db.identity_map) == 0
+
+    def test_delete_runs_before(self, test_db: Session, repo: SchedulingRepository):
+        """Test that runs are pruned by start time."""
+        schedule = repo.create_schedule(name="hourly", job_type="scan", cron_expression="0 * * * *")
+        cutoff = datetime(2026, 10, 1)
+        repo.create_run(schedule.id, started_at=cutoff - timedelta(days=1))
+        kept = repo.create_run(schedule.id, started_at=cutoff)
+        test_db.commit()
+
+        assert kept.created_at is not None
+        assert repo.delete_runs_before(cutoff) == 1
+        test_db.commit()
+        assert [r.id for r in repo.get_runs_for_schedule(schedule.id)] == [kept.id]
+
+    def test_create_log_entries(self, test_db: Session, count_queries):
+        """Test that a batch of log entries is written with a single INSERT."""
+        repo = NotificationRepository(test_db)
+        rows = [
+            {"event_type": "dq_breach", "event_payload": {"n": i}, "status": "sent"}
+            for i in range(3)
+        ]
+
+        with count_queries() as statements:
+            entries = repo.create_log_entries(rows)
+        test_db.commit()
+
+        assert len(statements) == 1
+        assert [e.event_payload["n"] for e in entries] == [0, 1, 2]
+        assert all(e.sent_at is not None for e in entries)
+        assert repo.create_log_entries([]) == []
+
+    def test_delete_logs_before(self, test_db: Session):
+        """Test that notification log entries are pruned by send time."""
+        repo = NotificationRepository(test_db)
+        cutoff = datetime(2026, 10, 1)
+        old = repo.create_log_entry(event_type="dq_breach", event_payload={}, status="sent")
+        old.sent_at = cutoff - timedelta(days=1)
+        recent = repo.create_log_entry(event_type="dq_breach", event_payload={}, status="sent")
+        recent.sent_at = cutoff
+        test_db.commit()
+
+        assert repo.delete_logs_before(cutoff) == 1
+        test_db.commit()
+        assert [log.id for log in repo.list_log_entries()] == [recent.id]
+
+    def test_recent_logs_use_sent_at_index(self, test_db: Session):
+        """Test that newest-first log listings avoid a full sort."""
+        plan = test_db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM notification_log "
+                "ORDER BY sent_at DESC, id DESC LIMIT 10"
+            )
+        ).all()
+
+        details = " ".join(row[-1] for row in plan)
+        assert "ix_notification_log_sent_at" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_rule_delete_finds_log_rows_by_index(self, test_db: Session):
+        """Test that clearing a deleted rule's log references uses an index."""
+        plan = test_db.execute(
+            text("EXPLAIN QUERY PLAN UPDATE notification_log SET rule_id = NULL WHERE rule_id = 1")
+        ).all()
+
+        details = " ".join(row[-1] for row in plan)
+        assert "ix_notification_log_rule_id" in details
+
+    def test_sent_at_index_covers_status_on_postgresql(self):
+        """Test that the status counts can be served index-only on PostgreSQL."""
+        index = next(
+            i for i in NotificationLog.__table__.indexes if i.name == "ix_notification_log_sent_at"
+        )
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+        assert "INCLUDE (status)" in ddl
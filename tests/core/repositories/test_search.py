@@ -189,3 +189,14 @@ class TestSearchRepository:
         # Should no longer be found
         results = repo.search("orders")
         assert len(results) == 0
+
+    def test_optimize_after_repeated_reindex(self, test_db: Session, source: DataSource, objects: list[CatalogObject]):
+        """Test that the index stays searchable after rescans and optimize."""
+        repo = SearchRepository(test_db)
+        for _ in range(3):
+            repo.reindex_all(source_id=source.id)
+        repo.optimize()
+        test_db.commit()
+
+        results = repo.search("orders")
+        assert len(results) == 1
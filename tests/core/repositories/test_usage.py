@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from datacompass.core.models import CatalogObject, DataSource
@@ -89,6 +90,47 @@ class TestUsageRepository:
         assert metric.size_bytes is None
         assert metric.read_count is None
 
+    def test_record_metrics_large_counters(
+        self,
+        test_db: Session,
+        catalog_objects: list[CatalogObject],
+        repo: UsageRepository,
+    ):
+        """Test that counters beyond the 32-bit range round-trip."""
+        obj = catalog_objects[0]
+        size = 5 * 1024**4  # 5 TiB
+        reads = 2**31 + 7
+        repo.record_metrics(object_id=obj.id, size_bytes=size, read_count=reads)
+        test_db.commit()
+        test_db.expire_all()
+
+        latest = repo.get_latest(obj.id)
+        assert latest.size_bytes == size
+        assert latest.read_count == reads
+
+    def test_record_metrics_many(
+        self,
+        test_db: Session,
+        catalog_objects: list[CatalogObject],
+        repo: UsageRepository,
+    ):
+        """Test recording a batch of metrics in one call."""
+        rows = [
+            {"object_id": obj.id, "row_count": 10 * (i + 1), "source_metrics": {"i": i}}
+            for i, obj in enumerate(catalog_objects)
+        ]
+        inserted = repo.record_metrics_many(rows)
+        test_db.commit()
+
+        assert inserted == 3
+        assert repo.get_total_metrics_count() == 3
+        latest = repo.get_latest(catalog_objects[2].id)
+        assert latest.row_count == 30
+        assert latest.source_metrics == {"i": 2}
+        assert latest.collected_at is not None
+        assert latest.created_at is not None
+        assert repo.record_metrics_many([]) == 0
+
     def test_record_metrics_with_source_metrics(
         self,
         test_db: Session,
@@ -329,6 +371,19 @@ class TestUsageRepository:
         _, metric = hot_tables[0]
         assert metric.read_count == 100  # Should use latest
 
+    def test_latest_metric_lookup_is_index_only(self, test_db: Session):
+        """Test that finding each object's latest metric never reads table rows."""
+        plan = test_db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT object_id, max(collected_at) FROM usage_metrics "
+                "WHERE collected_at >= :cutoff GROUP BY object_id"
+            ),
+            {"cutoff": datetime(2026, 10, 1)},
+        ).all()
+
+        details = " ".join(row[-1] for row in plan)
+        assert "COVERING INDEX ix_usage_metrics_object_collected" in details
+
     # =========================================================================
     # Count Tests
     # =========================================================================
@@ -5,9 +5,10 @@ from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from datacompass.core.models.auth import UserCreate
+from datacompass.core.models.auth import RefreshToken, UserCreate
 from datacompass.core.services.auth_service import (
     APIKeyNotFoundError,
     AuthDisabledError,
@@ -163,6 +164,34 @@ class TestUserManagement:
 
         assert user.is_active is False
 
+    def test_deactivate_and_schedule_purge(self, test_db: Session, auth_enabled):
+        """Test that deactivation defers credential cleanup to the purge."""
+        service = AuthService(test_db)
+
+        def token_count(user_id: int) -> int:
+            stmt = select(func.count()).where(RefreshToken.user_id == user_id)
+            return test_db.scalar(stmt)
+
+        service.create_local_user(UserCreate(email="purge@example.com", password="pass"))
+        service.create_local_user(UserCreate(email="keep@example.com", password="pass"))
+        test_db.commit()
+        service.authenticate("purge@example.com", "pass")
+        service.authenticate("keep@example.com", "pass")
+        test_db.commit()
+
+        user = service.deactivate_and_schedule_purge("purge@example.com")
+        test_db.commit()
+
+        assert user.is_active is False
+        assert token_count(user.id) == 1
+
+        deleted = service.purge_inactive_user_credentials(batch_size=1)
+        test_db.commit()
+
+        assert deleted == 1
+        assert token_count(user.id) == 0
+        assert token_count(service.get_user_by_email("keep@example.com").id) == 1
+
     def test_enable_user(self, test_db: Session, auth_enabled):
         """Test enabling a user."""
         service = AuthService(test_db)
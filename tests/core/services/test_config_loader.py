@@ -129,6 +129,16 @@ password: ${DB_PASSWORD}
 
         assert "Invalid YAML" in str(exc_info.value)
 
+    def test_load_rejects_python_tags(self, tmp_path: Path):
+        """Test that the loader stays safe and refuses arbitrary object tags."""
+        config_file = tmp_path / "unsafe.yaml"
+        config_file.write_text("value: !!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(ConfigLoadError) as exc_info:
+            load_yaml_config(config_file)
+
+        assert "Invalid YAML" in str(exc_info.value)
+
     def test_load_empty_yaml(self, tmp_path: Path):
         """Test loading empty YAML raises error."""
         config_file = tmp_path / "empty.yaml"
@@ -130,6 +130,30 @@ class TestDeprecationService:
         assert len(campaigns) == 2
         assert campaigns[0].days_remaining is not None
 
+    def test_days_remaining(
+        self, test_db: Session, source: DataSource, service: DeprecationService
+    ):
+        """Test days_remaining is populated and cleared for completed campaigns."""
+        today = date.today()
+        upcoming = service.create_campaign(
+            source_id=source.id,
+            name="Upcoming",
+            target_date=today + timedelta(days=10),
+        )
+        done = service.create_campaign(
+            source_id=source.id,
+            name="Done",
+            target_date=today + timedelta(days=3),
+        )
+        service.update_campaign(done.id, status="completed")
+        test_db.commit()
+
+        by_name = {c.name: c for c in service.list_campaigns()}
+        assert by_name["Upcoming"].days_remaining == 10
+        assert by_name["Done"].days_remaining is None
+        assert service.get_campaign(upcoming.id).days_remaining == 10
+        assert service.get_campaign(upcoming.id).model_dump()["days_remaining"] == 10
+
     def test_update_campaign(
         self, test_db: Session, source: DataSource, service: DeprecationService
     ):
@@ -358,6 +382,8 @@ class TestDeprecationService:
         assert impact.impacts[0].downstream_count == 1
         assert len(impact.impacts[0].impacted_objects) == 1
         assert impact.impacts[0].impacted_objects[0].object_name == "downstream_view"
+        impacted = impact.model_dump()["impacts"][0]["impacted_objects"][0]
+        assert impacted["full_name"] == "demo.analytics.downstream_view"
 
     # =========================================================================
     # Hub Summary Tests
@@ -396,3 +422,8 @@ class TestDeprecationService:
         assert summary.active_campaigns == 1
         assert summary.total_deprecated_objects == 2
         assert len(summary.upcoming_deadlines) >= 1
+        deadlines = {
+            d["name"]: d for d in summary.model_dump(mode="json")["upcoming_deadlines"]
+        }
+        assert deadlines["Active"]["days_remaining"] == 5
+        assert deadlines["Active"]["object_count"] == 1
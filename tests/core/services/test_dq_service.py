@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 from sqlalchemy.orm import Session
 
+from datacompass.core.events import get_event_bus, reset_event_bus
 from datacompass.core.models import CatalogObject, DataSource
 from datacompass.core.repositories import CatalogObjectRepository, DataSourceRepository
 from datacompass.core.repositories.dq import DQRepository
@@ -343,6 +344,36 @@ class TestDQService:
 
         breaches = service.list_breaches(status="open")
         assert len(breaches) >= 1
+        # A zero threshold reports any deviation as 100%
+        assert breaches[0].deviation_percent == 100.0
+
+    def test_run_expectations_emits_breaches_as_one_batch(
+        self, test_db: Session, catalog_object: CatalogObject
+    ):
+        """Test that all breaches of a run reach batch handlers in one call."""
+        service = DQService(test_db)
+        config = service.create_config(object_id=catalog_object.id)
+        for exp_type in ("row_count", "sum"):
+            service.create_expectation(
+                config_id=config.id,
+                expectation_type=exp_type,
+                threshold_config={"type": "absolute", "max": 0},
+            )
+        test_db.commit()
+
+        batches = []
+        reset_event_bus()
+        get_event_bus().subscribe_batches(batches.append)
+        try:
+            result = service.run_expectations(config.id)
+        finally:
+            reset_event_bus()
+
+        assert len(batches) == 1
+        assert [e.payload["breach_id"] for e in batches[0]] == [
+            r.breach_id for r in result.results
+        ]
+        assert {e.payload["expectation_type"] for e in batches[0]} == {"row_count", "sum"}
 
     # =========================================================================
     # Breach Management Tests
@@ -376,6 +407,35 @@ class TestDQService:
         assert detail.object_name == "orders"
         assert detail.priority == "high"
 
+    def test_get_breach_includes_archived_events(
+        self, test_db: Session, catalog_object: CatalogObject, monkeypatch
+    ):
+        """Test that breach details list archived lifecycle events first."""
+        monkeypatch.setattr("datacompass.core.repositories.dq.MAX_LIFECYCLE_EVENTS", 2)
+        service = DQService(test_db)
+        repo = DQRepository(test_db)
+
+        config = repo.create_config(object_id=catalog_object.id)
+        exp = repo.create_expectation(config.id, "row_count", {})
+        result = repo.record_result(exp.id, date.today(), 100)
+        breach = repo.create_breach(
+            exp.id, result.id, date.today(),
+            100, "high", 50, 50, 100, {},
+        )
+        for i in range(4):
+            repo.update_breach_status(breach.id, "acknowledged", notes=f"event {i}")
+        test_db.commit()
+
+        detail = service.get_breach(breach.id)
+
+        assert [event.notes for event in detail.lifecycle_events] == [
+            "event 0",
+            "event 1",
+            "event 2",
+            "event 3",
+        ]
+        assert len(service.list_breaches()[0].lifecycle_events) == 2
+
     def test_get_breach_not_found(self, test_db: Session):
         """Test getting non-existent breach raises error."""
         service = DQService(test_db)
@@ -409,7 +469,8 @@ class TestDQService:
 
         assert updated.status == "acknowledged"
         assert len(updated.lifecycle_events) == 1
-        assert updated.lifecycle_events[0]["notes"] == "Investigating the issue"
+        assert updated.lifecycle_events[0].notes == "Investigating the issue"
+        assert updated.lifecycle_events[0].by == "test_user"
 
     def test_list_breaches(
         self, test_db: Session, catalog_object: CatalogObject
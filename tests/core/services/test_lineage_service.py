@@ -9,7 +9,7 @@ from datacompass.core.repositories import (
     DataSourceRepository,
     DependencyRepository,
 )
-from datacompass.core.services import ObjectNotFoundError
+from datacompass.core.services import ObjectNotFoundError, lineage_service
 from datacompass.core.services.lineage_service import LineageService
 
 
@@ -242,6 +242,40 @@ class TestLineageService:
         edge_keys = [(e.from_id, e.to_id) for e in graph.edges]
         assert len(edge_keys) == len(set(edge_keys))
 
+    def test_get_lineage_external_no_duplicates(
+        self,
+        test_db: Session,
+        source: DataSource,
+        objects: dict[str, CatalogObject],
+        dependencies,
+    ):
+        """Test that a shared external reference yields one node and one edge per object."""
+        repo = DependencyRepository(test_db)
+        external = {"schema": "vendor", "name": "feed", "type": "TABLE"}
+        for obj_name, parsing_source in [
+            ("orders", "source_metadata"),
+            ("orders", "sql_parsing"),
+            ("users", "source_metadata"),
+        ]:
+            repo.upsert(
+                source.id,
+                objects[obj_name].id,
+                None,
+                "DIRECT",
+                parsing_source,
+                target_external=external,
+            )
+        test_db.commit()
+
+        service = LineageService(test_db)
+        graph = service.get_lineage(objects["order_summary"].id, direction="upstream", depth=2)
+
+        assert [(e.schema_name, e.object_name) for e in graph.external_nodes] == [
+            ("vendor", "feed")
+        ]
+        external_edges = sorted(e.from_id for e in graph.edges if e.to_external is not None)
+        assert external_edges == sorted([objects["orders"].id, objects["users"].id])
+
     def test_get_lineage_truncated(
         self,
         test_db: Session,
@@ -406,3 +440,48 @@ class TestLineageService:
             objects["users"].id, objects["orders"].id, "manual"
         )
         assert dep is None
+
+    def test_get_lineage_is_cached(
+        self,
+        test_db: Session,
+        source: DataSource,
+        objects: dict[str, CatalogObject],
+        dependencies,
+        count_queries,
+    ):
+        """Test that repeated lineage requests are served without queries."""
+        service = LineageService(test_db)
+        root_id = objects["daily_report"].id
+        first = service.get_lineage(root_id, direction="upstream", depth=3)
+
+        with count_queries() as statements:
+            second = service.get_lineage(root_id, direction="upstream", depth=3)
+
+        assert second is first
+        assert statements == []
+
+    def test_get_lineage_cache_invalidated_by_writes(
+        self,
+        test_db: Session,
+        source: DataSource,
+        objects: dict[str, CatalogObject],
+        dependencies,
+    ):
+        """Test that dependency writes and rollbacks invalidate cached graphs."""
+        service = LineageService(test_db)
+        root_id = objects["raw_events"].id
+        before = service.get_lineage(root_id, direction="downstream", depth=1)
+        assert {n.object_name for n in before.nodes} == {"orders"}
+
+        DependencyRepository(test_db).upsert(
+            source.id, objects["users"].id, root_id, "DIRECT", "manual"
+        )
+        test_db.flush()
+        during = service.get_lineage(root_id, direction="downstream", depth=1)
+        assert {n.object_name for n in during.nodes} == {"orders", "users"}
+        # Built from uncommitted rows, so it must not reach other sessions
+        assert all(graph is not during for _, graph in lineage_service._lineage_cache.values())
+
+        test_db.rollback()
+        after = service.get_lineage(root_id, direction="downstream", depth=1)
+        assert {n.object_name for n in after.nodes} == {"orders"}
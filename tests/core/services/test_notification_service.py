@@ -1,14 +1,22 @@
 """Tests for NotificationService."""
 
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import pytest
 from sqlalchemy.orm import Session
 
 from datacompass.core.events import DQBreachEvent, ScanCompletedEvent, get_event_bus, reset_event_bus
+from datacompass.core.notifications import BaseNotificationHandler, NotificationResult
 from datacompass.core.services.notification_service import (
+    CIRCUIT_OPEN_MESSAGE,
     ChannelExistsError,
     ChannelNotFoundError,
     NotificationService,
     RuleNotFoundError,
+    channel_breakers,
+    recent_deliveries,
 )
 
 
@@ -17,10 +25,14 @@ class TestNotificationService:
 
     @pytest.fixture(autouse=True)
     def reset_events(self):
-        """Reset event bus before each test."""
+        """Reset event bus, delivery history and circuits before each test."""
         reset_event_bus()
+        recent_deliveries.clear()
+        channel_breakers.clear()
         yield
         reset_event_bus()
+        recent_deliveries.clear()
+        channel_breakers.clear()
 
     @pytest.fixture
     def service(self, test_db: Session) -> NotificationService:
@@ -436,6 +448,350 @@ class TestNotificationService:
         log = service.get_notification_log()
         assert len(log) == 0
 
+    def test_handle_event_sends_concurrently(
+        self, test_db: Session, service: NotificationService
+    ):
+        """Test that deliveries for one event overlap and are logged in rule order."""
+        channels = [
+            service.create_channel(name=f"test-{i}", channel_type="webhook", config={})
+            for i in range(2)
+        ]
+        rules = [
+            service.create_rule(name=f"rule-{i}", event_type="scan_completed", channel_id=channel.id)
+            for i, channel in enumerate(channels)
+        ]
+        test_db.commit()
+
+        # Each send waits for the other, so a serial dispatcher would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        class WaitingHandler(BaseNotificationHandler):
+            def send(self, event, template_override=None):
+                barrier.wait()
+                return NotificationResult.ok()
+
+            def test_connection(self, deep=True):
+                return NotificationResult.ok()
+
+        event = ScanCompletedEvent.create(
+            source_name="demo",
+            source_id=1,
+            objects_discovered=1,
+            objects_updated=0,
+            objects_deleted=0,
+            columns_discovered=1,
+            duration_seconds=1.0,
+        )
+        with patch(
+            "datacompass.core.services.notification_service.get_handler_for_channel",
+            return_value=WaitingHandler({}),
+        ):
+            logs = service.handle_event(event)
+
+        assert [log.rule_id for log in logs] == [rule.id for rule in rules]
+        assert all(log.status == "sent" for log in logs)
+
+    def test_handle_event_suppresses_duplicates(
+        self, test_db: Session, service: NotificationService
+    ):
+        """Test that a re-fired event is not sent to the same channel again."""
+        channel = service.create_channel(name="test", channel_type="webhook", config={})
+        service.create_rule(name="scan-rule", event_type="scan_completed", channel_id=channel.id)
+        test_db.commit()
+
+        def scan_event(objects_discovered: int) -> ScanCompletedEvent:
+            return ScanCompletedEvent.create(
+                source_name="demo",
+                source_id=1,
+                objects_discovered=objects_discovered,
+                objects_updated=0,
+                objects_deleted=0,
+                columns_discovered=1,
+                duration_seconds=1.0,
+            )
+
+        handler = MagicMock()
+        handler.send.return_value = NotificationResult.ok()
+        with patch(
+            "datacompass.core.services.notification_service.get_handler_for_channel",
+            return_value=handler,
+        ):
+            first = service.handle_event(scan_event(1))
+            repeat = service.handle_event(scan_event(1))
+            changed = service.handle_event(scan_event(2))
+
+        assert [log.status for log in first + repeat + changed] == [
+            "sent",
+            "rate_limited",
+            "sent",
+        ]
+        assert handler.send.call_count == 2
+
+    def test_handle_event_sends_once_per_channel(
+        self, test_db: Session, service: NotificationService
+    ):
+        """Test that two rules on one channel deliver an event only once."""
+        channel = service.create_channel(name="test", channel_type="webhook", config={})
+        first_rule = service.create_rule(
+            name="scan-rule", event_type="scan_completed", channel_id=channel.id
+        )
+        service.create_rule(name="scan-rule-2", event_type="scan_completed", channel_id=channel.id)
+        test_db.commit()
+
+        handler = MagicMock()
+        handler.send.return_value = NotificationResult.ok()
+        with patch(
+            "datacompass.core.services.notification_service.get_handler_for_channel",
+            return_value=handler,
+        ):
+            logs = service.handle_event(
+                ScanCompletedEvent.create(
+                    source_name="demo",
+                    source_id=1,
+                    objects_discovered=1,
+                    objects_updated=0,
+                    objects_deleted=0,
+                    columns_discovered=1,
+                    duration_seconds=1.0,
+                )
+            )
+
+        assert handler.send.call_count == 1
+        statuses = {log.rule_id: log.status for log in logs}
+        assert statuses[first_rule.id] == "sent"
+        assert sorted(statuses.values()) == ["rate_limited", "sent"]
+
+    def test_failing_channel_circuit_opens(
+        self, test_db: Session, service: NotificationService
+    ):
+        """Test that a channel is skipped after repeated failures until the cooldown ends."""
+        channel = service.create_channel(
+            name="test",
+            channel_type="webhook",
+            config={"circuit_failure_threshold": 2, "circuit_cooldown_seconds": 60},
+        )
+        service.create_rule(name="scan-rule", event_type="scan_completed", channel_id=channel.id)
+        test_db.commit()
+
+        def scan_event(objects_discovered: int) -> ScanCompletedEvent:
+            return ScanCompletedEvent.create(
+                source_name="demo",
+                source_id=1,
+                objects_discovered=objects_discovered,
+                objects_updated=0,
+                objects_deleted=0,
+                columns_discovered=1,
+                duration_seconds=1.0,
+            )
+
+        handler = MagicMock()
+        handler.send.return_value = NotificationResult.fail("timed out")
+        with (
+            patch(
+                "datacompass.core.services.notification_service.get_handler_for_channel",
+                return_value=handler,
+            ),
+            patch("datacompass.core.services.notification_service.time.monotonic") as clock,
+        ):
+            clock.return_value = 1000.0
+            logs = [service.handle_event(scan_event(i))[0] for i in range(3)]
+            assert handler.send.call_count == 2
+            assert logs[2].error_message == CIRCUIT_OPEN_MESSAGE
+
+            # After the cooldown one probe goes through and its success closes the circuit
+            clock.return_value = 1061.0
+            handler.send.return_value = NotificationResult.ok()
+            assert service.handle_event(scan_event(3))[0].status == "sent"
+            assert not channel_breakers.is_open(channel.id)
+
+        assert handler.send.call_count == 3
+
+    def test_handle_events_sends_one_digest_per_rule(
+        self, test_db: Session, service: NotificationService
+    ):
+        """Test that several events matching a rule go out as a single digest."""
+        channel = service.create_channel(name="test", channel_type="slack", config={})
+        rule = service.create_rule(
+            name="scan-rule", event_type="scan_completed", channel_id=channel.id
+        )
+        test_db.commit()
+
+        sent = []
+
+        class RecordingHandler(BaseNotificationHandler):
+            supports_digest = True
+
+            def send(self, event, template_override=None):
+                sent.append(event)
+                return NotificationResult.ok()
+
+            def test_connection(self, deep=True):
+                return NotificationResult.ok()
+
+        events = [
+            ScanCompletedEvent.create(
+                source_name=name,
+                source_id=1,
+                objects_discovered=1,
+                objects_updated=0,
+                objects_deleted=0,
+                columns_discovered=1,
+                duration_seconds=1.0,
+            )
+            for name in ("alpha", "beta", "alpha")
+        ]
+        with patch(
+            "datacompass.core.services.notification_service.get_handler_for_channel",
+            return_value=RecordingHandler({}),
+        ):
+            logs = service.handle_events(events)
+
+        assert len(sent) == 1
+        assert sent[0].event_type == "digest"
+        assert sent[0].payload["count"] == 2
+        assert "Source: alpha" in sent[0].payload["message"]
+        assert "Source: beta" in sent[0].payload["message"]
+        assert [log.status for log in logs] == ["sent", "sent", "rate_limited"]
+        assert all(log.rule_id == rule.id for log in logs)
+
+    def test_handle_events_sends_webhook_events_separately(
+        self, test_db: Session, service: NotificationService
+    ):
+        """Test that handlers without digest support get one send per event."""
+        channel = service.create_channel(name="test", channel_type="webhook", config={})
+        service.create_rule(name="scan-rule", event_type="scan_completed", channel_id=channel.id)
+        test_db.commit()
+
+        sent = []
+
+        class RecordingHandler(BaseNotificationHandler):
+            def send(self, event, template_override=None):
+                sent.append(event)
+                if event.payload["source_name"] == "beta":
+                    return NotificationResult.fail("HTTP 500")
+                return NotificationResult.ok()
+
+            def test_connection(self, deep=True):
+                return NotificationResult.ok()
+
+        events = [
+            ScanCompletedEvent.create(
+                source_name=name,
+                source_id=1,
+                objects_discovered=1,
+                objects_updated=0,
+                objects_deleted=0,
+                columns_discovered=1,
+                duration_seconds=1.0,
+            )
+            for name in ("alpha", "beta")
+        ]
+        with patch(
+            "datacompass.core.services.notification_service.get_handler_for_channel",
+            return_value=RecordingHandler({}),
+        ):
+            logs = service.handle_events(events)
+
+        assert sorted(sent, key=lambda event: event.payload["source_name"]) == events
+        assert [log.status for log in logs] == ["sent", "failed"]
+        assert logs[1].error_message == "HTTP 500"
+
+    def test_event_bus_batches_become_digests(
+        self, test_db: Session, service: NotificationService
+    ):
+        """Test that events emitted together reach the service as one batch."""
+        channel = service.create_channel(name="test", channel_type="slack", config={})
+        service.create_rule(name="dq-rule", event_type="dq_breach", channel_id=channel.id)
+        test_db.commit()
+        service.register_with_event_bus()
+
+        handler = MagicMock()
+        handler.supports_digest = True
+        handler.send.return_value = NotificationResult.ok()
+        events = [
+            DQBreachEvent.create(
+                breach_id=i,
+                expectation_id=i,
+                object_name="orders",
+                schema_name="core",
+                source_name="demo",
+                expectation_type="row_count",
+                column_name=None,
+                metric_value=0.0,
+                threshold_value=1.0,
+                breach_direction="low",
+                deviation_percent=100.0,
+                priority="high",
+                snapshot_date="2026-10-18",
+            )
+            for i in (1, 2)
+        ]
+        with patch(
+            "datacompass.core.services.notification_service.get_handler_for_channel",
+            return_value=handler,
+        ):
+            get_event_bus().emit_many(events)
+
+        assert handler.send.call_count == 1
+        assert handler.build_digest.call_args.args[0] == events
+
+    # =========================================================================
+    # YAML Configuration Tests
+    # =========================================================================
+
+    def test_apply_from_yaml_batches_inserts(
+        self, test_db: Session, service: NotificationService, tmp_path: Path, count_queries
+    ):
+        """Test that new channels and rules are each created with one INSERT."""
+        existing = service.create_channel(name="ops", channel_type="webhook", config={})
+        test_db.commit()
+
+        yaml_path = tmp_path / "notifications.yaml"
+        yaml_path.write_text(
+            """
+channels:
+  - name: ops
+    type: webhook
+    config: {url: "https://example.com/ops"}
+  - name: slack-a
+    type: slack
+    config: {webhook_url: "https://hooks.slack.com/a"}
+  - name: slack-b
+    type: slack
+    config: {webhook_url: "https://hooks.slack.com/b"}
+rules:
+  - {name: breaches, event: dq_breach, channel: slack-a}
+  - {name: failures, event: scan_failed, channel: slack-b}
+  - {name: ops-breaches, event: dq_breach, channel: ops}
+  - {name: orphan, event: dq_breach, channel: missing}
+"""
+        )
+
+        with count_queries() as statements:
+            summary = service.apply_from_yaml(yaml_path)
+            test_db.flush()
+
+        assert summary == {
+            "channels_created": 2,
+            "channels_updated": 1,
+            "rules_created": 3,
+            "rules_updated": 0,
+        }
+        assert sum(s.startswith("INSERT INTO notification_channels") for s in statements) == 1
+        assert sum(s.startswith("INSERT INTO notification_rules") for s in statements) == 1
+
+        rules = {rule.name: rule for rule in service.list_rules()}
+        assert rules["ops-breaches"].channel_id == existing.id
+        assert rules["breaches"].channel_name == "slack-a"
+        assert "orphan" not in rules
+
+        assert service.apply_from_yaml(yaml_path) == {
+            "channels_created": 0,
+            "channels_updated": 3,
+            "rules_created": 0,
+            "rules_updated": 3,
+        }
+
     # =========================================================================
     # Notification Log Tests
     # =========================================================================
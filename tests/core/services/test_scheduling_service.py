@@ -205,6 +205,66 @@ class TestSchedulingService:
         assert updated.cron_expression == "0 8 * * *"
         assert updated.is_enabled is False
 
+    def test_schedule_mutation_sets_next_run_at(
+        self, test_db: Session, service: SchedulingService
+    ):
+        """Test that next_run_at is recomputed when the cron expression changes."""
+        pytest.importorskip("apscheduler")
+
+        created = service.create_schedule(
+            name="test",
+            job_type="scan",
+            cron_expression="0 6 * * *",
+        )
+        test_db.commit()
+
+        assert created.next_run_at is not None
+        assert (created.next_run_at.hour, created.next_run_at.minute) == (6, 0)
+
+        updated = service.update_schedule(
+            created.id, cron_expression="30 8 * * *", timezone="America/New_York"
+        )
+        test_db.commit()
+
+        assert updated.next_run_at is not None
+        assert updated.next_run_at.minute == 30
+        assert updated.next_run_at.hour in (12, 13)  # 08:30 New York in UTC
+
+    def test_compute_next_run_at_reuses_trigger(self):
+        """Test that next fire times are naive UTC and triggers are cached."""
+        pytest.importorskip("apscheduler")
+        from datetime import UTC, datetime
+
+        from datacompass.core.scheduler.scheduler import (
+            compute_next_run_at,
+            get_cron_trigger,
+        )
+
+        now = datetime(2026, 1, 5, 7, 0, tzinfo=UTC)
+
+        assert compute_next_run_at("0 6 * * *", "UTC", now=now) == datetime(2026, 1, 6, 6, 0)
+        assert compute_next_run_at("0 6 * * *", "Europe/Berlin", now=now) == datetime(
+            2026, 1, 6, 5, 0
+        )
+        assert get_cron_trigger("0 6 * * *", "UTC") is get_cron_trigger("0 6 * * *", "UTC")
+
+    def test_invalid_cron_rejected(self, service: SchedulingService):
+        """Test that malformed cron expressions fail schema and service validation."""
+        pytest.importorskip("apscheduler")
+        from pydantic import ValidationError
+
+        from datacompass.core.models.scheduling import ScheduleCreate, ScheduleUpdate
+        from datacompass.core.services.scheduling_service import SchedulingServiceError
+
+        with pytest.raises(ValidationError, match="expected 5 fields"):
+            ScheduleCreate(name="bad", job_type="scan", cron_expression="0 6 * *")
+        with pytest.raises(ValidationError):
+            ScheduleUpdate(cron_expression="61 * * * *")
+        assert ScheduleUpdate(cron_expression=None).cron_expression is None
+
+        with pytest.raises(SchedulingServiceError, match="Invalid cron expression"):
+            service.create_schedule(name="bad", job_type="scan", cron_expression="0 25 * * *")
+
     def test_update_schedule_not_found(
         self, test_db: Session, service: SchedulingService
     ):
@@ -238,6 +298,33 @@ class TestSchedulingService:
         with pytest.raises(ScheduleNotFoundError):
             service.delete_schedule(9999)
 
+    def test_apply_from_yaml(
+        self, test_db: Session, service: SchedulingService, tmp_path
+    ):
+        """Test that YAML schedules are created in bulk and updated by name."""
+        pytest.importorskip("apscheduler")
+        service.create_schedule(name="nightly", job_type="scan", cron_expression="0 1 * * *")
+        test_db.commit()
+
+        yaml_path = tmp_path / "schedules.yaml"
+        yaml_path.write_text(
+            """
+schedules:
+  - {name: nightly, job_type: scan, cron: "0 2 * * *"}
+  - {name: hourly, job_type: deprecation_check, cron: "0 * * * *"}
+  - {name: weekly, job_type: deprecation_check, cron: "0 3 * * mon"}
+"""
+        )
+
+        summary = service.apply_from_yaml(yaml_path)
+        test_db.commit()
+
+        assert summary == {"schedules_created": 2, "schedules_updated": 1}
+        schedules = {s.name: s for s in service.list_schedules()}
+        assert schedules["nightly"].cron_expression == "0 2 * * *"
+        assert schedules["nightly"].next_run_at.hour == 2
+        assert schedules["weekly"].next_run_at.weekday() == 0
+
     # =========================================================================
     # Hub Summary Tests
     # =========================================================================
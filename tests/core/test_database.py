@@ -0,0 +1,170 @@
+"""Tests for database helpers."""
+
+from unittest.mock import MagicMock
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    create_engine,
+    text,
+)
+
+from datacompass.core import database
+from datacompass.core.database import create_database_engine, find_redundant_indexes
+
+
+class TestCreateDatabaseEngine:
+    """Test cases for create_database_engine."""
+
+    def test_json_columns_are_stored_compactly(self):
+        """Test that JSON values are serialized without separator padding."""
+        metadata = MetaData()
+        events = Table(
+            "events",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("payload", JSON),
+        )
+        engine = create_database_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+
+        payload = [{"status": "open", "by": None}]
+        with engine.begin() as conn:
+            conn.execute(events.insert(), {"id": 1, "payload": payload})
+            raw = conn.execute(text("SELECT payload FROM events")).scalar_one()
+            loaded = conn.execute(events.select()).one().payload
+
+        assert raw == '[{"status":"open","by":null}]'
+        assert loaded == payload
+
+    def test_json_columns_stringify_non_string_keys(self):
+        """Test that integer dict keys round-trip as strings, as with json.dumps."""
+        metadata = MetaData()
+        events = Table(
+            "events",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("payload", JSON),
+        )
+        engine = create_database_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+
+        with engine.begin() as conn:
+            conn.execute(events.insert(), {"id": 1, "payload": {1: "a", "b": [1.5, True]}})
+            loaded = conn.execute(events.select()).one().payload
+
+        assert loaded == {"1": "a", "b": [1.5, True]}
+
+    def test_postgresql_sessions_use_utc(self, monkeypatch):
+        """Test that PostgreSQL connections pin the session time zone to UTC."""
+        captured = {}
+        monkeypatch.setattr(database, "create_engine", lambda _url, **kwargs: captured.update(kwargs))
+
+        create_database_engine("postgresql+psycopg://localhost/datacompass")
+
+        assert captured["connect_args"] == {"options": "-c timezone=utc"}
+
+
+class TestFindRedundantIndexes:
+    """Test cases for find_redundant_indexes."""
+
+    def test_flags_prefix_of_unique_constraint(self):
+        """Test that an index on the leading UNIQUE column is reported."""
+        metadata = MetaData()
+        Table(
+            "results",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("expectation_id", Integer, nullable=False),
+            Column("snapshot_date", String(10), nullable=False),
+            UniqueConstraint("expectation_id", "snapshot_date", name="uq_results"),
+            Index("ix_results_expectation_id", "expectation_id"),
+            Index("ix_results_snapshot_date", "snapshot_date"),
+        )
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+
+        assert find_redundant_indexes(engine) == [
+            ("results", "ix_results_expectation_id", "uq_results"),
+        ]
+
+    def test_ignores_unique_and_non_prefix_indexes(self):
+        """Test that unique indexes and non-leading columns are not reported."""
+        metadata = MetaData()
+        Table(
+            "items",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("a", Integer),
+            Column("b", Integer),
+            Index("ix_items_a_b", "a", "b"),
+            Index("ix_items_b", "b"),
+            Index("ix_items_a_unique", "a", unique=True),
+        )
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+
+        assert find_redundant_indexes(engine) == []
+
+    def test_reports_one_of_identical_indexes(self):
+        """Test that of two identical indexes only the later name is reported."""
+        metadata = MetaData()
+        Table(
+            "items",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("a", Integer),
+            Index("ix_items_a", "a"),
+            Index("ix_items_a_copy", "a"),
+        )
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+
+        assert find_redundant_indexes(engine) == [
+            ("items", "ix_items_a_copy", "ix_items_a"),
+        ]
+
+    def test_ignores_partial_indexes(self):
+        """Test that a partial index on a key prefix is not reported."""
+        metadata = MetaData()
+        Table(
+            "breaches",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("expectation_id", Integer, nullable=False),
+            Column("status", String(20), nullable=False),
+            UniqueConstraint("expectation_id", "id", name="uq_breaches"),
+            Index("ix_breaches_open", "expectation_id", sqlite_where=text("status = 'open'")),
+        )
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+
+        assert find_redundant_indexes(engine) == []
+
+    def test_catalog_schema_has_no_redundant_indexes(self, test_db):
+        """Test that the application schema declares no redundant indexes."""
+        assert find_redundant_indexes(test_db.get_bind()) == []
+
+    def test_expression_indexes_cover_only_leading_columns(self, monkeypatch):
+        """Test that expression columns (reflected as None) end a covering key."""
+        inspector = MagicMock()
+        inspector.get_table_names.return_value = ["items"]
+        inspector.get_indexes.return_value = [
+            {"name": "ix_items_a_lower_b", "column_names": ["a", None], "unique": False},
+            {"name": "ix_items_lower_b", "column_names": [None], "unique": False},
+            {"name": "ix_items_a", "column_names": ["a"], "unique": False},
+            {"name": "ix_items_b", "column_names": ["b"], "unique": False},
+        ]
+        inspector.get_unique_constraints.return_value = []
+        inspector.get_pk_constraint.return_value = {"constrained_columns": ["id"]}
+        monkeypatch.setattr(database, "inspect", lambda _engine: inspector)
+
+        assert find_redundant_indexes(MagicMock()) == [
+            ("items", "ix_items_a", "ix_items_a_lower_b"),
+        ]
@@ -0,0 +1,72 @@
+"""Tests for data-moving migrations.
+
+These run against a real PostgreSQL server, since the migrations they
+cover are PostgreSQL-only. Set DATACOMPASS_TEST_POSTGRES_URL to a
+throwaway database to enable them.
+"""
+
+import importlib.util
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Connection, create_engine, text
+
+POSTGRES_URL = os.environ.get("DATACOMPASS_TEST_POSTGRES_URL")
+
+VERSIONS_DIR = (
+    Path(__file__).parents[2] / "src" / "datacompass" / "core" / "migrations" / "versions"
+)
+
+
+def _load_migration(filename: str) -> ModuleType:
+    """Import a migration script by file name."""
+    path = VERSIONS_DIR / filename
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.skipif(
+    not POSTGRES_URL,
+    reason="PostgreSQL not configured (set DATACOMPASS_TEST_POSTGRES_URL)",
+)
+class TestApiKeyScopesArrayMigration:
+    """Test cases for migration 026 (api_keys.scopes as TEXT[])."""
+
+    @pytest.fixture
+    def connection(self) -> Iterator[Connection]:
+        """Open a transaction with a minimal api_keys table, rolled back afterwards."""
+        engine = create_engine(POSTGRES_URL or "")
+        with engine.connect() as conn:
+            transaction = conn.begin()
+            conn.execute(text("CREATE TEMPORARY TABLE api_keys (id integer, scopes jsonb)"))
+            yield conn
+            transaction.rollback()
+        engine.dispose()
+
+    def test_upgrade_converts_arrays_and_json_null(self, connection: Connection):
+        """Test that JSON null and SQL NULL scopes both become NULL arrays."""
+        connection.execute(
+            text(
+                "INSERT INTO api_keys (id, scopes) VALUES "
+                "(1, '[\"catalog:read\", \"dq:write\"]'), (2, 'null'::jsonb), (3, NULL)"
+            )
+        )
+        migration = _load_migration("20261018_0026_026_api_key_scopes_text_array.py")
+
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.upgrade()
+
+        rows = connection.execute(text("SELECT id, scopes FROM api_keys ORDER BY id")).all()
+        assert [tuple(row) for row in rows] == [
+            (1, ["catalog:read", "dq:write"]),
+            (2, None),
+            (3, None),
+        ]